@@ -0,0 +1,58 @@
+"""Benchmark of the frame pacing of the pygame limiter against the precise sleep/spin limiter
+
+Simulates frames with a few milliseconds of work and reports the mean, 99th percentile and worst deviation
+of the frame interval from the target interval and the standard deviation of the raw delta time.
+Frames, of which the work already ended after the target interval (the work sleep was delayed), are not counted.
+Run from the repository root with: python -m benchmarks.clock_pacing
+"""
+
+# Standard modules
+import random
+import statistics
+
+# Local modules
+from nikocraft.utils import time
+from nikocraft.window.clock import Clock
+
+
+FRAMES = 300
+
+
+def measure(fps: int, precise: bool) -> tuple[float, float, float, float, int]:
+    """Run frames with random work
+
+    Returns the mean, 99th percentile and max pacing error and the delta time jitter in ms and the late frames
+    """
+
+    clock = Clock(fps, precise=precise)
+    errors = []
+    deltas = []
+    late = 0
+    for frame in range(FRAMES):
+        work_late = clock.last_time != 0 and time.bench_time() - clock.last_time > 1 / fps
+        clock.tick()
+        if frame > 10:
+            if work_late:
+                late += 1
+            else:
+                errors.append(clock.pacing_error)
+                deltas.append(clock.delta_time_raw)
+        time.wait(random.uniform(0.2, 0.5) / fps)
+
+    errors.sort()
+    return (statistics.mean(errors) * 1000, errors[int(len(errors) * 0.99) - 1] * 1000, errors[-1] * 1000,
+            statistics.pstdev(deltas) * 1000, late)
+
+
+def main() -> None:
+
+    print(f"{'fps':<6}{'limiter':<10}{'mean error':>12}{'p99 error':>12}{'max error':>12}{'jitter':>10}{'late':>6}")
+    for fps in (60, 144, 240):
+        for precise in (False, True):
+            mean, p99, worst, jitter, late = measure(fps, precise)
+            print(f"{fps:<6}{'precise' if precise else 'pygame':<10}{mean:>9.3f} ms{p99:>9.3f} ms{worst:>9.3f} ms"
+                  f"{jitter:>7.3f} ms{late:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Benchmark of the debug screen with Font.render, the text cache and the glyph atlas
+
+Refreshes the debug screen on every frame with changing timings (only the values of the lines change)
+and after a resize (all lines are drawn again, the labels and static lines are the same).
+Run from the repository root with: python -m benchmarks.debug_screen
+"""
+
+# Standard modules
+import os
+import tempfile
+import timeit
+
+# External modules
+import pygame as pg
+
+# Local modules
+import nikocraft as nc
+
+
+NUMBER = 200
+STATS = ("stat_event_time", "stat_render_time", "stat_update_time", "stat_e_update_time", "stat_l_update_time")
+
+
+def main() -> None:
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    app = nc.App(["benchmark"], log_path=tempfile.mkdtemp())
+    window = nc.Window(app, fps=1000)
+    window._start()
+    window.font.define("default", None)
+    frames = iter(range(10 ** 9))
+
+    def changing(debug: nc.DebugScreen) -> None:
+        frame = next(frames)
+        for i, stat in enumerate(STATS):
+            setattr(window, stat, (frame * 7 + i * 13) % 1000 / 1e5)
+        debug.render()
+
+    def resized(debug: nc.DebugScreen) -> None:
+        debug.canvas = None
+        debug.render()
+
+    print(f"{'refresh':<10}{'renderer':<14}{'ms/frame':>10}")
+    for name, function in (("changing", changing), ("resized", resized)):
+        for renderer, text_cache, glyph_atlas in (("Font.render", False, False), ("TextCache", True, False),
+                                                  ("GlyphAtlas", False, True)):
+            debug = nc.DebugScreen(window, font_name="default", font_system=False, text_cache=text_cache,
+                                   glyph_atlas=glyph_atlas, refresh_rate=0)
+            seconds = min(timeit.repeat(lambda: function(debug), number=NUMBER, repeat=3)) / NUMBER
+            print(f"{name:<10}{renderer:<14}{seconds * 1000:>10.3f}")
+
+    window._stop()
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Micro-benchmark of the mutable vectors against the immutable Vec and Vec3
+
+Reports the allocated bytes per operation (tracemalloc peak of a single operation minus the
+execution overhead) and ns per operation.
+Run from the repository root with: python -m benchmarks.mutable_vector
+"""
+
+# Standard modules
+import timeit
+import tracemalloc
+
+# Local modules
+from nikocraft.window.vector2d import Vec
+from nikocraft.window.vector3d import Vec3
+from nikocraft.window.vector2d_mutable import MVec
+from nikocraft.window.vector3d_mutable import MVec3
+
+
+NUMBER = 200_000
+
+
+def allocated_bytes(statement: str, namespace: dict) -> int:
+    """Get the bytes allocated at the peak of a single execution of a statement"""
+
+    code = compile(statement, "<benchmark>", "exec")
+    exec(code, namespace)
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    exec(code, namespace)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak - before
+
+
+def nanoseconds(statement: str, namespace: dict) -> float:
+    """Get the best time in nanoseconds per execution of a statement"""
+    setup = "\n".join(f"{name} = values[{name!r}]" for name in namespace)
+    return min(timeit.repeat(statement, setup, globals={"values": namespace}, number=NUMBER, repeat=5)) / NUMBER * 1e9
+
+
+def main() -> None:
+
+    cases = [
+        ("Vec:   pos = pos + vel * dt", "pos = pos + vel * dt", {"pos": Vec(1.5, 2.5), "vel": Vec(0.5, 0.25), "dt": 0.016}),
+        ("MVec:  pos += vel * dt", "pos += vel * dt", {"pos": MVec(1.5, 2.5), "vel": MVec(0.5, 0.25), "dt": 0.016}),
+        ("MVec:  pos.add_scaled(vel, dt)", "pos.add_scaled(vel, dt)", {"pos": MVec(1.5, 2.5), "vel": MVec(0.5, 0.25), "dt": 0.016}),
+        ("Vec:   vel = vel * 0.99", "vel = vel * 0.99", {"vel": Vec(0.5, 0.25)}),
+        ("MVec:  vel *= 0.99", "vel *= 0.99", {"vel": MVec(0.5, 0.25)}),
+        ("Vec3:  pos = pos + vel * dt", "pos = pos + vel * dt", {"pos": Vec3(1.5, 2.5, 3.5), "vel": Vec3(0.5, 0.25, 0.125), "dt": 0.016}),
+        ("MVec3: pos += vel * dt", "pos += vel * dt", {"pos": MVec3(1.5, 2.5, 3.5), "vel": MVec3(0.5, 0.25, 0.125), "dt": 0.016}),
+        ("MVec3: pos.add_scaled(vel, dt)", "pos.add_scaled(vel, dt)", {"pos": MVec3(1.5, 2.5, 3.5), "vel": MVec3(0.5, 0.25, 0.125), "dt": 0.016}),
+    ]
+
+    baseline = allocated_bytes("pass", {})
+    print(f"{'operation':<34}{'bytes/op':>10}{'ns/op':>10}")
+    for name, statement, namespace in cases:
+        allocated = allocated_bytes(statement, dict(namespace)) - baseline
+        print(f"{name:<34}{allocated:>10}{nanoseconds(statement, dict(namespace)):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Benchmark of the quadtree rebuild and culling queries for 100k static points
+
+Compares the trees against a brute force over Python lists and a vectorized brute force (a NumPy bounds mask
+over the VecArray buffer, only with NumPy), which is the baseline the static tree has to beat.
+Run from the repository root with: python -m benchmarks.quadtree
+"""
+
+# Standard modules
+import random
+import timeit
+
+# Local modules
+from nikocraft.window import quadtree
+from nikocraft.window.vector2d import Vec
+from nikocraft.window.vector2d_array import VecArray
+from nikocraft.window.quadtree import QuadTree, StaticQuadTree
+
+
+SIZE = 100_000
+WORLD = Vec(20_000, 20_000)
+VIEW = Vec(1600, 900)
+
+
+def measure(statement, number: int = 10) -> float:
+    """Get the best duration in milliseconds of a statement"""
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number * 1000
+
+
+def main() -> None:
+
+    random.seed(0)
+    print(f"Backend: {'numpy' if quadtree.np is not None else 'array'}")
+
+    points = [Vec(random.uniform(0, WORLD[0]), random.uniform(0, WORLD[1])) for _ in range(SIZE)]
+    positions = VecArray(points)
+    camera = Vec(9000, 9000)
+
+    static = StaticQuadTree(Vec(0, 0), WORLD)
+    static.rebuild(positions)
+    dynamic = QuadTree(Vec(0, 0), WORLD)
+    for i, point in enumerate(points):
+        dynamic.insert(i, point)
+
+    print(f"visible points: {len(static.query_aabb(camera, camera + VIEW))}")
+    print(f"StaticQuadTree rebuild:     {measure(lambda: static.rebuild(positions)):9.3f} ms")
+    print(f"StaticQuadTree culling:     {measure(lambda: static.query_aabb(camera, camera + VIEW)):9.3f} ms")
+    print(f"StaticQuadTree nearest(8):  {measure(lambda: static.nearest(camera, 8), 100):9.3f} ms")
+    print(f"QuadTree culling:           {measure(lambda: dynamic.query_aabb(camera, camera + VIEW)):9.3f} ms")
+    print(f"QuadTree nearest(8):        {measure(lambda: dynamic.nearest(camera, 8), 100):9.3f} ms")
+    if quadtree.np is not None:
+        xs, ys = positions.x, positions.y
+        mask = lambda: ((xs >= camera[0]) & (xs <= camera[0] + VIEW[0]) &
+                        (ys >= camera[1]) & (ys <= camera[1] + VIEW[1])).nonzero()[0].tolist()
+        print(f"NumPy mask culling:         {measure(mask):9.3f} ms")
+    print(f"Brute force culling:        {measure(lambda: [p for p in points if camera[0] <= p[0] <= camera[0] + VIEW[0] and camera[1] <= p[1] <= camera[1] + VIEW[1]], 1):9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
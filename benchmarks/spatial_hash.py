@@ -0,0 +1,59 @@
+"""Benchmark of the spatial hash against the brute-force O(n²) collision pass
+
+Run from the repository root with: python -m benchmarks.spatial_hash
+"""
+
+# Standard modules
+import random
+import timeit
+
+# Local modules
+from nikocraft.window.vector2d import Vec
+from nikocraft.window.spatial_hash import SpatialHash
+
+
+SIZES = (1_000, 2_500, 5_000)
+WORLD = 4000
+RADIUS = 16
+
+
+def brute_force(positions: list[Vec]) -> list[tuple[int, int]]:
+    """Get all colliding pairs with a double loop over Vec.distance"""
+    result = []
+    for i, a in enumerate(positions):
+        for j in range(i + 1, len(positions)):
+            if a.distance(positions[j]) <= RADIUS:
+                result.append((i, j))
+    return result
+
+
+def spatial(grid: SpatialHash, positions: list[Vec]) -> list[tuple[int, int]]:
+    """Move all objects and get all colliding pairs with the spatial hash"""
+    for i, position in enumerate(positions):
+        grid.move(i, position)
+    return list(grid.pairs(RADIUS))
+
+
+def main() -> None:
+
+    random.seed(0)
+    print(f"{'size':>7}{'brute force':>16}{'spatial hash':>16}{'speedup':>10}{'pairs':>8}")
+
+    for size in SIZES:
+
+        positions = [Vec(random.uniform(0, WORLD), random.uniform(0, WORLD)) for _ in range(size)]
+        grid = SpatialHash(RADIUS * 2)
+        for i, position in enumerate(positions):
+            grid.insert(i, position)
+
+        expected = brute_force(positions)
+        found = {tuple(sorted(pair)) for pair in spatial(grid, positions)}
+        assert found == set(expected), "Spatial hash and brute force disagree!"
+
+        brute_time = min(timeit.repeat(lambda: brute_force(positions), number=1, repeat=1)) * 1000
+        hash_time = min(timeit.repeat(lambda: spatial(grid, positions), number=1, repeat=5)) * 1000
+        print(f"{size:>7}{brute_time:>13.1f} ms{hash_time:>13.1f} ms{brute_time / hash_time:>9.1f}x{len(expected):>8}")
+
+
+if __name__ == "__main__":
+    main()
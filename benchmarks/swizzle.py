@@ -0,0 +1,60 @@
+"""Benchmark of the generated swizzle properties against hand-written ones
+
+Run from the repository root with: python -m benchmarks.swizzle
+"""
+
+# Standard modules
+import timeit
+
+# Local modules
+from nikocraft.window.vector2d import Vec
+from nikocraft.window.vector3d import Vec3
+from nikocraft.window.vector3d_array import Vec3Array
+
+
+NUMBER = 500_000
+
+
+class HandWrittenVec3(tuple):
+    """Vec3 with hand-written swizzle properties (as before the generated ones)"""
+
+    def __new__(cls, x: float, y: float, z: float):
+        return tuple.__new__(cls, (x, y, z))
+
+    @property
+    def x(self) -> float:
+        return self[0]
+
+    @property
+    def zx(self) -> Vec:
+        return Vec(self[2], self[0])
+
+    @property
+    def xzy(self):
+        return HandWrittenVec3(self[0], self[2], self[1])
+
+
+def measure(statement: str, namespace: dict, number: int = NUMBER) -> float:
+    """Get the best time in nanoseconds per execution of a statement"""
+    return min(timeit.repeat(statement, globals=namespace, number=number, repeat=5)) / number * 1e9
+
+
+def main() -> None:
+
+    before = {"v": HandWrittenVec3(1.0, 2.0, 3.0)}
+    after = {"v": Vec3(1.0, 2.0, 3.0)}
+
+    print(f"{'swizzle':<10}{'before':>12}{'after':>12}")
+    for name in ("x", "zx", "xzy"):
+        print(f"{name:<10}{measure(f'v.{name}', before):>9.1f} ns{measure(f'v.{name}', after):>9.1f} ns")
+
+    vectors = [Vec3(i, i + 1, i + 2) for i in range(10_000)]
+    array = Vec3Array(vectors)
+    namespace = {"vectors": vectors, "array": array}
+    loop = measure("[v.xzy for v in vectors]", namespace, 100) / 1000
+    batch = measure("array.swizzle('xzy')", namespace, 100) / 1000
+    print(f"{'10k xzy':<10}{loop:>9.1f} us{batch:>9.1f} us  (list of Vec3 / Vec3Array)")
+
+
+if __name__ == "__main__":
+    main()
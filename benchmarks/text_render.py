@@ -0,0 +1,67 @@
+"""Benchmark of the text cache and the glyph atlas against pg.font.Font.render
+
+Draws 300 labels per frame, with changing numbers (as a HUD or the debug screen does) and static.
+Run from the repository root with: python -m benchmarks.text_render
+"""
+
+# Standard modules
+import os
+import timeit
+
+# External modules
+import pygame as pg
+
+# Local modules
+from nikocraft.window.font import FontManager
+from nikocraft.window.rgb import RGB
+
+
+LABELS = 300
+NUMBER = 20
+
+
+def main() -> None:
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pg.init()
+    screen = pg.display.set_mode((1280, 720))
+    fonts = FontManager()
+    fonts.define("default", None)
+    font = fonts.get("default", 20)
+    frames = iter(range(10 ** 9))
+
+    static = [f"Entity {i}" for i in range(LABELS)]
+    changing = True
+
+    def labels() -> list[str]:
+        if not changing:
+            return static
+        frame = next(frames)
+        return [f"Entity {i}: {(frame * 7 + i * 13) % 1000 / 7:.2f} ms" for i in range(LABELS)]
+
+    def font_render(antialias: bool, bg_color: tuple) -> None:
+        for i, label in enumerate(labels()):
+            screen.blit(font.render(label, antialias, RGB.WHITE, bg_color), (0, i * 2))
+
+    def cache_render(antialias: bool, bg_color: tuple) -> None:
+        for i, label in enumerate(labels()):
+            screen.blit(fonts.render(label, "default", 20, RGB.WHITE, bg_color, antialias), (0, i * 2))
+
+    def atlas_render(antialias: bool, bg_color: tuple) -> None:
+        atlas = fonts.atlas("default", 20, RGB.WHITE, bg_color, antialias)
+        for i, label in enumerate(labels()):
+            atlas.render(screen, label, (0, i * 2))
+
+    print(f"{'labels':<10}{'renderer':<16}{'antialias':>10}{'background':>12}{'ms/frame':>10}")
+    for changing in (True, False):
+        for antialias, bg_color in ((True, None), (True, RGB.BLACK), (False, None)):
+            for name, function in (("Font.render", font_render), ("TextCache", cache_render), ("GlyphAtlas", atlas_render)):
+                seconds = min(timeit.repeat(lambda: function(antialias, bg_color), number=NUMBER, repeat=3)) / NUMBER
+                print(f"{'changing' if changing else 'static':<10}{name:<16}{str(antialias):>10}"
+                      f"{str(bg_color is not None):>12}{seconds * 1000:>10.3f}")
+
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main()
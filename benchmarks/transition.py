@@ -0,0 +1,59 @@
+"""Benchmark of the frame time during scene transitions
+
+Compares the old fade (reallocated on every frame of a non-square window, not converted)
+with the transition effects on a 1280 x 720 screen.
+Run from the repository root with: python -m benchmarks.transition
+"""
+
+# Standard modules
+import os
+import timeit
+
+# External modules
+import pygame as pg
+
+# Local modules
+from nikocraft.window.rgb import RGB
+from nikocraft.window.transition import Transition, FadeTransition, WipeTransition, CrossfadeTransition
+
+
+NUMBER = 200
+WIDTH, HEIGHT = 1280, 720
+
+
+class OldFade(Transition):
+    """Fade as rendered before (the height was compared to the width, so it reallocated every frame)"""
+
+    def render(self, screen: pg.Surface, amount: float, entering: bool) -> None:
+        surface = pg.Surface(screen.get_size())
+        surface.fill(RGB.BLACK)
+        surface.set_alpha(int(255 * amount))
+        screen.blit(surface, (0, 0))
+
+
+def main() -> None:
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pg.init()
+    screen = pg.display.set_mode((WIDTH, HEIGHT))
+    scene = pg.Surface((WIDTH, HEIGHT)).convert()
+    scene.fill(RGB.LIGHTSTEELBLUE)
+
+    print(f"{'effect':<12}{'ms/frame':>10}")
+    for name, effect in (("old fade", OldFade()), ("fade", FadeTransition()),
+                         ("wipe", WipeTransition()), ("crossfade", CrossfadeTransition())):
+        effect.switch(screen)
+        frames = iter(range(10 ** 9))
+
+        def transition_frame() -> None:
+            screen.blit(scene, (0, 0))
+            effect.render(screen, next(frames) % 100 / 100, True)
+
+        seconds = min(timeit.repeat(transition_frame, number=NUMBER, repeat=5)) / NUMBER
+        print(f"{name:<12}{seconds * 1000:>10.3f}")
+
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark of the 2D vector array against a Python loop over Vec
+
+Run from the repository root with: python -m benchmarks.vector2d_array
+"""
+
+# Standard modules
+import random
+import timeit
+
+# Local modules
+from nikocraft.window import vector2d_array
+from nikocraft.window.vector2d import Vec
+from nikocraft.window.vector2d_array import VecArray
+
+
+SIZES = (1_000, 10_000, 100_000)
+
+
+def measure(statement, number: int) -> float:
+    """Get the best duration in milliseconds of a statement"""
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number * 1000
+
+
+def main() -> None:
+
+    random.seed(0)
+    print(f"Backend: {'numpy' if vector2d_array.np is not None else 'array'}")
+    print(f"{'operation':<12}{'size':>9}{'Vec loop':>14}{'VecArray':>14}{'speedup':>10}")
+
+    for size in SIZES:
+
+        vectors = [Vec(random.uniform(-100, 100), random.uniform(-100, 100)) for _ in range(size)]
+        velocities = [Vec(random.uniform(-1, 1), random.uniform(-1, 1)) for _ in range(size)]
+        positions = VecArray(vectors)
+        speeds = VecArray(velocities)
+        target = Vec(10, 20)
+        number = max(1, 100_000 // size)
+
+        cases = {
+            "add": (lambda: [a + b for a, b in zip(vectors, velocities)],
+                    lambda: positions + speeds),
+            "mul": (lambda: [a * 0.5 for a in vectors],
+                    lambda: positions * 0.5),
+            "step": (lambda: [a + b * 0.016 for a, b in zip(vectors, velocities)],
+                     lambda: positions + speeds * 0.016),
+            "normalize": (lambda: [a.normalize() for a in vectors],
+                          lambda: positions.normalize()),
+            "length": (lambda: [a.length for a in vectors],
+                       lambda: positions.length),
+            "distance": (lambda: [a.distance(target) for a in vectors],
+                         lambda: positions.distance(target)),
+            "floor": (lambda: [a.floor() for a in vectors],
+                      lambda: positions.floor()),
+        }
+
+        for name, (loop, batch) in cases.items():
+            loop_time = measure(loop, number)
+            batch_time = measure(batch, number)
+            print(f"{name:<12}{size:>9}{loop_time:>11.3f} ms{batch_time:>11.3f} ms{loop_time / batch_time:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
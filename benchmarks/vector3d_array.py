@@ -0,0 +1,72 @@
+"""Benchmark of the 3D vector array transforms against a Python loop over Vec3
+
+Run from the repository root with: python -m benchmarks.vector3d_array
+"""
+
+# Standard modules
+import math
+import random
+import timeit
+
+# Local modules
+from nikocraft.window import vector3d_array
+from nikocraft.window.vector2d import Vec
+from nikocraft.window.vector3d import Vec3
+from nikocraft.window.vector3d_array import Vec3Array
+from nikocraft.window.matrix import Mat4
+from nikocraft.window.quaternion import Quat
+
+
+SIZES = (1_000, 10_000, 50_000)
+
+
+def measure(statement, number: int) -> float:
+    """Get the best duration in milliseconds of a statement"""
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number * 1000
+
+
+def project_point(matrix: Mat4, v: Vec3, dimension: Vec) -> Vec:
+    """Project a single vector the way per-point code does it"""
+    w = matrix[12] * v[0] + matrix[13] * v[1] + matrix[14] * v[2] + matrix[15]
+    x = (matrix[0] * v[0] + matrix[1] * v[1] + matrix[2] * v[2] + matrix[3]) / w
+    y = (matrix[4] * v[0] + matrix[5] * v[1] + matrix[6] * v[2] + matrix[7]) / w
+    return Vec((x + 1) * dimension[0] / 2, (1 - y) * dimension[1] / 2)
+
+
+def main() -> None:
+
+    random.seed(0)
+    print(f"Backend: {'numpy' if vector3d_array.np is not None else 'array'}")
+    print(f"{'operation':<12}{'size':>9}{'Vec3 loop':>14}{'Vec3Array':>14}{'speedup':>10}")
+
+    rotation = Quat.from_euler(0.3, 0.7, 0.1)
+    rotation_matrix = rotation.mat3()
+    model = Mat4.translation(Vec3(0, 0, -10)) @ rotation.mat4()
+    projection = Mat4.perspective(math.radians(70), 16 / 9, 0.1, 100) @ model
+    dimension = Vec(1600, 900)
+
+    for size in SIZES:
+
+        vectors = [Vec3(random.uniform(-5, 5), random.uniform(-5, 5), random.uniform(-5, 5)) for _ in range(size)]
+        points = Vec3Array(vectors)
+        number = max(1, 50_000 // size)
+
+        cases = {
+            "rotate": (lambda: [rotation_matrix @ v for v in vectors],
+                       lambda: rotation.rotate(points)),
+            "transform": (lambda: [model @ v for v in vectors],
+                          lambda: model @ points),
+            "project": (lambda: [project_point(projection, v, dimension) for v in vectors],
+                        lambda: points.project(projection, dimension)),
+            "normalize": (lambda: [v.normalize() for v in vectors],
+                          lambda: points.normalize()),
+        }
+
+        for name, (loop, batch) in cases.items():
+            loop_time = measure(loop, number)
+            batch_time = measure(batch, number)
+            print(f"{name:<12}{size:>9}{loop_time:>11.3f} ms{batch_time:>11.3f} ms{loop_time / batch_time:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,15 +14,29 @@ from .utils import log
 from .app import App
 from .utils.config import Config
 from .utils.enum import Enum
+from .utils.profiler import Profiler
 from .window.window import Window
+from .window.window_options import PacingOptions, RenderOptions, UpdateOptions, SceneOptions, FontOptions, RuntimeOptions
 from .window.vector2d import Vec
+from .window.vector2d_array import VecArray
+from .window.vector2d_mutable import MVec
 from .window.vector3d import Vec3
+from .window.vector3d_array import Vec3Array
+from .window.vector3d_mutable import MVec3
+from .window.matrix import Mat3, Mat4
+from .window.quaternion import Quat
+from .window.spatial_hash import SpatialHash
+from .window.quadtree import QuadTree, StaticQuadTree
 from .window.rgb import RGB
 from .window.rgb import RGBColor
 from .window.clock import Clock
+from .window.frame_controller import FrameController
+from .window.gc_manager import GCManager
+from .window.transition import Transition, FadeTransition, WipeTransition, CrossfadeTransition
 from .window.surface_interface import SurfaceInterface
+from .window.frame_graph import FrameGraph, FrameTimeGraph, PhaseGraph, FrameHistogram
 from .window.debug_screen import DebugScreen
-from .window.event_hook import EventHook
+from .window.event_hook import EventHook, EventHookList
 from .window.scene import Scene
 
 # Constants
@@ -35,15 +49,43 @@ __all__ = [
     "App",
     "Config",
     "Enum",
+    "Profiler",
     "Window",
+    "PacingOptions",
+    "RenderOptions",
+    "UpdateOptions",
+    "SceneOptions",
+    "FontOptions",
+    "RuntimeOptions",
     "Vec",
+    "VecArray",
+    "MVec",
     "Vec3",
+    "Vec3Array",
+    "MVec3",
+    "Mat3",
+    "Mat4",
+    "Quat",
+    "SpatialHash",
+    "QuadTree",
+    "StaticQuadTree",
     "RGB",
     "RGBColor",
     "Clock",
+    "FrameController",
+    "GCManager",
+    "Transition",
+    "FadeTransition",
+    "WipeTransition",
+    "CrossfadeTransition",
     "SurfaceInterface",
+    "FrameGraph",
+    "FrameTimeGraph",
+    "PhaseGraph",
+    "FrameHistogram",
     "DebugScreen",
     "EventHook",
+    "EventHookList",
     "Scene",
     "AUTHOR",
     "VERSION",
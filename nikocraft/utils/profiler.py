@@ -0,0 +1,118 @@
+"""Contains the frame profiler class for recording spans and exporting Chrome traces"""
+
+# Standard modules
+from collections import deque
+from logging import Logger
+import json
+import os
+import threading
+
+# Local modules
+from . import time
+from . import file
+
+
+class Profiler:
+    """Frame profiler class
+
+    Records named spans (the phases of the window and user spans with time.span or time.profiled)
+    in a bounded ring buffer and exports them as Chrome/Perfetto trace JSON (chrome://tracing, ui.perfetto.dev).
+    Nesting is shown by the trace viewer from the timestamps of the spans on the same thread.
+    When disabled, recording returns immediately
+    """
+
+    def __init__(self, enabled: bool = False, capacity: int = 100_000, threshold: float = None,
+                 path: str = "./traces", cooldown: float = 5, logger: Logger = None) -> None:
+
+        # Recording
+        self.enabled: bool = enabled
+        self.spans: deque[tuple[str, str, int, int, int]] = deque(maxlen=capacity)
+
+        # Automatic dump of slow frames
+        self.threshold: float | None = threshold
+        self.path: str = path
+        self.cooldown: float = cooldown
+        self.last_dump: float = -cooldown
+        self.dumps: int = 0
+        self.logger: Logger | None = logger
+
+    # METHODS
+
+    def record(self, name: str, start: int, duration: int, category: str = "user") -> None:
+        """Add a span with a start time and duration in nanoseconds (bench_time_ns)"""
+
+        if self.enabled:
+            self.spans.append((name, category, start, duration, threading.get_ident()))
+
+    def phase(self, name: str, duration: float) -> None:
+        """Add a span in seconds that just ended
+
+        *Called by the window for the built-in phases*
+        """
+
+        if self.enabled:
+            duration_ns = int(duration * 1_000_000_000)
+            self.spans.append((name, "phase", time.bench_time_ns() - duration_ns, duration_ns, threading.get_ident()))
+
+    def end_frame(self, start: int) -> None:
+        """Add the frame span and dump a trace if the frame exceeded the threshold
+
+        *Called by the window at the end of every frame*
+        """
+
+        if not self.enabled:
+            return
+
+        duration = time.bench_time_ns() - start
+        self.spans.append(("Frame", "frame", start, duration, threading.get_ident()))
+
+        if self.threshold is not None and duration > self.threshold * 1_000_000_000 \
+           and time.bench_time() - self.last_dump > self.cooldown:
+            self.last_dump = time.bench_time()
+            path = self.dump()
+            if self.logger:
+                self.logger.warning(f"Slow frame of {duration / 1_000_000:.2f} ms! Saved trace to '{path}'")
+
+    def clear(self) -> None:
+        """Remove all recorded spans"""
+
+        self.spans.clear()
+
+    def trace(self) -> dict:
+        """Get the recorded spans as Chrome trace event dictionary"""
+
+        pid = os.getpid()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        spans = self.spans.copy()
+        events = []
+
+        for tid in {span[4] for span in spans}:
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                           "args": {"name": names.get(tid, str(tid))}})
+
+        for name, category, start, duration, tid in spans:
+            events.append({"name": name, "cat": category, "ph": "X", "pid": pid, "tid": tid,
+                           "ts": start / 1000, "dur": duration / 1000})
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump(self, path: str = None) -> str:
+        """Save the recorded spans as Chrome trace JSON file
+
+        path: the path of the file (a timestamped file in the trace directory by default)
+        Returns the path of the file
+        """
+
+        self.dumps += 1
+        if path is None:
+            path = file.join(self.path, f"trace_{time.datetime_f_ymd_hms()}_{self.dumps}.json")
+
+        with file.open_utf8(path, "w", self.logger) as f:
+            json.dump(self.trace(), f)
+
+        return path
+
+    # OVERLOADS
+
+    def __repr__(self) -> str:
+        return f"Profiler[id={id(self)}, enabled={self.enabled}, spans={len(self.spans)}, threshold={self.threshold}]"
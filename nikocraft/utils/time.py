@@ -1,9 +1,19 @@
 """Interface for standard modules time and datetime"""
 
 # Standard modules
+from __future__ import annotations
 import time as _time
 import datetime as _datetime
-from typing import Callable
+import functools as _functools
+from typing import Callable, TYPE_CHECKING
+
+# Local modules
+if TYPE_CHECKING:
+    from .profiler import Profiler
+
+
+# Profiler receiving the spans of span and profiled
+_profiler: Profiler | None = None
 
 
 def wait(duration: float) -> None:
@@ -81,3 +91,78 @@ def benchmark() -> Callable[[], float]:
         return bench_time() - start
 
     return stop
+
+
+def set_profiler(profiler: Profiler | None) -> None:
+    """Set the profiler receiving the spans of span and profiled (set by the window)"""
+    global _profiler
+    _profiler = profiler
+
+
+def get_profiler() -> Profiler | None:
+    """Get the profiler receiving the spans of span and profiled"""
+    return _profiler
+
+
+class _Span:
+    """Context manager recording a span to the profiler"""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: Profiler, name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+        self.start = 0
+
+    def __enter__(self) -> _Span:
+        self.start = _time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.profiler.record(self.name, self.start, _time.perf_counter_ns() - self.start)
+
+
+class _NoSpan:
+    """Context manager doing nothing (profiler disabled)"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> _NoSpan:
+        return self
+
+    def __exit__(self, *args) -> None:
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+def span(name: str) -> _Span | _NoSpan:
+    """Profile a block of code as named span (with time.span("name"): ...)"""
+    if _profiler is None or not _profiler.enabled:
+        return _NO_SPAN
+    return _Span(_profiler, name)
+
+
+def profiled(name: str | Callable = None) -> Callable:
+    """Profile every call of a function as span (@time.profiled or @time.profiled("name"))"""
+
+    def decorator(function: Callable) -> Callable:
+
+        span_name = name if isinstance(name, str) else function.__qualname__
+
+        @_functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if _profiler is None or not _profiler.enabled:
+                return function(*args, **kwargs)
+            start = _time.perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                _profiler.record(span_name, start, _time.perf_counter_ns() - start)
+
+        return wrapper
+
+    if callable(name):
+        return decorator(name)
+    return decorator
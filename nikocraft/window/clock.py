@@ -1,7 +1,15 @@
 """Contains the clock class for time handling in pygame"""
 
+# Standard modules
+from array import array
+import bisect
+
 # External modules
 import pygame as pg
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # Local modules
 from ..utils import time
@@ -10,23 +18,43 @@ from ..utils import time
 class Clock:
     """Clock class for time handling in pygame"""
 
-    def __init__(self, max_fps: int) -> None:
+    def __init__(self, max_fps: int, history: int = 90, precise: bool = False, spin_budget: float = 0.002) -> None:
 
         # Limiting
         self.max_fps: int = max_fps
         self.limiter: pg.time.Clock = pg.time.Clock()
 
+        # Precise limiting (sleep most of the frame budget, spin the rest)
+        self.precise: bool = precise
+        self.spin_budget: float = spin_budget
+        self.next_frame_ns: int = 0
+        self.sleep_overshoot: float = 0
+
+        # Pacing (deviation of the frame interval from the target interval)
+        self.pacing_error: float = 0
+        self.pacing_error_mean: float = 0
+        self.frame_interval_mean: float = 0
+
         # Statistics
         self.start_time: float = 0
         self.frame_count: int = 0
         self.frame_start: float = 0
         self.frame_end: float = 0
-        self.frame_durations: list[float] = [0] * 90
         self.frame_duration: float = 1
         self.frame_duration_low: float = 1
         self.frame_duration_lazy: float = 1
         self.last_update: float = 0
 
+        # Frame history (ring buffer in order of arrival and sorted samples for percentiles)
+        if history < 1:
+            raise ValueError("The frame history needs at least one frame!")
+        self.history: int = history
+        self.frame_durations: array | np.ndarray = np.zeros(history) if np is not None else array("d", bytes(8 * history))
+        self.frame_index: int = 0
+        self.frame_samples: int = 0
+        self.frame_total: float = 0
+        self.sorted_durations: list[float] = []
+
         # Delta time
         self.delta_time_raw: float = 0
         self.delta_time: float = 0
@@ -39,6 +67,8 @@ class Clock:
 
     @property
     def real_fps(self) -> float:
+        if self.precise:
+            return round(1 / self.frame_interval_mean, 5) if self.frame_interval_mean else 0
         return round(self.limiter.get_fps(), 5)
 
     @property
@@ -53,42 +83,64 @@ class Clock:
     def available_fps_lazy(self) -> float:
         return round(1 / self.frame_duration_lazy, 5)
 
+    @property
+    def last_frame_duration(self) -> float:
+        return float(self.frame_durations[self.frame_index - 1])
+
+    @property
+    def mean_frame_duration(self) -> float:
+        return self.frame_total / self.frame_samples if self.frame_samples else 0
+
+    @property
+    def p50(self) -> float:
+        return self.percentile(50)
+
+    @property
+    def p95(self) -> float:
+        return self.percentile(95)
+
+    @property
+    def p99(self) -> float:
+        return self.percentile(99)
+
+    @property
+    def low_1_percent(self) -> float:
+        return self.low(1)
+
     # METHODS
 
+    def remaining_time(self) -> float:
+        """Get the time in seconds until the next frame should be calculated"""
+
+        if self.last_time == 0 or self.max_fps <= 0:
+            return 0
+        return max(0.0, 1 / self.max_fps - (time.bench_time() - self.last_time))
+
     def tick(self, max_fps: int = None) -> None:
         """Next frame (Calculates statistics and delta time and waits until the next frame should be calculated)"""
 
         # Statistics
         self.frame_end: float = time.bench_time()
-        self.frame_durations.append(self.frame_end - self.frame_start)
-        del self.frame_durations[0]
-
-        if time.bench_time() - self.last_update > 0.2:
-
-            self.frame_duration: float = sum(self.frame_durations[-5:]) / 5
-            if self.frame_duration == 0:
-                self.frame_duration: float = 1
+        if self.frame_start != 0:
+            self.record(self.frame_end - self.frame_start)
 
-            low_list: list[float] = []
-            duration_copy: list[float] = self.frame_durations.copy()
-            while len(low_list) < 3:
-                value = max(duration_copy)
-                duration_copy.remove(value)
-                low_list.append(value)
-            self.frame_duration_low: float = sum(low_list) / 3
-            if self.frame_duration_low == 0:
-                self.frame_duration_low: float = 1
+        if self.frame_end - self.last_update > 0.2 and self.frame_samples:
 
-            self.frame_duration_lazy: float = sum(self.frame_durations) / len(self.frame_durations)
-            if self.frame_duration_lazy == 0:
-                self.frame_duration: float = 1
+            recent = min(5, self.frame_samples)
+            self.frame_duration: float = sum(float(self.frame_durations[(self.frame_index - i - 1) % self.history])
+                                             for i in range(recent)) / recent or 1
+            self.frame_duration_low: float = self.low(300 / self.frame_samples) or 1
+            self.frame_duration_lazy: float = self.mean_frame_duration or 1
 
-            self.last_update: float = time.bench_time()
+            self.last_update: float = self.frame_end
 
         # Limiting
         if max_fps is not None:
             self.max_fps: int = max_fps
-        self.limiter.tick(self.max_fps)
+        if self.precise:
+            self.limit()
+        else:
+            self.limiter.tick(self.max_fps)
 
         # Delta time
         if self.last_time == 0:
@@ -98,10 +150,117 @@ class Clock:
         self.last_time: float = time.bench_time()
         self.delta_time = self.delta_time_raw * self.max_fps * self.speed_factor
 
+        # Pacing
+        if self.frame_count > 0:
+            if self.max_fps > 0:
+                self.pacing_error: float = abs(self.delta_time_raw - 1 / self.max_fps)
+                self.pacing_error_mean += (self.pacing_error - self.pacing_error_mean) * 0.05
+            self.frame_interval_mean += (self.delta_time_raw - self.frame_interval_mean) * (0.1 if self.frame_interval_mean else 1)
+
         # Statistics
         self.frame_count += 1
         self.frame_start: float = time.bench_time()
 
+    def limit(self) -> None:
+        """Wait until the next frame with nanosecond precision (sleeps for most of the time and spins the rest)
+
+        *Called in tick in precise mode -
+        The sleep is shortened by the measured sleep overshoot, so the spin starts before the target -
+        Delays of the operating system scheduler (a late wake up or preemption while spinning) are not avoidable*
+        """
+
+        if self.max_fps <= 0:
+            return
+
+        period = int(1_000_000_000 / self.max_fps)
+        now = time.bench_time_ns()
+
+        # Start over if the frame is late by more than a frame (instead of catching up)
+        if self.next_frame_ns == 0 or now - self.next_frame_ns > period:
+            self.next_frame_ns = now + period
+            return
+
+        target = self.next_frame_ns
+        self.next_frame_ns += period
+
+        # Sleep
+        sleep = (target - now) / 1e9 - self.spin_budget - self.sleep_overshoot
+        if sleep > 0:
+            time.wait(sleep)
+            # A single long sleep (preemption) is clamped to the spin budget, so it does not shorten later sleeps
+            overshoot = min((time.bench_time_ns() - now) / 1e9 - sleep, self.spin_budget)
+            self.sleep_overshoot = max(0.0, self.sleep_overshoot + (overshoot - self.sleep_overshoot) * 0.1)
+
+        # Spin
+        while time.bench_time_ns() < target:
+            pass
+
+    def record(self, duration: float) -> None:
+        """Add a frame duration to the history (replaces the oldest one if the history is full)"""
+
+        sorted_durations = self.sorted_durations
+        if self.frame_samples == self.history:
+            old = float(self.frame_durations[self.frame_index])
+            del sorted_durations[bisect.bisect_left(sorted_durations, old)]
+            self.frame_total -= old
+        else:
+            self.frame_samples += 1
+        bisect.insort(sorted_durations, duration)
+
+        self.frame_durations[self.frame_index] = duration
+        self.frame_index += 1
+        if self.frame_index == self.history:
+            self.frame_index = 0
+            # Resynchronize the running sum once per cycle against floating point drift
+            self.frame_total = sum(sorted_durations)
+        else:
+            self.frame_total += duration
+
+    def percentile(self, percent: float) -> float:
+        """Get a percentile of the frame durations in the history (nearest rank)"""
+
+        samples = self.frame_samples
+        if samples == 0:
+            return 0
+        rank = min(samples - 1, max(0, int(percent / 100 * samples + 0.5) - 1))
+        return self.sorted_durations[rank]
+
+    def low(self, percent: float) -> float:
+        """Get the mean of the slowest percent of the frame durations in the history (at least one frame)"""
+
+        samples = self.frame_samples
+        if samples == 0:
+            return 0
+        count = min(samples, max(1, int(samples * percent / 100)))
+        return sum(self.sorted_durations[samples - count:]) / count
+
+    def ordered_durations(self) -> list[float]:
+        """Get the frame durations in the history from the oldest to the newest"""
+
+        if self.frame_samples < self.history:
+            return [float(duration) for duration in self.frame_durations[:self.frame_samples]]
+        return [float(duration) for duration in self.frame_durations[self.frame_index:]] + \
+               [float(duration) for duration in self.frame_durations[:self.frame_index]]
+
+    def snapshot(self) -> dict[str, float]:
+        """Get the current frame statistics for exporting"""
+
+        return {
+            "frame_count": self.frame_count,
+            "samples": self.frame_samples,
+            "max_fps": self.max_fps,
+            "real_fps": self.real_fps,
+            "delta_time_raw": self.delta_time_raw,
+            "pacing_error": self.pacing_error,
+            "pacing_error_mean": self.pacing_error_mean,
+            "last": self.last_frame_duration,
+            "mean": self.mean_frame_duration,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "low_1_percent": self.low(1),
+        }
+
     # OVERLOADS
 
     def __repr__(self) -> str:
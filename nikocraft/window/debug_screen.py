@@ -2,17 +2,27 @@
 import pygame as pg
 
 # Local modules
+from ..utils import time
 from .window import Window
 from .surface_interface import SurfaceInterface
 from .rgb import RGB, RGBColor
+from .frame_graph import FrameGraph, FrameTimeGraph, PhaseGraph, FrameHistogram
 
 
 class DebugScreen(SurfaceInterface):
-    """Renderer class for a debug screen"""
+    """Renderer class for a debug screen
+
+    Keeps the text in a cached layer surface, which is refreshed with a limited rate (refresh_rate per second,
+    0 for every frame) by re-rendering only the changed lines, and blitted to the screen once per frame.
+    Optionally shows a frame time graph, a frame phase graph and a frame time histogram below the right column,
+    and draws the lines from a glyph atlas instead of rendering a surface per line (glyph_atlas)
+    """
     
     def __init__(self, window: Window, color: RGBColor = RGB.WHITE, bg_color: RGBColor = RGB.BLACK,
                  font_name: str = "consolas", font_system: bool = True,
-                 font_size: int = 20, font_antialias: bool = True) -> None:
+                 font_size: int = 20, font_antialias: bool = True, text_cache: bool = False, glyph_atlas: bool = False,
+                 refresh_rate: float = 4, graphs: bool = False,
+                 graph_size: tuple[int, int] = (240, 60)) -> None:
 
         super(DebugScreen, self).__init__("screen")
 
@@ -23,6 +33,31 @@ class DebugScreen(SurfaceInterface):
         self.font_system: bool = font_system
         self.font_size: int = font_size
         self.font_antialias: bool = font_antialias
+        self.text_cache: bool = text_cache
+        self.glyph_atlas: bool = glyph_atlas
+
+        # Canvas with the drawn lines (transparent by a color key with an opaque background color,
+        # else by per pixel alpha) and the cached layer copied from the drawn area of the canvas
+        self.refresh_rate: float = refresh_rate
+        self.last_refresh: float = 0
+        self.canvas: pg.Surface | None = None
+        self.canvas_key: RGBColor = RGB.MAGENTA if bg_color is None or RGB.MAGENTA not in (color, bg_color) else RGB.AQUA
+        self.layer: pg.Surface | None = None
+        self.layer_area: pg.Rect = pg.Rect(0, 0, 0, 0)
+
+        # Lines drawn in the canvas (text, y position and area) by column
+        self.left_lines: list[tuple[str, int, pg.Rect]] = []
+        self.right_lines: list[tuple[str, int, pg.Rect]] = []
+
+        # Graphs (right aligned below the right column)
+        self.graphs: list[FrameGraph] = []
+        if graphs:
+            graph_bg_color = bg_color if bg_color is not None else RGB.BLACK
+            self.graphs = [
+                FrameTimeGraph(*graph_size, color=color, bg_color=graph_bg_color),
+                PhaseGraph(*graph_size, bg_color=graph_bg_color),
+                FrameHistogram(*graph_size, color=color, bg_color=graph_bg_color)
+            ]
 
     # PROPERTIES
 
@@ -34,31 +69,149 @@ class DebugScreen(SurfaceInterface):
 
     def render(self, left_content: list[str] = None, right_content: list[str] = None) -> None:
 
+        # Allocate canvas for the current screen size
+        refresh = self.canvas is None or self.canvas.get_size() != self.screen.get_size()
+        if refresh:
+            self.allocate()
+
+        # Refresh changed lines
+        now = time.bench_time()
+        refresh = refresh or self.refresh_rate <= 0 or now - self.last_refresh >= 1 / self.refresh_rate
+        if refresh:
+            self.last_refresh = now
+
+            if left_content is None:
+                left_content = self.left_content()
+
+            if right_content is None:
+                right_content = self.right_content()
+
+            rects = self.update_column(left_content, self.left_lines, False)
+            rects += self.update_column(right_content, self.right_lines, True)
+
+            if rects or self.layer is None:
+                self.update_layer()
+
+            if self.window.dirty_rects_mode:
+                for rect in rects:
+                    self.window.add_dirty_rect(rect)
+
+        self.screen.blit(self.layer, self.layer_area)
+
+        # Graphs
+        if self.graphs:
+            self.render_graphs(refresh)
+
+    def render_graphs(self, refresh: bool) -> None:
+        """Update the graphs (scrolling graphs every frame, the others on a refresh) and draw them"""
+
+        x = self.screen.get_width()
+        y = self.right_lines[-1][2].bottom + 10 if self.right_lines else 0
+
+        for graph in self.graphs:
+            surface = graph.update(self.window) if graph.scrolling or refresh or graph.surface is None else graph.surface
+            rect = self.screen.blit(surface, (x - surface.get_width(), y))
+            if self.window.dirty_rects_mode and (graph.scrolling or refresh):
+                self.window.add_dirty_rect(rect)
+            y = rect.bottom + 5
+
+    def allocate(self) -> None:
+        """Create an empty canvas with the size of the screen"""
+
+        if self.bg_color is not None:
+            self.canvas = pg.Surface(self.screen.get_size())
+            if pg.display.get_surface() is not None:
+                self.canvas = self.canvas.convert()
+        else:
+            self.canvas = pg.Surface(self.screen.get_size(), pg.SRCALPHA)
+            if pg.display.get_surface() is not None:
+                self.canvas = self.canvas.convert_alpha()
+        self.clear(self.canvas.get_rect())
+
+        self.layer = None
+        self.left_lines.clear()
+        self.right_lines.clear()
+
+    def update_layer(self) -> None:
+        """Copy the drawn area of the canvas to the layer
+
+        The layer is run-length encoded with an opaque background color, so the transparent areas are skipped
+        in the blit (drawing into an encoded surface encodes it again, so the lines are drawn to the canvas)
+        """
+
+        rects = [rect for _, _, rect in self.left_lines + self.right_lines]
+        self.layer_area = rects[0].unionall(rects[1:]) if rects else pg.Rect(0, 0, 0, 0)
+        self.layer = self.canvas.subsurface(self.layer_area).copy()
+        if self.bg_color is not None:
+            self.layer.set_colorkey(self.canvas_key, pg.RLEACCEL)
+
+    def clear(self, rect: pg.Rect) -> None:
+        """Clear an area of the canvas"""
+
+        self.canvas.fill(self.canvas_key if self.bg_color is not None else (0, 0, 0, 0), rect)
+
+    def update_column(self, content: list[str], lines: list[tuple[str, int, pg.Rect]], right: bool) -> list[pg.Rect]:
+        """Re-render the lines of a column, which changed since the last refresh
+
+        Returns the changed areas
+        """
+
         font = self.window.font.get(self.font_name, self.font_size, self.font_system)
         height = font.get_height()
+        width = self.canvas.get_width()
+        changed = []
 
-        if left_content is None:
-            left_content = self.left_content()
-
-        if right_content is None:
-            right_content = self.right_content()
+        atlas = None
+        if self.glyph_atlas:
+            atlas = self.window.font.atlas(self.font_name, self.font_size, self.color, self.bg_color,
+                                           self.font_antialias, self.font_system)
 
         y = 0
-        for line in right_content:
-            if line != "":
-                text = font.render(line, self.font_antialias, self.color, self.bg_color)
-                self.screen.blit(text, (self.width - text.get_width(), y))
+        for index, line in enumerate(content):
+
+            # Skip unchanged lines
+            if index < len(lines) and lines[index][0] == line and lines[index][1] == y:
+                y += height if line != "" else 10
+                continue
+
+            # Clear old line
+            if index < len(lines):
+                self.clear(lines[index][2])
+                changed.append(lines[index][2])
+
+            # Draw new line
+            if line != "" and atlas is not None:
+                rect = atlas.render(self.canvas, line, (width - atlas.size(line)[0] if right else 0, y))
+                y += height
+            elif line != "":
+                text = self.render_line(font, line)
+                rect = self.canvas.blit(text, (width - text.get_width() if right else 0, y))
                 y += height
             else:
+                rect = pg.Rect(0, y, 0, 0)
                 y += 10
+            changed.append(rect)
 
-        y = 0
-        for line in left_content:
-            if line != "":
-                self.screen.blit(font.render(line, self.font_antialias, self.color, self.bg_color), (0, y))
-                y += height
+            if index < len(lines):
+                lines[index] = (line, rect.y, rect)
             else:
-                y += 10
+                lines.append((line, rect.y, rect))
+
+        # Clear removed lines
+        for _, _, rect in lines[len(content):]:
+            self.clear(rect)
+            changed.append(rect)
+        del lines[len(content):]
+
+        return changed
+
+    def render_line(self, font: pg.font.Font, line: str) -> pg.Surface:
+        """Render a line of text (with the text cache of the font manager if enabled)"""
+
+        if self.text_cache:
+            return self.window.font.render(line, self.font_name, self.font_size, self.color, self.bg_color,
+                                           self.font_antialias, self.font_system)
+        return font.render(line, self.font_antialias, self.color, self.bg_color)
 
     def left_content(self) -> list[str]:
 
@@ -69,17 +222,39 @@ class DebugScreen(SurfaceInterface):
             f"",
             f"FPS: {win.clock.available_fps:.1f} / {win.clock.available_fps_low:.1f} / " +
             f"{win.clock.available_fps_lazy:.1f} ({win.clock.real_fps:.1f})",
+            f"Frame Time: p50 {win.clock.p50*1000:.2f} / p95 {win.clock.p95*1000:.2f} / p99 {win.clock.p99*1000:.2f} / "
+            f"1% low {win.clock.low_1_percent*1000:.2f} ms",
             f"Delta Time: {win.clock.delta_time_raw*1000:.1f} ms ({win.clock.delta_time:.2f})",
-            f"Timings: {win.clock.frame_durations[-1]*1000:.2f} ms",
+            f"Pacing Error: {win.clock.pacing_error_mean*1000:.3f} ms ({'precise' if win.clock.precise else 'pygame'})",
+            f"Timings: {win.clock.last_frame_duration*1000:.2f} ms",
             f"   Event: {win.stat_event_time*1000:.2f} ms",
             f"   Render: {win.stat_render_time*1000:.2f} ms",
             f"   Update: {win.stat_update_time*1000:.2f} ms",
+            f"   Fixed Update: {win.stat_fixed_update_time*1000:.2f} ms ({win.stat_fixed_steps} steps, {win.interpolation:.2f})"
+            if win.fixed_timestep > 0 else "   Fixed Update: <off>",
             f"   Early Update: {win.stat_e_update_time*1000:.2f} ms",
             f"   Late Update: {win.stat_l_update_time*1000:.2f} ms",
+            f"Threads: main {win.stat_main_thread_time*1000:.2f} ms / update {win.stat_update_thread_time*1000:.2f} ms "
+            f"(wait {win.stat_update_wait_time*1000:.2f} ms)" if win.threaded_update else "Threads: <off>",
+            f"",
+            f"GC: {win.gc_manager.collections[0]} / {win.gc_manager.collections[1]} / {win.gc_manager.collections[2]} "
+            f"(frame {win.gc_manager.stat_frame_pause*1000:.2f} ms, last {win.gc_manager.last_pause*1000:.2f} ms, "
+            f"max {win.gc_manager.max_pause*1000:.2f} ms)" if win.gc_manager is not None else "GC: <off>",
             f"",
+            f"Text Cache: {win.font.text_cache.hits} hits / {win.font.text_cache.misses} misses "
+            f"({win.font.text_cache.memory / 1048576:.1f} MB)" if self.text_cache else "Text Cache: <off>",
             f"Screen: {win.width} x {win.height} px",
+            f"Render Scale: {win.render_scale:.0%} ({win.frame_controller.frame_time*1000:.2f} / "
+            f"{win.frame_controller.target*1000:.2f} ms, {win.frame_controller.fps_reason} {win.clock.max_fps} FPS)"
+            if win.frame_controller is not None else f"Render Scale: {win.render_scale:.0%}",
+            f"   Last Decision: {win.frame_controller.last_decision or '<none>'}"
+            if win.frame_controller is not None else "   Last Decision: <off>",
+            f"Dirty Area: {win.stat_dirty_area:.1f} %" if win.dirty_rects_mode else "Dirty Area: <off>",
             f"",
-            f"Scene: {win.get_scene_name(win.scene) if win.scene_mode else '<off>'}"
+            f"Scene: {win.scene_name if win.scene_mode else '<off>'}",
+            f"Scene Load: {win.stat_scene_load_time*1000:.2f} ms" if win.scene_mode else "Scene Load: <off>",
+            f"Retained Scenes: {len(win.retained_scenes)}/{win.max_retained_scenes}"
+            if win.max_retained_scenes > 0 else "Retained Scenes: <off>"
         ]
 
     def right_content(self) -> list[str]:
@@ -19,3 +19,37 @@ class EventHook:
     events: tuple[int, ...]
     handlers: tuple[Callable[[pg.event.Event, Window, dict], None], ...]
     data: dict
+
+
+class EventHookList(list):
+    """List of event hooks, which counts its changes
+
+    The window rebuilds its lookup of the hooks by id and by event type when the version changed,
+    so the list can still be changed directly
+    """
+
+    def __init__(self, *args) -> None:
+
+        super(EventHookList, self).__init__(*args)
+
+        self.version: int = 0
+
+
+def _changing(name: str) -> Callable:
+    """Wrap a list method, which changes the list, to increase the version"""
+
+    method = getattr(list, name)
+
+    def wrapper(self: EventHookList, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+for _name in ("append", "extend", "insert", "remove", "pop", "clear", "sort", "reverse",
+              "__setitem__", "__delitem__", "__iadd__", "__imul__"):
+    setattr(EventHookList, _name, _changing(_name))
+del _name
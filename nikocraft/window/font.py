@@ -1,14 +1,154 @@
+"""Contains the font manager and text cache classes"""
+
+# Standard modules
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future
+from logging import Logger
+import threading
+
 # External modules
 import pygame as pg
 
+# Local modules
+from ..utils import file
+from .glyph_atlas import GlyphAtlas
+
+
+class TextCache:
+    """Cache of rendered text surfaces with a memory budget and least recently used eviction
+
+    Keyed by (font, size, text, color, background color, antialias).
+    Texts are only admitted when they are seen the second time, so changing text (numbers, timings)
+    costs no more than rendering directly and does not push the reused text out.
+    The number of entries is limited as well, as SDL searches a list of all surfaces blitted to a destination
+    whenever one of them is freed (many small cached surfaces make every eviction slow)
+    """
+
+    def __init__(self, budget: int = 16 * 1024 * 1024, max_entries: int = 512) -> None:
+
+        self.budget: int = budget
+        self.max_entries: int = max_entries
+        self.surfaces: OrderedDict[tuple, pg.Surface] = OrderedDict()
+        self.memory: int = 0
+
+        # Keys seen once (without surfaces, forgotten all at once when full)
+        self.seen: set[tuple] = set()
+
+        # Statistics
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    # PROPERTIES
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0
+
+    # METHODS
+
+    def get(self, key: tuple) -> pg.Surface | None:
+        """Get a cached surface and mark it as recently used (None if not cached)"""
+
+        surface = self.surfaces.get(key)
+        if surface is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.surfaces.move_to_end(key)
+        return surface
+
+    def put(self, key: tuple, surface: pg.Surface) -> pg.Surface:
+        """Add a surface to the cache and evict the least recently used ones over the budget"""
+
+        old = self.surfaces.pop(key, None)
+        if old is not None:
+            self.memory -= old.get_pitch() * old.get_height()
+
+        self.surfaces[key] = surface
+        self.memory += surface.get_pitch() * surface.get_height()
+
+        while (self.memory > self.budget or len(self.surfaces) > self.max_entries) and len(self.surfaces) > 1:
+            _, evicted = self.surfaces.popitem(last=False)
+            self.memory -= evicted.get_pitch() * evicted.get_height()
+            self.evictions += 1
+
+        return surface
+
+    def admit(self, key: tuple) -> bool:
+        """Check if a missed key should be cached (True if it was seen before, else it is remembered)"""
+
+        seen = self.seen
+        if key in seen:
+            seen.discard(key)
+            return True
+
+        if len(seen) >= self.max_entries * 4:
+            seen.clear()
+        seen.add(key)
+        return False
+
+    def clear(self) -> None:
+        """Remove all cached surfaces"""
+
+        self.surfaces.clear()
+        self.seen.clear()
+        self.memory = 0
+
+    # OVERLOADS
+
+    def __len__(self) -> int:
+        return len(self.surfaces)
+
+    def __repr__(self) -> str:
+        return f"TextCache[id={id(self)}, entries={len(self.surfaces)}, memory={self.memory}, budget={self.budget}, hits={self.hits}, misses={self.misses}]"
+
 
 class FontManager:
-    """Font manager class"""
+    """Font manager class
+
+    Keeps the loaded fonts in a least recently used cache with a maximum number of fonts.
+    System fonts are loaded with pg.font.SysFont the first time, their file paths are remembered
+    and optionally persisted in a json file (saved when the window is closed and after a preload),
+    so the slow system font scan is skipped on later starts
+    """
     
-    def __init__(self) -> None:
+    def __init__(self, text_cache_budget: int = 16 * 1024 * 1024, max_fonts: int = 32,
+                 sysfont_cache_path: str = None, logger: Logger = None) -> None:
 
         self.fonts = {}
-        self.cache = {}
+        self.loaded: OrderedDict[tuple[str, int], pg.font.Font] = OrderedDict()
+        self.max_fonts: int = max_fonts
+        self.lock: threading.Lock = threading.Lock()
+        self.logger: Logger | None = logger
+        self.text_cache: TextCache = TextCache(text_cache_budget)
+
+        # Glyph atlases by font and style (least recently used evicted with the maximum number of fonts)
+        self.atlases: OrderedDict[tuple, GlyphAtlas] = OrderedDict()
+
+        # System font paths by name (None for fonts not found)
+        self.sysfont_cache_path: str | None = sysfont_cache_path
+        self.sysfont_paths: dict[str, str | None] = {}
+        self.sysfont_changed: bool = False
+        if sysfont_cache_path is not None and file.exists(sysfont_cache_path):
+            self.sysfont_paths = file.load_json(sysfont_cache_path, logger, create=False)
+
+        # Background preloading
+        self.executor: ThreadPoolExecutor | None = None
+
+    # PROPERTIES
+
+    @property
+    def cache(self) -> dict[str, dict[int, pg.font.Font]]:
+        """Loaded fonts by name and size (a copy, the fonts are kept in loaded by (name, size))"""
+
+        cache = {}
+        for (name, size), font in tuple(self.loaded.items()):
+            cache.setdefault(name, {})[size] = font
+        return cache
+
+    # METHODS
 
     def define(self, name: str, path: str) -> None:
         """Define a new font"""
@@ -17,21 +157,119 @@ class FontManager:
     def get(self, name: str, size: int, system: bool = False) -> pg.font.Font:
         """Get a font"""
 
-        # Check for cache
-        if name in self.cache:
-            if size in self.cache[name]:
-                return self.cache[name][size]
+        # Check for cache (single operations on the loaded fonts are atomic, so no lock is needed for a hit)
+        key = (name, size)
+        font = self.loaded.get(key)
+        if font is not None:
+            try:
+                self.loaded.move_to_end(key)
+            except KeyError:
+                pass
+            return font
 
         # Load font
-        if system:
-            font = pg.font.SysFont(name, size)
-        else:
-            font = pg.font.Font(self.fonts[name], size)
+        font = self.load(name, size, system)
 
         # Store to cache
-        if name not in self.cache:
-            self.cache[name] = {}
-        self.cache[name][size] = font
+        with self.lock:
+            self.loaded[key] = font
+            while len(self.loaded) > self.max_fonts:
+                self.loaded.popitem(last=False)
 
         # Return cache
         return font
+
+    def load(self, name: str, size: int, system: bool = False) -> pg.font.Font:
+        """Load a font without caching it"""
+
+        if not system:
+            return pg.font.Font(self.fonts[name], size)
+
+        # Remembered system font path (None for the default font, if the font was not found)
+        if name in self.sysfont_paths:
+            path = self.sysfont_paths[name]
+            if path is None or file.exists(path):
+                return pg.font.Font(path, size)
+
+        font = pg.font.SysFont(name, size)
+        self.sysfont_path(name)
+        return font
+
+    def sysfont_path(self, name: str) -> str | None:
+        """Resolve the file path of a system font and remember it (None if not found)"""
+
+        if name in self.sysfont_paths:
+            path = self.sysfont_paths[name]
+            if path is None or file.exists(path):
+                return path
+
+        path = pg.font.match_font(name)
+        if self.logger:
+            self.logger.debug(f"Resolved system font '{name}' to '{path}'")
+        with self.lock:
+            self.sysfont_paths[name] = path
+            self.sysfont_changed = True
+        return path
+
+    def save_sysfont_paths(self) -> None:
+        """Save the remembered system font paths to the cache file, if they changed
+
+        *Called by the window when it is closed and after a preload*
+        """
+
+        if self.sysfont_cache_path is None:
+            return
+
+        with self.lock:
+            if not self.sysfont_changed:
+                return
+            file.save_json(self.sysfont_cache_path, dict(self.sysfont_paths), self.logger)
+            self.sysfont_changed = False
+
+    def preload(self, fonts: list[tuple[str, int] | tuple[str, int, bool]]) -> Future:
+        """Resolve and load fonts on a background thread (name, size and optional system flag)
+
+        Returns a future, which is done when all fonts are loaded
+        """
+
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="FontPreload")
+
+        def task() -> None:
+            for font in fonts:
+                self.get(*font)
+            self.save_sysfont_paths()
+
+        return self.executor.submit(task)
+
+    def render(self, text: str, name: str, size: int, color: tuple, bg_color: tuple = None,
+               antialias: bool = True, system: bool = False) -> pg.Surface:
+        """Render a text with a font (cached in the text cache)"""
+
+        key = (name, size, text, color, bg_color, antialias)
+        surface = self.text_cache.get(key)
+        if surface is not None:
+            return surface
+
+        surface = self.get(name, size, system).render(text, antialias, color, bg_color)
+        if not self.text_cache.admit(key):
+            return surface
+        if pg.display.get_surface() is not None:
+            surface = surface.convert() if bg_color is not None else surface.convert_alpha()
+        return self.text_cache.put(key, surface)
+
+    def atlas(self, name: str, size: int, color: tuple, bg_color: tuple = None,
+              antialias: bool = True, system: bool = False) -> GlyphAtlas:
+        """Get the glyph atlas of a font and style for rendering changing text"""
+
+        key = (name, size, color, bg_color, antialias)
+        atlas = self.atlases.get(key)
+        if atlas is not None:
+            self.atlases.move_to_end(key)
+            return atlas
+
+        atlas = GlyphAtlas(self.get(name, size, system), color, bg_color, antialias)
+        self.atlases[key] = atlas
+        while len(self.atlases) > self.max_fonts:
+            self.atlases.popitem(last=False)
+        return atlas
@@ -0,0 +1,174 @@
+"""Contains the frame controller class for adaptive resolution and frame rate"""
+
+# Standard modules
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from collections import deque
+
+# External modules
+import pygame as pg
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Local modules
+if TYPE_CHECKING:
+    from .window import Window
+from ..utils import time
+
+
+class FrameController:
+    """Frame controller class for adaptive resolution and frame rate
+
+    Watches the frame durations of the clock (the work of a frame without waiting) and keeps them below
+    a target frame time by lowering the render scale of the window. The scale is changed in steps between
+    a lower and an upper threshold of the target (hysteresis) and only after the condition held for some frames,
+    followed by a cooldown, so it does not oscillate.
+    Optionally lowers the maximum FPS while the window is unfocused or the system runs on battery
+    """
+
+    def __init__(self, target_frame_time: float = None, min_scale: float = 0.5, max_scale: float = 1, step: float = 0.125,
+                 upper_threshold: float = 1, lower_threshold: float = 0.7, patience: int = 15, cooldown: int = 60,
+                 smooth: bool = False, unfocused_fps: int = None, battery_fps: int = None) -> None:
+
+        # Resolution
+        self.target_frame_time: float | None = target_frame_time
+        self.min_scale: float = min_scale
+        self.max_scale: float = max_scale
+        self.step: float = step
+        self.smooth: bool = smooth
+        self.scale: float = max_scale
+
+        # Hysteresis
+        self.upper_threshold: float = upper_threshold
+        self.lower_threshold: float = lower_threshold
+        self.patience: int = patience
+        self.cooldown: int = cooldown
+        self.over_frames: int = 0
+        self.under_frames: int = 0
+        self.cooldown_frames: int = 0
+
+        # Frame rate
+        self.unfocused_fps: int | None = unfocused_fps
+        self.battery_fps: int | None = battery_fps
+        self.base_fps: int = 0
+        self.fps_reason: str = "normal"
+        self.battery: bool = False
+        self.last_battery_check: float = 0
+
+        # Statistics
+        self.frame_time: float = 0
+        self.decisions: deque[str] = deque(maxlen=5)
+
+    # PROPERTIES
+
+    @property
+    def target(self) -> float:
+        if self.target_frame_time is not None:
+            return self.target_frame_time
+        return 1 / self.base_fps if self.base_fps > 0 else 0
+
+    @property
+    def last_decision(self) -> str:
+        return self.decisions[-1] if self.decisions else ""
+
+    # METHODS
+
+    def update(self, window: Window) -> None:
+        """Update the frame rate and render scale of a window
+
+        *Called by the window every frame after the clock tick*
+        """
+
+        clock = window.clock
+        if self.base_fps == 0:
+            self.base_fps = clock.max_fps
+
+        # Frame rate
+        if self.unfocused_fps is not None or self.battery_fps is not None:
+            self.update_fps(window)
+
+        # Smoothed frame duration
+        if clock.frame_samples == 0:
+            return
+        duration = clock.last_frame_duration
+        self.frame_time += (duration - self.frame_time) * (0.1 if self.frame_time else 1)
+
+        if self.cooldown_frames > 0:
+            self.cooldown_frames -= 1
+            return
+
+        target = self.target
+        if target <= 0:
+            return
+
+        # Count frames outside of the band
+        if self.frame_time > target * self.upper_threshold:
+            self.over_frames += 1
+            self.under_frames = 0
+        elif self.frame_time < target * self.lower_threshold:
+            self.under_frames += 1
+            self.over_frames = 0
+        else:
+            self.over_frames = 0
+            self.under_frames = 0
+
+        # Change the scale
+        if self.over_frames >= self.patience and self.scale > self.min_scale:
+            self.change_scale(window, max(self.min_scale, self.scale - self.step))
+        elif self.under_frames >= self.patience and self.scale < self.max_scale:
+            self.change_scale(window, min(self.max_scale, self.scale + self.step))
+
+    def change_scale(self, window: Window, scale: float) -> None:
+        """Apply a new render scale and start the cooldown"""
+
+        self.decisions.append(f"{time.time_f_hms()} scale {self.scale:.0%} -> {scale:.0%} "
+                              f"({self.frame_time * 1000:.2f} / {self.target * 1000:.2f} ms)")
+        window.logger.debug(f"Frame controller: {self.decisions[-1]}")
+        self.scale = scale
+        self.over_frames = 0
+        self.under_frames = 0
+        self.cooldown_frames = self.cooldown
+        window.set_render_scale(scale, self.smooth)
+
+    def update_fps(self, window: Window) -> None:
+        """Lower the maximum FPS while unfocused or on battery"""
+
+        now = time.bench_time()
+        if now - self.last_battery_check > 2:
+            self.battery = self.battery_fps is not None and on_battery()
+            self.last_battery_check = now
+
+        if self.unfocused_fps is not None and not pg.key.get_focused():
+            reason, fps = "unfocused", self.unfocused_fps
+        elif self.battery:
+            reason, fps = "battery", self.battery_fps
+        else:
+            reason, fps = "normal", self.base_fps
+
+        if reason != self.fps_reason:
+            self.decisions.append(f"{time.time_f_hms()} fps {window.clock.max_fps} -> {fps} ({reason})")
+            window.logger.debug(f"Frame controller: {self.decisions[-1]}")
+            self.fps_reason = reason
+            window.clock.max_fps = fps
+
+    # OVERLOADS
+
+    def __repr__(self) -> str:
+        return f"FrameController[id={id(self)}, scale={self.scale}, target={self.target}, fps_reason={self.fps_reason}]"
+
+
+def on_battery() -> bool:
+    """Check if the system runs on battery (pygame-ce power state or psutil, false if unknown)"""
+
+    system = getattr(pg, "system", None)
+    if system is not None and hasattr(system, "get_power_state"):
+        state = system.get_power_state()
+        return state is not None and state.on_battery
+
+    if psutil is not None:
+        battery = psutil.sensors_battery()
+        return battery is not None and not battery.power_plugged
+
+    return False
@@ -0,0 +1,248 @@
+"""Contains the frame statistic graph classes for the debug screen"""
+
+# Standard modules
+from collections import deque
+import bisect
+
+# External modules
+import pygame as pg
+
+# Local modules
+from .rgb import RGBColor, RGB
+
+
+class FrameGraph:
+    """Base class of frame statistic graphs
+
+    The graph surface is allocated once in the display format. Scrolling graphs move the surface one column
+    to the left per update and only draw the new column, the whole graph is only redrawn if the value range changes.
+    The value range is fixed or twice the target frame time of the clock (1/30 s without limit)
+    """
+
+    scrolling: bool = True
+
+    def __init__(self, width: int = 240, height: int = 60, value_range: float = None,
+                 bg_color: RGBColor = RGB.BLACK, target_color: RGBColor = RGB.GRAY40) -> None:
+
+        self.width: int = width
+        self.height: int = height
+        self.value_range: float | None = value_range
+        self.bg_color: RGBColor = bg_color
+        self.target_color: RGBColor = target_color
+        self.surface: pg.Surface | None = None
+
+        # Current scale (seconds at the top of the graph and target frame time)
+        self.range: float = 0
+        self.target: float = 0
+
+        # Sampled values from the oldest to the newest (one per column)
+        self.values: deque = deque(maxlen=width)
+
+    # METHODS
+
+    def prepare(self) -> pg.Surface:
+        """Get the graph surface (only allocated once)"""
+
+        if self.surface is None:
+            surface = pg.Surface((self.width, self.height))
+            if pg.display.get_surface() is not None:
+                surface = surface.convert()
+            self.surface = surface
+            self.range = 0
+        return self.surface
+
+    def update(self, window) -> pg.Surface:
+        """Sample the window statistics and draw them
+
+        *Called by the debug screen every frame for scrolling graphs, else on every refresh*
+        """
+
+        surface = self.prepare()
+        self.sample(window)
+
+        max_fps = window.clock.max_fps
+        self.target = 1 / max_fps if max_fps > 0 else 0
+        value_range = self.value_range if self.value_range is not None else (2 * self.target or 1 / 30)
+
+        if value_range != self.range or not self.scrolling:
+            self.range = value_range
+            surface.fill(self.bg_color)
+            self.redraw()
+        else:
+            surface.scroll(-1, 0)
+            surface.fill(self.bg_color, (self.width - 1, 0, 1, self.height))
+            self.draw_column(self.width - 1, len(self.values) - 1)
+
+        return surface
+
+    def scale(self, value: float) -> int:
+        """Get the height in pixels of a value (clamped to the graph height)"""
+
+        return min(self.height, int(value / self.range * self.height + 0.5))
+
+    def redraw(self) -> None:
+        """Draw all sampled values (right aligned)"""
+
+        offset = self.width - len(self.values)
+        for index in range(len(self.values)):
+            self.draw_column(offset + index, index)
+
+    # ABSTRACT METHODS
+
+    def sample(self, window) -> None:
+        """Sample tasks
+
+        *Called on every update before drawing -
+        Don't call this method manually*
+        """
+
+        pass
+
+    def draw_column(self, x: int, index: int) -> None:
+        """Draw tasks of a single column
+
+        *Called for the new column on every update and for all columns on a redraw -
+        Don't call this method manually*
+        """
+
+        pass
+
+    # OVERLOADS
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}[id={id(self)}, size={self.width}x{self.height}, range={self.range}]"
+
+
+class FrameTimeGraph(FrameGraph):
+    """Scrolling line graph of the frame durations
+
+    Seeded with the frame history of the clock. Frames over the target frame time are drawn in the warning color
+    """
+
+    def __init__(self, width: int = 240, height: int = 60, value_range: float = None,
+                 color: RGBColor = RGB.WHITE, warning_color: RGBColor = RGB.RED1,
+                 bg_color: RGBColor = RGB.BLACK, target_color: RGBColor = RGB.GRAY40) -> None:
+
+        super(FrameTimeGraph, self).__init__(width, height, value_range, bg_color, target_color)
+
+        self.color: RGBColor = color
+        self.warning_color: RGBColor = warning_color
+
+    def sample(self, window) -> None:
+
+        if not self.values:
+            self.values.extend(window.clock.ordered_durations()[-self.width:])
+        else:
+            self.values.append(window.clock.last_frame_duration)
+
+    def draw_column(self, x: int, index: int) -> None:
+
+        if index < 0:
+            return
+
+        value = self.values[index]
+        previous = self.values[index - 1] if index > 0 else value
+        bottom = self.height - 1
+
+        if self.target:
+            self.surface.set_at((x, bottom - self.scale(self.target)), self.target_color)
+
+        color = self.warning_color if self.target and value > self.target else self.color
+        pg.draw.line(self.surface, color, (x, bottom - self.scale(previous)), (x, bottom - self.scale(value)))
+
+
+class PhaseGraph(FrameGraph):
+    """Scrolling stacked bar graph of the frame phases (event, update, render and late update)
+
+    The update phase contains the early and fixed updates, in threaded update mode the wait for the update thread
+    """
+
+    def __init__(self, width: int = 240, height: int = 60, value_range: float = None,
+                 colors: tuple[RGBColor, RGBColor, RGBColor, RGBColor] = (RGB.DODGERBLUE1, RGB.LIMEGREEN,
+                                                                          RGB.ORANGE, RGB.ORCHID),
+                 bg_color: RGBColor = RGB.BLACK, target_color: RGBColor = RGB.GRAY40) -> None:
+
+        super(PhaseGraph, self).__init__(width, height, value_range, bg_color, target_color)
+
+        self.colors: tuple[RGBColor, RGBColor, RGBColor, RGBColor] = colors
+
+    def sample(self, window) -> None:
+
+        if window.threaded_update:
+            update = window.stat_e_update_time + window.stat_update_wait_time
+        else:
+            update = window.stat_e_update_time + window.stat_update_time
+            if window.fixed_timestep > 0:
+                update += window.stat_fixed_update_time
+
+        self.values.append((window.stat_event_time, update, window.stat_render_time, window.stat_l_update_time))
+
+    def draw_column(self, x: int, index: int) -> None:
+
+        if index < 0:
+            return
+
+        y = self.height
+        for value, color in zip(self.values[index], self.colors):
+            height = min(y, self.scale(value))
+            if height > 0:
+                y -= height
+                self.surface.fill(color, (x, y, 1, height))
+
+        if self.target:
+            self.surface.set_at((x, self.height - 1 - self.scale(self.target)), self.target_color)
+
+
+class FrameHistogram(FrameGraph):
+    """Histogram of the frame durations in the history of the clock
+
+    Counts the bins from the sorted frame durations of the clock (the last bin contains all slower frames).
+    Bins over the target frame time are drawn in the warning color
+    """
+
+    scrolling: bool = False
+
+    def __init__(self, width: int = 240, height: int = 60, value_range: float = None, bins: int = 30,
+                 color: RGBColor = RGB.WHITE, warning_color: RGBColor = RGB.RED1,
+                 bg_color: RGBColor = RGB.BLACK, target_color: RGBColor = RGB.GRAY40) -> None:
+
+        super(FrameHistogram, self).__init__(width, height, value_range, bg_color, target_color)
+
+        if bins < 1:
+            raise ValueError("The histogram needs at least one bin!")
+        self.bins: int = bins
+        self.color: RGBColor = color
+        self.warning_color: RGBColor = warning_color
+        self.durations: list[float] = []
+
+    def sample(self, window) -> None:
+
+        self.durations = window.clock.sorted_durations
+
+    def redraw(self) -> None:
+
+        durations = self.durations
+        bin_width = self.range / self.bins
+        counts = []
+        start = 0
+        for index in range(1, self.bins):
+            end = bisect.bisect_left(durations, index * bin_width, start)
+            counts.append(end - start)
+            start = end
+        counts.append(len(durations) - start)
+
+        most = max(counts)
+        if most == 0:
+            return
+
+        bar_width = max(1, self.width // self.bins)
+        for index, count in enumerate(counts):
+            if count == 0:
+                continue
+            height = max(1, int(count / most * self.height + 0.5))
+            color = self.warning_color if self.target and index * bin_width >= self.target else self.color
+            self.surface.fill(color, (index * bar_width, self.height - height, max(1, bar_width - 1), height))
+
+        if self.target:
+            x = min(self.width - 1, int(self.target / bin_width * bar_width))
+            pg.draw.line(self.surface, self.target_color, (x, 0), (x, self.height - 1))
@@ -0,0 +1,134 @@
+"""Contains the garbage collector manager class for per-frame collection control"""
+
+# Standard modules
+import gc
+
+# Local modules
+from ..utils import time
+
+
+class GCManager:
+    """Garbage collector manager class
+
+    Disables the automatic collection of the oldest generation (the long hitches), runs it instead in the slack time
+    at the end of a frame if the expected pause fits in the time budget and freezes the objects of a scene after
+    its initialization, so they are not traversed by later collections.
+    Records the pauses of all collections through gc.callbacks (the collection while loading a scene is only counted)
+    """
+
+    def __init__(self, budget: float = 0.004, force_factor: int = 10, freeze: bool = True) -> None:
+
+        # Control
+        self.budget: float = budget
+        self.force_factor: int = force_factor
+        self.freeze: bool = freeze
+        self.installed: bool = False
+        self.loading: bool = False
+        self.thresholds: tuple[int, int, int] = gc.get_threshold()
+
+        # Statistics
+        self.collection_start: float = 0
+        self.collections: list[int] = [0, 0, 0]
+        self.pause_times: list[float] = [0, 0, 0]
+        self.gen2_estimate: float = 0
+        self.last_pause: float = 0
+        self.max_pause: float = 0
+        self.frame_pause: float = 0
+        self.stat_frame_pause: float = 0
+        self.stat_slack_collections: int = 0
+        self.stat_forced_collections: int = 0
+
+    # METHODS
+
+    def install(self) -> None:
+        """Disable the automatic collection of the oldest generation and start recording
+
+        *Called by the window when it is opened*
+        """
+
+        if self.installed:
+            return
+        self.thresholds = gc.get_threshold()
+        gc.set_threshold(self.thresholds[0], self.thresholds[1], 1 << 30)
+        gc.callbacks.append(self.callback)
+        self.installed = True
+
+    def uninstall(self) -> None:
+        """Restore the automatic collection and stop recording
+
+        *Called by the window when it is closed*
+        """
+
+        if not self.installed:
+            return
+        gc.set_threshold(*self.thresholds)
+        gc.callbacks.remove(self.callback)
+        gc.unfreeze()
+        self.installed = False
+
+    def scene_loaded(self) -> None:
+        """Release the frozen objects of the last scene, collect and freeze the objects of the new scene
+
+        *Called by the window after the scene initialization (the screen is black in a transition)*
+        """
+
+        if self.freeze:
+            self.loading = True
+            gc.unfreeze()
+            gc.collect()
+            gc.freeze()
+            self.loading = False
+            # The frozen objects are not traversed anymore, so the pause of the full collection is no estimate
+            self.gen2_estimate = 0
+
+    def end_frame(self, slack: float) -> None:
+        """Collect the oldest generation if it is due and the expected pause fits in the slack time and budget
+
+        *Called by the window at the end of every frame -
+        Collects anyway if collections are overdue by the force factor, so memory does not grow unbounded*
+        """
+
+        pending = gc.get_count()[2]
+        threshold = max(1, self.thresholds[2])
+
+        if pending >= threshold * self.force_factor:
+            self.stat_forced_collections += 1
+            gc.collect(2)
+        elif pending >= threshold and self.gen2_estimate <= min(slack, self.budget):
+            self.stat_slack_collections += 1
+            gc.collect(2)
+
+        self.stat_frame_pause = self.frame_pause
+        self.frame_pause = 0
+
+    def callback(self, phase: str, info: dict) -> None:
+        """Record the pause of a collection
+
+        *Called by the garbage collector before and after every collection*
+        """
+
+        if phase == "start":
+            self.collection_start = time.bench_time()
+            return
+
+        pause = time.bench_time() - self.collection_start
+        generation = info["generation"]
+        self.collections[generation] += 1
+        self.pause_times[generation] += pause
+        if self.loading:
+            return
+        self.last_pause = pause
+        self.max_pause = max(self.max_pause, pause)
+        self.frame_pause += pause
+        if generation == 2:
+            self.gen2_estimate += (pause - self.gen2_estimate) * (0.3 if self.gen2_estimate else 1)
+
+        profiler = time.get_profiler()
+        if profiler is not None and profiler.enabled:
+            duration = int(pause * 1_000_000_000)
+            profiler.record(f"GC gen{generation}", time.bench_time_ns() - duration, duration, "gc")
+
+    # OVERLOADS
+
+    def __repr__(self) -> str:
+        return f"GCManager[id={id(self)}, collections={self.collections}, max_pause={self.max_pause}, installed={self.installed}]"
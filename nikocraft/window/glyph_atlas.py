@@ -0,0 +1,117 @@
+"""Contains the glyph atlas class for rendering changing text"""
+
+# External modules
+import pygame as pg
+
+
+class GlyphAtlas:
+    """Glyph atlas class for rendering changing text (numbers, timings, labels) without a surface per text
+
+    Rasterizes every glyph once into a single atlas surface and composes strings with one Surface.blits call
+    from the cached glyph areas. Glyphs are placed by their advance, so kerning is not applied.
+    Opt-in, as Font.render caches glyphs itself: the atlas is about as fast with an opaque background
+    and slower with per pixel alpha, but allocates nothing per text (see benchmarks/text_render.py)
+    """
+
+    def __init__(self, font: pg.font.Font, color: tuple, bg_color: tuple = None, antialias: bool = True,
+                 width: int = 512) -> None:
+
+        self.font: pg.font.Font = font
+        self.color: tuple = color
+        self.bg_color: tuple = bg_color
+        self.antialias: bool = antialias
+        self.height: int = font.get_height()
+
+        # Atlas surface with the glyphs packed in rows
+        self.surface: pg.Surface = self.allocate(width, self.height)
+        self.cursor_x: int = 0
+        self.cursor_y: int = 0
+
+        # Glyph areas in the atlas by character
+        self.glyphs: dict[str, pg.Rect] = {}
+
+    # METHODS
+
+    def allocate(self, width: int, height: int) -> pg.Surface:
+        """Create an atlas surface in the display format"""
+
+        if self.bg_color is not None:
+            surface = pg.Surface((width, height))
+            surface.fill(self.bg_color)
+            return surface.convert() if pg.display.get_surface() is not None else surface
+
+        surface = pg.Surface((width, height), pg.SRCALPHA)
+        return surface.convert_alpha() if pg.display.get_surface() is not None else surface
+
+    def add(self, character: str) -> pg.Rect:
+        """Rasterize a glyph into the atlas (the atlas grows in height when full)"""
+
+        glyph = self.font.render(character, self.antialias, self.color, self.bg_color)
+        width = glyph.get_width()
+        atlas_width, atlas_height = self.surface.get_size()
+
+        # Next row
+        if self.cursor_x + width > atlas_width:
+            self.cursor_x = 0
+            self.cursor_y += self.height
+
+        # Grow
+        if self.cursor_y + self.height > atlas_height or width > atlas_width:
+            surface = self.allocate(max(atlas_width, width), atlas_height * 2)
+            surface.blit(self.surface, (0, 0))
+            self.surface = surface
+
+        area = pg.Rect(self.cursor_x, self.cursor_y, width, self.height)
+        self.surface.blit(glyph, area)
+        self.cursor_x += width
+        self.glyphs[character] = area
+        return area
+
+    def prepare(self, characters: str) -> None:
+        """Rasterize glyphs in advance (for example digits and punctuation)"""
+
+        for character in characters:
+            if character not in self.glyphs:
+                self.add(character)
+
+    def size(self, text: str) -> tuple[int, int]:
+        """Get the size of a text rendered with the atlas"""
+
+        glyphs = self.glyphs
+        width = 0
+        for character in text:
+            area = glyphs.get(character)
+            if area is None:
+                area = self.add(character)
+            width += area.w
+        return width, self.height
+
+    def render(self, target: pg.Surface, text: str, position: tuple[int, int]) -> pg.Rect:
+        """Draw a text to a surface with a single blits call and return the covered area"""
+
+        glyphs = self.glyphs
+        atlas = self.surface
+        x, y = position
+        start = x
+        sequence = []
+        append = sequence.append
+
+        for character in text:
+            area = glyphs.get(character)
+            if area is None:
+                area = self.add(character)
+                if self.surface is not atlas:
+                    # The atlas has grown, so the glyphs before are in the new surface now
+                    atlas = self.surface
+                    sequence = [(atlas, dest, glyph) for _, dest, glyph in sequence]
+                    append = sequence.append
+            append((atlas, (x, y), area))
+            x += area.w
+
+        target.blits(sequence, False)
+        return pg.Rect(start, y, x - start, self.height)
+
+    # OVERLOADS
+
+    def __repr__(self) -> str:
+        return f"GlyphAtlas[id={id(self)}, glyphs={len(self.glyphs)}, size={self.surface.get_size()}]"
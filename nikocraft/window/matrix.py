@@ -0,0 +1,223 @@
+"""Contains the 3x3 and 4x4 matrix classes for 3D transforms
+
+Matrices are stored row by row and transform column vectors (M @ v)
+"""
+
+# Standard modules
+from typing import Union, Self, Iterable
+import math
+
+# Local modules
+from .vector2d import Vec
+from .vector2d_array import VecArray
+from .vector3d import Vec3
+from .vector3d_array import Vec3Array
+
+
+class Mat3(tuple):
+    """3x3 matrix class (linear transforms like rotating and scaling)"""
+
+    def __new__(cls, values: Iterable[Union[int, float]] = (1, 0, 0, 0, 1, 0, 0, 0, 1)) -> Self:
+        values = tuple.__new__(cls, values)
+        if len(values) != 9:
+            raise ValueError(f"A 3x3 matrix requires 9 values, got {len(values)}!")
+        return values
+
+    # CLASS METHODS
+
+    @classmethod
+    def identity(cls) -> Self:
+        """Create an identity matrix"""
+        return Mat3()
+
+    @classmethod
+    def scale(cls, factor: Union[int, float, tuple[Union[int, float], Union[int, float], Union[int, float]]]) -> Self:
+        """Create a scaling matrix (uniform factor or a factor per axis)"""
+        x, y, z = (factor, factor, factor) if isinstance(factor, (int, float)) else factor
+        return Mat3((x, 0, 0, 0, y, 0, 0, 0, z))
+
+    @classmethod
+    def rotation_x(cls, angle: float) -> Self:
+        """Create a rotation matrix around the x-axis (angle in radians)"""
+        c, s = math.cos(angle), math.sin(angle)
+        return Mat3((1, 0, 0, 0, c, -s, 0, s, c))
+
+    @classmethod
+    def rotation_y(cls, angle: float) -> Self:
+        """Create a rotation matrix around the y-axis (angle in radians)"""
+        c, s = math.cos(angle), math.sin(angle)
+        return Mat3((c, 0, s, 0, 1, 0, -s, 0, c))
+
+    @classmethod
+    def rotation_z(cls, angle: float) -> Self:
+        """Create a rotation matrix around the z-axis (angle in radians)"""
+        c, s = math.cos(angle), math.sin(angle)
+        return Mat3((c, -s, 0, s, c, 0, 0, 0, 1))
+
+    @classmethod
+    def rotation(cls, axis: Vec3, angle: float) -> Self:
+        """Create a rotation matrix around an arbitrary axis (angle in radians)"""
+        length = math.sqrt(axis[0] * axis[0] + axis[1] * axis[1] + axis[2] * axis[2])
+        x, y, z = axis[0] / length, axis[1] / length, axis[2] / length
+        c, s = math.cos(angle), math.sin(angle)
+        t = 1 - c
+        return Mat3((t * x * x + c, t * x * y - s * z, t * x * z + s * y,
+                     t * x * y + s * z, t * y * y + c, t * y * z - s * x,
+                     t * x * z - s * y, t * y * z + s * x, t * z * z + c))
+
+    # PROPERTIES
+
+    @property
+    def rows(self) -> tuple[Vec3, Vec3, Vec3]:
+        return Vec3(*self[0:3]), Vec3(*self[3:6]), Vec3(*self[6:9])
+
+    @property
+    def determinant(self) -> float:
+        a, b, c, d, e, f, g, h, i = self
+        return a * (e * i - f * h) - b * (d * i - f * g) + c * (d * h - e * g)
+
+    # METHODS
+
+    def transpose(self) -> Self:
+        """Get the transposed matrix"""
+        return Mat3(self[i + j] for j in range(3) for i in range(0, 9, 3))
+
+    def inverse(self) -> Self:
+        """Get the inverse matrix"""
+        a, b, c, d, e, f, g, h, i = self
+        determinant = self.determinant
+        if determinant == 0:
+            raise ValueError("Cannot invert a singular matrix!")
+        return Mat3(value / determinant for value in (e * i - f * h, c * h - b * i, b * f - c * e,
+                                                      f * g - d * i, a * i - c * g, c * d - a * f,
+                                                      d * h - e * g, b * g - a * h, a * e - b * d))
+
+    def mat4(self) -> "Mat4":
+        """Create a 4x4 matrix with this matrix as linear part"""
+        return Mat4((*self[0:3], 0, *self[3:6], 0, *self[6:9], 0, 0, 0, 0, 1))
+
+    # OVERLOADS
+
+    def __matmul__(self, other: Union[Self, Vec3, Vec3Array]) -> Union[Self, Vec3, Vec3Array]:
+        if isinstance(other, Vec3Array):
+            return other.transform(self)
+        if isinstance(other, Mat3):
+            return Mat3(sum(self[r + k] * other[k * 3 + c] for k in range(3)) for r in range(0, 9, 3) for c in range(3))
+        x, y, z = other[0], other[1], other[2]
+        return Vec3(self[0] * x + self[1] * y + self[2] * z,
+                    self[3] * x + self[4] * y + self[5] * z,
+                    self[6] * x + self[7] * y + self[8] * z)
+
+    def __repr__(self) -> str:
+        return f"Mat3[id={id(self)}, rows={[list(row) for row in self.rows]}]"
+
+    def __str__(self) -> str:
+        return "\n".join(str(row) for row in self.rows)
+
+
+class Mat4(tuple):
+    """4x4 matrix class (affine and projective transforms)"""
+
+    def __new__(cls, values: Iterable[Union[int, float]] = (1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1)) -> Self:
+        values = tuple.__new__(cls, values)
+        if len(values) != 16:
+            raise ValueError(f"A 4x4 matrix requires 16 values, got {len(values)}!")
+        return values
+
+    # CLASS METHODS
+
+    @classmethod
+    def identity(cls) -> Self:
+        """Create an identity matrix"""
+        return Mat4()
+
+    @classmethod
+    def translation(cls, offset: Vec3) -> Self:
+        """Create a translation matrix"""
+        return Mat4((1, 0, 0, offset[0], 0, 1, 0, offset[1], 0, 0, 1, offset[2], 0, 0, 0, 1))
+
+    @classmethod
+    def scale(cls, factor: Union[int, float, tuple[Union[int, float], Union[int, float], Union[int, float]]]) -> Self:
+        """Create a scaling matrix (uniform factor or a factor per axis)"""
+        return Mat3.scale(factor).mat4()
+
+    @classmethod
+    def perspective(cls, fov: float, aspect: float, near: float, far: float) -> Self:
+        """Create a perspective projection matrix (vertical field of view in radians, camera looks along -z)"""
+        f = 1 / math.tan(fov / 2)
+        return Mat4((f / aspect, 0, 0, 0,
+                     0, f, 0, 0,
+                     0, 0, (far + near) / (near - far), 2 * far * near / (near - far),
+                     0, 0, -1, 0))
+
+    @classmethod
+    def orthographic(cls, left: float, right: float, bottom: float, top: float, near: float, far: float) -> Self:
+        """Create an orthographic projection matrix"""
+        return Mat4((2 / (right - left), 0, 0, -(right + left) / (right - left),
+                     0, 2 / (top - bottom), 0, -(top + bottom) / (top - bottom),
+                     0, 0, -2 / (far - near), -(far + near) / (far - near),
+                     0, 0, 0, 1))
+
+    @classmethod
+    def look_at(cls, eye: Vec3, target: Vec3, up: Vec3 = Vec3(0, 1, 0)) -> Self:
+        """Create a view matrix of a camera at eye looking at target"""
+
+        fx, fy, fz = target[0] - eye[0], target[1] - eye[1], target[2] - eye[2]
+        length = math.sqrt(fx * fx + fy * fy + fz * fz)
+        fx, fy, fz = fx / length, fy / length, fz / length
+
+        sx, sy, sz = fy * up[2] - fz * up[1], fz * up[0] - fx * up[2], fx * up[1] - fy * up[0]
+        length = math.sqrt(sx * sx + sy * sy + sz * sz)
+        sx, sy, sz = sx / length, sy / length, sz / length
+
+        ux, uy, uz = sy * fz - sz * fy, sz * fx - sx * fz, sx * fy - sy * fx
+
+        return Mat4((sx, sy, sz, -(sx * eye[0] + sy * eye[1] + sz * eye[2]),
+                     ux, uy, uz, -(ux * eye[0] + uy * eye[1] + uz * eye[2]),
+                     -fx, -fy, -fz, fx * eye[0] + fy * eye[1] + fz * eye[2],
+                     0, 0, 0, 1))
+
+    # PROPERTIES
+
+    @property
+    def rows(self) -> tuple[tuple[float, ...], ...]:
+        return self[0:4], self[4:8], self[8:12], self[12:16]
+
+    @property
+    def mat3(self) -> Mat3:
+        return Mat3((*self[0:3], *self[4:7], *self[8:11]))
+
+    # METHODS
+
+    def transpose(self) -> Self:
+        """Get the transposed matrix"""
+        return Mat4(self[i + j] for j in range(4) for i in range(0, 16, 4))
+
+    def project(self, vectors: Union[Vec3, Vec3Array], dimension: Vec) -> Union[Vec, VecArray]:
+        """Project vectors with this matrix to screen coordinates of a specific dimension"""
+        if isinstance(vectors, Vec3Array):
+            return vectors.project(self, dimension)
+        x, y, z = vectors[0], vectors[1], vectors[2]
+        w = self[12] * x + self[13] * y + self[14] * z + self[15]
+        if w == 0:
+            return Vec(dimension[0] / 2, dimension[1] / 2)
+        return Vec((1 + (self[0] * x + self[1] * y + self[2] * z + self[3]) / w) * dimension[0] / 2,
+                   (1 - (self[4] * x + self[5] * y + self[6] * z + self[7]) / w) * dimension[1] / 2)
+
+    # OVERLOADS
+
+    def __matmul__(self, other: Union[Self, Vec3, Vec3Array]) -> Union[Self, Vec3, Vec3Array]:
+        if isinstance(other, Vec3Array):
+            return other.transform(self)
+        if isinstance(other, Mat4):
+            return Mat4(sum(self[r + k] * other[k * 4 + c] for k in range(4)) for r in range(0, 16, 4) for c in range(4))
+        x, y, z = other[0], other[1], other[2]
+        return Vec3(self[0] * x + self[1] * y + self[2] * z + self[3],
+                    self[4] * x + self[5] * y + self[6] * z + self[7],
+                    self[8] * x + self[9] * y + self[10] * z + self[11])
+
+    def __repr__(self) -> str:
+        return f"Mat4[id={id(self)}, rows={[list(row) for row in self.rows]}]"
+
+    def __str__(self) -> str:
+        return "\n".join(str(row) for row in self.rows)
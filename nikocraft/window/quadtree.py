@@ -0,0 +1,572 @@
+"""Contains the quadtree classes for spatial queries on Vec-positioned objects
+
+QuadTree is an adaptive tree for dynamic objects (insert, remove and move),
+StaticQuadTree is a linear (Z-order) tree rebuilt in one pass from a whole VecArray buffer
+"""
+
+# Standard modules
+from typing import Hashable, Iterator, Union, Any
+from array import array
+import bisect
+import heapq
+import math
+
+# External modules
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Local modules
+from .vector2d import Vec
+from .vector2d_array import VecArray
+
+
+class _QuadNode:
+    """Node of a quadtree"""
+
+    __slots__ = ("x0", "y0", "x1", "y1", "depth", "parent", "children", "items")
+
+    def __init__(self) -> None:
+
+        self.x0: float = 0
+        self.y0: float = 0
+        self.x1: float = 0
+        self.y1: float = 0
+        self.depth: int = 0
+        self.parent: _QuadNode | None = None
+        self.children: tuple[_QuadNode, _QuadNode, _QuadNode, _QuadNode] | None = None
+        self.items: dict[Hashable, Vec] = {}
+
+    def distance_squared(self, x: float, y: float) -> float:
+        """Calculate the squared distance of a point to the bounds of the node"""
+        dx = self.x0 - x if x < self.x0 else x - self.x1 if x > self.x1 else 0
+        dy = self.y0 - y if y < self.y0 else y - self.y1 if y > self.y1 else 0
+        return dx * dx + dy * dy
+
+
+class QuadTree:
+    """Adaptive quadtree class for dynamic objects
+
+    Leaves split when they hold more than capacity objects and merge again when their objects are removed.
+    Nodes are pooled and reused, so splitting and merging does not allocate new nodes in the steady state
+    """
+
+    def __init__(self, minimum: Vec, maximum: Vec, capacity: int = 16, max_depth: int = 12) -> None:
+
+        if maximum[0] <= minimum[0] or maximum[1] <= minimum[1]:
+            raise ValueError("The maximum of a quadtree must be greater than the minimum!")
+
+        self.minimum: Vec = Vec(minimum[0], minimum[1])
+        self.maximum: Vec = Vec(maximum[0], maximum[1])
+        self.capacity: int = capacity
+        self.max_depth: int = max_depth
+
+        self.leaves: dict[Hashable, _QuadNode] = {}
+        self._pool: list[_QuadNode] = []
+        self.root: _QuadNode = self._node(minimum[0], minimum[1], maximum[0], maximum[1], 0, None)
+
+    # METHODS
+
+    def insert(self, obj: Hashable, position: Vec) -> None:
+        """Insert an object at a position (moves the object, if already inserted)"""
+
+        if obj in self.leaves:
+            self.move(obj, position)
+            return
+
+        x, y = position[0], position[1]
+        root = self.root
+        if not (root.x0 <= x <= root.x1 and root.y0 <= y <= root.y1):
+            raise ValueError(f"Position {position} is outside of the quadtree bounds!")
+
+        node = root
+        while node.children is not None:
+            node = node.children[(y >= (node.y0 + node.y1) / 2) * 2 + (x >= (node.x0 + node.x1) / 2)]
+        node.items[obj] = position
+        self.leaves[obj] = node
+
+        if len(node.items) > self.capacity and node.depth < self.max_depth:
+            self._split(node)
+
+    def remove(self, obj: Hashable) -> bool:
+        """Remove an object"""
+
+        node = self.leaves.pop(obj, None)
+        if node is None:
+            return False
+
+        del node.items[obj]
+        self._merge(node.parent)
+        return True
+
+    def move(self, obj: Hashable, position: Vec) -> None:
+        """Move an object to a new position (stays in its leaf, if the position is still inside)"""
+
+        node = self.leaves[obj]
+        if node.x0 <= position[0] <= node.x1 and node.y0 <= position[1] <= node.y1:
+            node.items[obj] = position
+            return
+
+        root = self.root
+        if not (root.x0 <= position[0] <= root.x1 and root.y0 <= position[1] <= root.y1):
+            raise ValueError(f"Position {position} is outside of the quadtree bounds!")
+
+        self.remove(obj)
+        self.insert(obj, position)
+
+    def position(self, obj: Hashable) -> Vec:
+        """Get the position of an object"""
+        return self.leaves[obj].items[obj]
+
+    def clear(self) -> None:
+        """Remove all objects"""
+
+        self._release(self.root)
+        self.leaves.clear()
+        self.root = self._node(self.minimum[0], self.minimum[1], self.maximum[0], self.maximum[1], 0, None)
+
+    def query_aabb(self, minimum: Vec, maximum: Vec) -> list[Hashable]:
+        """Get all objects inside an axis aligned bounding box (inclusive)"""
+
+        min_x, min_y, max_x, max_y = minimum[0], minimum[1], maximum[0], maximum[1]
+        result = []
+        stack = [self.root]
+
+        while stack:
+            node = stack.pop()
+            if node.x0 > max_x or node.x1 < min_x or node.y0 > max_y or node.y1 < min_y:
+                continue
+            if node.children is not None:
+                stack.extend(node.children)
+            elif min_x <= node.x0 and node.x1 <= max_x and min_y <= node.y0 and node.y1 <= max_y:
+                result.extend(node.items)
+            else:
+                for obj, position in node.items.items():
+                    if min_x <= position[0] <= max_x and min_y <= position[1] <= max_y:
+                        result.append(obj)
+
+        return result
+
+    def query_radius(self, center: Vec, radius: Union[int, float]) -> list[Hashable]:
+        """Get all objects with a distance lower equals radius to a center"""
+
+        x, y = center[0], center[1]
+        radius_squared = radius * radius
+        result = []
+        stack = [self.root]
+
+        while stack:
+            node = stack.pop()
+            if node.distance_squared(x, y) > radius_squared:
+                continue
+            if node.children is not None:
+                stack.extend(node.children)
+                continue
+            for obj, position in node.items.items():
+                dx, dy = position[0] - x, position[1] - y
+                if dx * dx + dy * dy <= radius_squared:
+                    result.append(obj)
+
+        return result
+
+    def nearest(self, position: Vec, k: int = 1, max_distance: Union[int, float] = math.inf) -> list[Hashable]:
+        """Get the k nearest objects to a position (sorted by distance)"""
+
+        x, y = position[0], position[1]
+        limit = max_distance * max_distance
+        result = []
+        counter = 0
+        heap: list[tuple[float, int, bool, Any]] = [(0, counter, False, self.root)]
+
+        while heap and len(result) < k:
+            distance, _, is_item, entry = heapq.heappop(heap)
+            if distance > limit:
+                break
+            if is_item:
+                result.append(entry)
+                continue
+            if entry.children is not None:
+                for child in entry.children:
+                    counter += 1
+                    heapq.heappush(heap, (child.distance_squared(x, y), counter, False, child))
+                continue
+            for obj, item_position in entry.items.items():
+                dx, dy = item_position[0] - x, item_position[1] - y
+                counter += 1
+                heapq.heappush(heap, (dx * dx + dy * dy, counter, True, obj))
+
+        return result
+
+    def _node(self, x0: float, y0: float, x1: float, y1: float, depth: int, parent: _QuadNode | None) -> _QuadNode:
+        """Get a node from the pool or create a new one"""
+
+        node = self._pool.pop() if self._pool else _QuadNode()
+        node.x0, node.y0, node.x1, node.y1 = x0, y0, x1, y1
+        node.depth = depth
+        node.parent = parent
+        node.children = None
+        return node
+
+    def _release(self, node: _QuadNode) -> None:
+        """Return a node and its subtree to the pool"""
+
+        if node.children is not None:
+            for child in node.children:
+                self._release(child)
+        node.items.clear()
+        node.children = None
+        node.parent = None
+        self._pool.append(node)
+
+    def _split(self, node: _QuadNode) -> None:
+        """Split a leaf into four children and distribute its objects"""
+
+        mx, my = (node.x0 + node.x1) / 2, (node.y0 + node.y1) / 2
+        depth = node.depth + 1
+        node.children = (self._node(node.x0, node.y0, mx, my, depth, node), self._node(mx, node.y0, node.x1, my, depth, node),
+                         self._node(node.x0, my, mx, node.y1, depth, node), self._node(mx, my, node.x1, node.y1, depth, node))
+
+        for obj, position in node.items.items():
+            child = node.children[(position[1] >= my) * 2 + (position[0] >= mx)]
+            child.items[obj] = position
+            self.leaves[obj] = child
+        node.items.clear()
+
+        for child in node.children:
+            if len(child.items) > self.capacity and child.depth < self.max_depth:
+                self._split(child)
+
+    def _merge(self, node: _QuadNode | None) -> None:
+        """Merge the children of a node (and its ancestors) if they fit into a single leaf"""
+
+        while node is not None:
+            if any(child.children is not None for child in node.children):
+                return
+            if sum(len(child.items) for child in node.children) > self.capacity:
+                return
+            for child in node.children:
+                for obj, position in child.items.items():
+                    node.items[obj] = position
+                    self.leaves[obj] = node
+                self._release(child)
+            node.children = None
+            node = node.parent
+
+    # OVERLOADS
+
+    def __len__(self) -> int:
+        return len(self.leaves)
+
+    def __contains__(self, obj: Hashable) -> bool:
+        return obj in self.leaves
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self.leaves)
+
+    def __repr__(self) -> str:
+        return f"QuadTree[id={id(self)}, minimum={self.minimum}, maximum={self.maximum}, objects={len(self.leaves)}]"
+
+
+class StaticQuadTree:
+    """Linear quadtree class for static points, rebuilt in one pass from a VecArray
+
+    The leaf depth is chosen from the number of points, so a leaf holds about capacity points of an even distribution.
+    The points are sorted by the Z-order (Morton) code of their leaf, so every quadtree node is a contiguous range
+    of the sorted buffer, and a table of the start offsets of all leaves is counted instead of searched.
+    The buffers are reused across rebuilds of the same size, so the tree can be rebuilt every frame.
+    Queries return indices into the buffer
+    """
+
+    def __init__(self, minimum: Vec, maximum: Vec, capacity: int = 32, max_depth: int = 12) -> None:
+
+        if maximum[0] <= minimum[0] or maximum[1] <= minimum[1]:
+            raise ValueError("The maximum of a quadtree must be greater than the minimum!")
+        if not 0 < max_depth <= 15:
+            raise ValueError("The maximum depth of a static quadtree must be between 1 and 15!")
+        if capacity < 1:
+            raise ValueError("The capacity of a quadtree must be positive!")
+
+        self.minimum: Vec = Vec(minimum[0], minimum[1])
+        self.maximum: Vec = Vec(maximum[0], maximum[1])
+        self.capacity: int = capacity
+        self.max_depth: int = max_depth
+
+        # Leaf depth and Morton codes of the cell coordinates at that depth (y codes pre-shifted)
+        self.depth: int = 0
+        self._spread_x: Any = None
+        self._spread_y: Any = None
+
+        # Sorted buffers and start offsets of the leaves (leaf code c covers starts[c] to starts[c + 1])
+        self.order: Any = array("q")
+        self.xs: Any = array("d")
+        self.ys: Any = array("d")
+        self.starts: Any = array("q", bytes(8 * 5))
+
+        # Plain Python copies for the node by node search of nearest
+        self._spread_list: list[int] = []
+        self._starts_list: Any = self.starts
+
+        # Sorted points and scratch buffers of the NumPy backend (xs and ys are views of the points)
+        self._points: Any = None
+        self._scaled: Any = None
+        self._cells: Any = None
+        self._codes: Any = None
+        self._codes_y: Any = None
+
+        self._set_depth(1)
+
+    # METHODS
+
+    def rebuild(self, positions: VecArray) -> None:
+        """Rebuild the whole tree from the positions of a vector array
+
+        Points outside the bounds are clamped into the edge leaves (found by range queries, nearest may return them late)
+        """
+
+        size = len(positions)
+        depth = 1
+        while depth < self.max_depth and size > self.capacity << (2 * depth):
+            depth += 1
+        if depth != self.depth:
+            self._set_depth(depth)
+        last = (1 << depth) - 1
+        scale_x = (1 << depth) / (self.maximum[0] - self.minimum[0])
+        scale_y = (1 << depth) / (self.maximum[1] - self.minimum[1])
+
+        if np is not None:
+            data = positions.data
+            if self._scaled is None or len(self._scaled) != size:
+                self._scaled = np.empty(size, dtype=np.float64)
+                self._cells = np.empty(size, dtype=np.intp)
+                self._codes = np.empty(size, dtype=self._spread_x.dtype)
+                self._codes_y = np.empty(size, dtype=self._spread_x.dtype)
+                self._points = np.empty((size, 2), dtype=np.float64)
+                self.xs, self.ys = self._points[:, 0], self._points[:, 1]
+            elif self._codes.dtype != self._spread_x.dtype:
+                self._codes = np.empty(size, dtype=self._spread_x.dtype)
+                self._codes_y = np.empty(size, dtype=self._spread_x.dtype)
+            scaled, cells, codes = self._scaled, self._cells, self._codes
+
+            np.subtract(data[:, 0], self.minimum[0], out=scaled)
+            scaled *= scale_x
+            np.clip(scaled, 0, last, out=scaled)
+            cells[...] = scaled
+            np.take(self._spread_x, cells, out=codes)
+
+            np.subtract(data[:, 1], self.minimum[1], out=scaled)
+            scaled *= scale_y
+            np.clip(scaled, 0, last, out=scaled)
+            cells[...] = scaled
+            np.take(self._spread_y, cells, out=self._codes_y)
+            codes |= self._codes_y
+
+            # Stable sort of 16 bit codes is a radix sort
+            self.order = np.argsort(codes, kind="stable")
+            np.take(data, self.order, axis=0, out=self._points)
+            np.cumsum(np.bincount(codes, minlength=len(self.starts) - 1), out=self.starts[1:])
+            self._starts_list = self.starts.tolist()
+            return
+
+        data = positions.data
+        min_x, min_y = self.minimum[0], self.minimum[1]
+        spread_x, spread_y = self._spread_x, self._spread_y
+        codes = [spread_x[min(max(int((data[i] - min_x) * scale_x), 0), last)]
+                 | spread_y[min(max(int((data[i + 1] - min_y) * scale_y), 0), last)]
+                 for i in range(0, len(data), 2)]
+        order = sorted(range(size), key=codes.__getitem__)
+        self.order = array("q", order)
+        self.xs = array("d", [data[2 * i] for i in order])
+        self.ys = array("d", [data[2 * i + 1] for i in order])
+
+        counts = [0] * len(self.starts)
+        for code in codes:
+            counts[code + 1] += 1
+        total = 0
+        for code, count in enumerate(counts):
+            total += count
+            self.starts[code] = total
+
+    def query_aabb(self, minimum: Vec, maximum: Vec) -> list[int]:
+        """Get the indices of all points inside an axis aligned bounding box (inclusive)"""
+
+        min_x, min_y, max_x, max_y = minimum[0], minimum[1], maximum[0], maximum[1]
+        if min_x > max_x or min_y > max_y:
+            return []
+
+        if np is not None:
+            candidates = self._candidates(min_x, min_y, max_x, max_y)
+            xs, ys = (self.xs, self.ys) if candidates is None else (self.xs[candidates], self.ys[candidates])
+            mask = (xs >= min_x) & (xs <= max_x) & (ys >= min_y) & (ys <= max_y)
+            indices = mask.nonzero()[0] if candidates is None else candidates[mask]
+            return self.order[indices].tolist()
+
+        xs, ys, order = self.xs, self.ys, self.order
+        result = []
+        for lo, hi in self._leaf_ranges(min_x, min_y, max_x, max_y):
+            for i in range(lo, hi):
+                if min_x <= xs[i] <= max_x and min_y <= ys[i] <= max_y:
+                    result.append(order[i])
+        return result
+
+    def query_radius(self, center: Vec, radius: Union[int, float]) -> list[int]:
+        """Get the indices of all points with a distance lower equals radius to a center"""
+
+        x, y = center[0], center[1]
+        if radius < 0:
+            return []
+        radius_squared = radius * radius
+
+        if np is not None:
+            candidates = self._candidates(x - radius, y - radius, x + radius, y + radius)
+            xs, ys = (self.xs, self.ys) if candidates is None else (self.xs[candidates], self.ys[candidates])
+            dx, dy = xs - x, ys - y
+            mask = dx * dx + dy * dy <= radius_squared
+            indices = mask.nonzero()[0] if candidates is None else candidates[mask]
+            return self.order[indices].tolist()
+
+        xs, ys, order = self.xs, self.ys, self.order
+        result = []
+        for lo, hi in self._leaf_ranges(x - radius, y - radius, x + radius, y + radius):
+            for i in range(lo, hi):
+                dx, dy = xs[i] - x, ys[i] - y
+                if dx * dx + dy * dy <= radius_squared:
+                    result.append(order[i])
+        return result
+
+    def nearest(self, position: Vec, k: int = 1, max_distance: Union[int, float] = math.inf) -> list[int]:
+        """Get the indices of the k nearest points to a position (sorted by distance)"""
+
+        x, y = position[0], position[1]
+        limit = max_distance * max_distance
+        width, height = self.maximum[0] - self.minimum[0], self.maximum[1] - self.minimum[1]
+        result = []
+        counter = 0
+        heap: list[tuple[float, int, int, int, int, int]] = [(0, counter, -1, 0, 0, 0)]
+
+        while heap and len(result) < k:
+            distance, _, index, level, cx, cy = heapq.heappop(heap)
+            if distance > limit:
+                break
+            if index >= 0:
+                result.append(index)
+                continue
+
+            lo, hi = self._range(level, cx, cy)
+            if lo == hi:
+                continue
+            if hi - lo <= self.capacity or level == self.depth:
+                if np is not None:
+                    points = zip(self.xs[lo:hi].tolist(), self.ys[lo:hi].tolist(), self.order[lo:hi].tolist())
+                else:
+                    points = zip(self.xs[lo:hi], self.ys[lo:hi], self.order[lo:hi])
+                for point_x, point_y, point in points:
+                    dx, dy = point_x - x, point_y - y
+                    counter += 1
+                    heapq.heappush(heap, (dx * dx + dy * dy, counter, point, 0, 0, 0))
+                continue
+
+            size_x, size_y = width / (1 << (level + 1)), height / (1 << (level + 1))
+            for child_x in (2 * cx, 2 * cx + 1):
+                for child_y in (2 * cy, 2 * cy + 1):
+                    x0, y0 = self.minimum[0] + child_x * size_x, self.minimum[1] + child_y * size_y
+                    dx = x0 - x if x < x0 else x - x0 - size_x if x > x0 + size_x else 0
+                    dy = y0 - y if y < y0 else y - y0 - size_y if y > y0 + size_y else 0
+                    counter += 1
+                    heapq.heappush(heap, (dx * dx + dy * dy, counter, -1, level + 1, child_x, child_y))
+
+        return result
+
+    def _set_depth(self, depth: int) -> None:
+        """Set the leaf depth and allocate the code tables and the start offsets of the leaves"""
+
+        self.depth = depth
+        leaves = 1 << (2 * depth)
+        if np is not None:
+            spread = self._spread_numpy(np.arange(1 << depth, dtype=np.uint64))
+            dtype = np.uint16 if depth <= 8 else np.uint32
+            self._spread_x = spread.astype(dtype)
+            self._spread_y = (spread << np.uint64(1)).astype(dtype)
+            self.starts = np.zeros(leaves + 1, dtype=np.intp)
+            self._starts_list = self.starts.tolist()
+        else:
+            self._spread_x = [self._spread(value) for value in range(1 << depth)]
+            self._spread_y = [value << 1 for value in self._spread_x]
+            self.starts = array("q", bytes(8 * (leaves + 1)))
+            self._starts_list = self.starts
+        self._spread_list = [self._spread(value) for value in range(1 << depth)]
+
+    def _cell_range(self, min_x: float, min_y: float, max_x: float, max_y: float) -> tuple[int, int, int, int]:
+        """Get the leaf coordinates of a region (clamped to the tree)"""
+
+        last = (1 << self.depth) - 1
+        scale_x = (1 << self.depth) / (self.maximum[0] - self.minimum[0])
+        scale_y = (1 << self.depth) / (self.maximum[1] - self.minimum[1])
+        return (min(max(int((min_x - self.minimum[0]) * scale_x), 0), last),
+                min(max(int((min_y - self.minimum[1]) * scale_y), 0), last),
+                min(max(int((max_x - self.minimum[0]) * scale_x), 0), last),
+                min(max(int((max_y - self.minimum[1]) * scale_y), 0), last))
+
+    def _candidates(self, min_x: float, min_y: float, max_x: float, max_y: float) -> Any:
+        """Get the sorted buffer positions of all points in the leaves of a region (None if it is most of the buffer)"""
+
+        cx0, cy0, cx1, cy1 = self._cell_range(min_x, min_y, max_x, max_y)
+        codes = self._spread_y[cy0:cy1 + 1, None] | self._spread_x[None, cx0:cx1 + 1]
+        lo = self.starts[codes.ravel()]
+        hi = self.starts[codes.ravel() + 1]
+        lengths = hi - lo
+        total = int(lengths.sum())
+        if total * 2 > len(self.xs):
+            return None
+
+        # Concatenate the ranges without a Python loop
+        offsets = np.cumsum(lengths) - lengths
+        return np.arange(total) + np.repeat(lo - offsets, lengths)
+
+    def _leaf_ranges(self, min_x: float, min_y: float, max_x: float, max_y: float) -> Iterator[tuple[int, int]]:
+        """Iterate the ranges of the sorted buffer of all leaves of a region"""
+
+        cx0, cy0, cx1, cy1 = self._cell_range(min_x, min_y, max_x, max_y)
+        spread_x, spread_y, starts = self._spread_x, self._spread_y, self.starts
+        for cy in range(cy0, cy1 + 1):
+            code_y = spread_y[cy]
+            for cx in range(cx0, cx1 + 1):
+                code = code_y | spread_x[cx]
+                yield starts[code], starts[code + 1]
+
+    def _range(self, level: int, cx: int, cy: int) -> tuple[int, int]:
+        """Get the range of the sorted buffer covered by a node"""
+
+        shift = 2 * (self.depth - level)
+        code = self._spread_list[cx] | self._spread_list[cy] << 1
+        return self._starts_list[code << shift], self._starts_list[(code + 1) << shift]
+
+    # STATIC METHODS
+
+    @staticmethod
+    def _spread(value: int) -> int:
+        """Spread the bits of a cell coordinate to every second bit (Morton code)"""
+        value &= 0xFFFFFFFF
+        value = (value | (value << 16)) & 0x0000FFFF0000FFFF
+        value = (value | (value << 8)) & 0x00FF00FF00FF00FF
+        value = (value | (value << 4)) & 0x0F0F0F0F0F0F0F0F
+        value = (value | (value << 2)) & 0x3333333333333333
+        value = (value | (value << 1)) & 0x5555555555555555
+        return value
+
+    @staticmethod
+    def _spread_numpy(values: Any) -> Any:
+        """Spread the bits of all cell coordinates of an array to every second bit (Morton code)"""
+        values = values & np.uint64(0xFFFFFFFF)
+        for shift, mask in ((16, 0x0000FFFF0000FFFF), (8, 0x00FF00FF00FF00FF), (4, 0x0F0F0F0F0F0F0F0F),
+                            (2, 0x3333333333333333), (1, 0x5555555555555555)):
+            values = (values | (values << np.uint64(shift))) & np.uint64(mask)
+        return values
+
+    # OVERLOADS
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def __repr__(self) -> str:
+        return f"StaticQuadTree[id={id(self)}, minimum={self.minimum}, maximum={self.maximum}, points={len(self.order)}, depth={self.depth}]"
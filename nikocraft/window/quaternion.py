@@ -0,0 +1,135 @@
+"""Contains the quaternion class for 3D rotations"""
+
+# Standard modules
+from typing import Union, Self
+import math
+
+# Local modules
+from .vector3d import Vec3
+from .vector3d_array import Vec3Array
+from .matrix import Mat3, Mat4
+
+
+class Quat(tuple):
+    """Quaternion class (w, x, y, z) for 3D rotations"""
+
+    def __new__(cls, w: Union[int, float] = 1, x: Union[int, float] = 0, y: Union[int, float] = 0, z: Union[int, float] = 0) -> Self:
+        return tuple.__new__(cls, (w, x, y, z))
+
+    # CLASS METHODS
+
+    @classmethod
+    def identity(cls) -> Self:
+        """Create the identity rotation"""
+        return Quat(1, 0, 0, 0)
+
+    @classmethod
+    def from_axis_angle(cls, axis: Vec3, angle: float) -> Self:
+        """Create a rotation around an axis (angle in radians)"""
+        length = math.sqrt(axis[0] * axis[0] + axis[1] * axis[1] + axis[2] * axis[2])
+        s = math.sin(angle / 2) / length
+        return Quat(math.cos(angle / 2), axis[0] * s, axis[1] * s, axis[2] * s)
+
+    @classmethod
+    def from_euler(cls, pitch: float, yaw: float, roll: float) -> Self:
+        """Create a rotation from euler angles in radians (pitch around x, yaw around y, roll around z; applied roll, pitch, yaw)"""
+        cx, sx = math.cos(pitch / 2), math.sin(pitch / 2)
+        cy, sy = math.cos(yaw / 2), math.sin(yaw / 2)
+        cz, sz = math.cos(roll / 2), math.sin(roll / 2)
+        return Quat(cy * cx * cz + sy * sx * sz,
+                    cy * sx * cz + sy * cx * sz,
+                    sy * cx * cz - cy * sx * sz,
+                    cy * cx * sz - sy * sx * cz)
+
+    # PROPERTIES
+
+    @property
+    def w(self) -> Union[int, float]:
+        return self[0]
+
+    @property
+    def x(self) -> Union[int, float]:
+        return self[1]
+
+    @property
+    def y(self) -> Union[int, float]:
+        return self[2]
+
+    @property
+    def z(self) -> Union[int, float]:
+        return self[3]
+
+    @property
+    def xyz(self) -> Vec3:
+        return Vec3(self[1], self[2], self[3])
+
+    @property
+    def length(self) -> float:
+        return math.sqrt(self[0] * self[0] + self[1] * self[1] + self[2] * self[2] + self[3] * self[3])
+
+    # METHODS
+
+    def normalize(self) -> Self:
+        """Normalize the quaternion to a length of 1"""
+        length = self.length
+        if length == 0:
+            return Quat(1, 0, 0, 0)
+        return Quat(self[0] / length, self[1] / length, self[2] / length, self[3] / length)
+
+    def conjugate(self) -> Self:
+        """Get the conjugate (the inverse rotation for unit quaternions)"""
+        return Quat(self[0], -self[1], -self[2], -self[3])
+
+    def dot(self, other: Self) -> float:
+        """Calculate the dot product with another quaternion"""
+        return self[0] * other[0] + self[1] * other[1] + self[2] * other[2] + self[3] * other[3]
+
+    def slerp(self, other: Self, t: float) -> Self:
+        """Spherical linear interpolation to another rotation"""
+
+        dot = self.dot(other)
+        if dot < 0:
+            other, dot = Quat(-other[0], -other[1], -other[2], -other[3]), -dot
+
+        if dot > 0.9995:
+            return Quat(*(a + (b - a) * t for a, b in zip(self, other))).normalize()
+
+        theta = math.acos(dot)
+        sin_theta = math.sin(theta)
+        a = math.sin((1 - t) * theta) / sin_theta
+        b = math.sin(t * theta) / sin_theta
+        return Quat(*(a * p + b * q for p, q in zip(self, other)))
+
+    def mat3(self) -> Mat3:
+        """Create the rotation matrix of the (unit) quaternion"""
+        w, x, y, z = self
+        return Mat3((1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y),
+                     2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x),
+                     2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y)))
+
+    def mat4(self) -> Mat4:
+        """Create the 4x4 rotation matrix of the (unit) quaternion"""
+        return self.mat3().mat4()
+
+    def rotate(self, vectors: Union[Vec3, Vec3Array]) -> Union[Vec3, Vec3Array]:
+        """Rotate a vector or all vectors of an array with the (unit) quaternion"""
+        return self.mat3() @ vectors
+
+    # OVERLOADS
+
+    def __mul__(self, other: Self) -> Self:
+        w1, x1, y1, z1 = self
+        w2, x2, y2, z2 = other
+        return Quat(w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+                    w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+                    w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+                    w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2)
+
+    def __neg__(self) -> Self:
+        return Quat(-self[0], -self[1], -self[2], -self[3])
+
+    def __repr__(self) -> str:
+        return f"Quat[id={id(self)}, w={self[0]}, x={self[1]}, y={self[2]}, z={self[3]}]"
+
+    def __str__(self) -> str:
+        return f"({self[0]}, {self[1]}, {self[2]}, {self[3]})"
@@ -78,6 +78,9 @@ class RGBColor(tuple):
     def __ne__(self, other: Self) -> bool:
         return self[0] != other[0] or self[1] != other[1] or self[2] != other[2]
 
+    def __hash__(self) -> int:
+        return tuple.__hash__(self)
+
     def __add__(self, other: Self) -> Self:
         return RGBColor(self[0] + other[0], self[1] + other[1], self[2] + other[2]).clamp()
 
@@ -1,6 +1,9 @@
 # Standard modules
 from __future__ import annotations
-from typing import TYPE_CHECKING, Self, Callable
+from typing import TYPE_CHECKING, Self, Callable, Any, Coroutine
+from concurrent.futures import Future
+import asyncio
+import threading
 import logging
 
 # External modules
@@ -25,6 +28,15 @@ class Scene(SurfaceInterface):
 
         self.event_hooks: list[EventHook] = []
 
+        self.tasks: set[asyncio.Task | Future] = set()
+
+        # Loading progress from 0 to 1 (set in preload for loading bars)
+        self.load_progress: float = 0
+
+        # Render snapshots (front buffer for rendering, back buffer written after updating)
+        self.render_state: Any = None
+        self.next_render_state: Any = None
+
     # PROPERTIES
 
     @property
@@ -39,14 +51,28 @@ class Scene(SurfaceInterface):
     def dt(self) -> float:
         return self.window.clock.delta_time
 
+    @property
+    def fixed_dt(self) -> float:
+        return self.window.fixed_dt
+
+    @property
+    def interpolation(self) -> float:
+        return self.window.interpolation
+
     # METHODS
 
     def add_event_hook(self, event: int | tuple[int, ...], handler: tuple[Callable[[pg.event.Event, Self, dict], None], ...] |
                        Callable[[pg.event.Event, Self, dict], None], data: dict = None) -> EventHook:
-        """Add a new event hook to the scene"""
+        """Add a new event hook to the scene
 
-        hook = self.window.add_event_hook(event, handler, data)
+        *The hook is only active while the scene is the current scene of the window -
+        Hooks added while preloading are activated when the scene is entered*
+        """
+
+        hook = self.window.create_event_hook(event, handler, data)
         self.event_hooks.append(hook)
+        if self.window.scene is self:
+            self.window.activate_event_hook(hook)
         return hook
 
     def remove_event_hook(self, hook_id: int) -> bool:
@@ -60,15 +86,61 @@ class Scene(SurfaceInterface):
                 return True
         return False
 
+    def add_dirty_rect(self, rect: pg.Rect | tuple[int, int, int, int]) -> None:
+        """Register a changed area of the screen for the next screen update (dirty rectangle mode)"""
+
+        self.window.add_dirty_rect(rect)
+
+    def create_task(self, coroutine: Coroutine) -> asyncio.Task | Future:
+        """Run a coroutine on the event loop of the window, cancelled automatically when the scene is changed
+
+        *Requires the window to be opened with run_async -
+        From other threads (threaded update mode) a concurrent future is returned*
+        """
+
+        loop = self.window.event_loop
+        if loop is None:
+            coroutine.close()
+            raise RuntimeError("No event loop! Open the window with run_async to use coroutines ...")
+
+        if threading.get_ident() == self.window.event_loop_thread:
+            task = loop.create_task(coroutine)
+        else:
+            task = asyncio.run_coroutine_threadsafe(coroutine, loop)
+        self.tasks.add(task)
+        task.add_done_callback(self._task_done)
+        return task
+
+    def _task_done(self, task: asyncio.Task | Future) -> None:
+        """Forget a finished task and log its exception"""
+
+        self.tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.error("Scene task failed!", exc_info=task.exception())
+
+    def cancel_tasks(self) -> None:
+        """Cancel all running tasks of the scene
+
+        *Called by the window when the scene is changed*
+        """
+
+        for task in tuple(self.tasks):
+            task.cancel()
+        self.tasks.clear()
+
+    def swap_render_state(self) -> None:
+        """Publish the snapshot of the last update for rendering
+
+        *Called by the window after the update finished*
+        """
+
+        self.render_state = self.next_render_state
+
     def activate_event_hooks(self) -> None:
         """Activate all event hooks of the scene"""
 
         for hook in self.event_hooks:
-            for h in self.window.event_hooks:
-                if h.id == hook.id:
-                    break
-            else:
-                self.window.event_hooks.append(hook)
+            self.window.activate_event_hook(hook)
 
     def deactivate_event_hooks(self) -> None:
         """Deactivate all event hooks of the scene"""
@@ -78,6 +150,16 @@ class Scene(SurfaceInterface):
 
     # ABSTRACT METHODS
 
+    def preload(self) -> None:
+        """Loading tasks (textures, level data, ...)
+
+        *Called on a worker thread as soon as the scene change starts, the transition holds at black until finished -
+        Update load_progress for loading bars (window.scene_load_progress) -
+        Don't call this method manually*
+        """
+
+        pass
+
     def init(self) -> None:
         """Startup tasks
 
@@ -111,6 +193,15 @@ class Scene(SurfaceInterface):
 
         pass
 
+    def fixed_update(self) -> None:
+        """Fixed timestep update tasks
+
+        *Called zero or more times per frame with a constant time step of fixed_dt seconds (fixed timestep mode) -
+        Interpolate rendering with the interpolation factor*
+        """
+
+        pass
+
     def update(self) -> None:
         """Normal update tasks
 
@@ -127,6 +218,33 @@ class Scene(SurfaceInterface):
 
         pass
 
+    def snapshot(self) -> Any:
+        """Create a snapshot of the state needed for rendering (available as render_state in render)
+
+        *Called every frame after updating (on the update thread in threaded update mode) -
+        In threaded update mode render only from render_state, as the update of the next frame runs concurrently*
+        """
+
+        pass
+
+    def suspend(self) -> None:
+        """Suspend tasks (release resources that should not be kept while the scene is retained)
+
+        *Called instead of quit when the scene is left in scene retention mode -
+        Don't call this method manually*
+        """
+
+        pass
+
+    def resume(self) -> None:
+        """Resume tasks (the new scene arguments are available in args)
+
+        *Called instead of preload and init when a retained scene is entered again -
+        Don't call this method manually*
+        """
+
+        pass
+
     def quit(self) -> None:
         """Shutdown tasks
 
@@ -0,0 +1,183 @@
+"""Contains the spatial hash class for broadphase neighbour and collision queries"""
+
+# Standard modules
+from typing import Hashable, Iterator, Union
+import math
+
+# Local modules
+from .vector2d import Vec
+
+
+class SpatialHash:
+    """Spatial hash grid class
+
+    Stores hashable objects at Vec positions in square cells of a fixed size.
+    For pair enumeration the cell size should be at least the largest interaction distance
+    """
+
+    def __init__(self, cell_size: Union[int, float] = 64) -> None:
+
+        if cell_size <= 0:
+            raise ValueError("The cell size of a spatial hash must be positive!")
+
+        self.cell_size: Union[int, float] = cell_size
+        self.cells: dict[tuple[int, int], dict[Hashable, Vec]] = {}
+        self.keys: dict[Hashable, tuple[int, int]] = {}
+
+    # METHODS
+
+    def key(self, position: Vec) -> tuple[int, int]:
+        """Get the cell key of a position"""
+        return math.floor(position[0] / self.cell_size), math.floor(position[1] / self.cell_size)
+
+    def insert(self, obj: Hashable, position: Vec) -> None:
+        """Insert an object at a position (moves the object, if already inserted)"""
+
+        if obj in self.keys:
+            self.move(obj, position)
+            return
+
+        key = math.floor(position[0] / self.cell_size), math.floor(position[1] / self.cell_size)
+        cell = self.cells.get(key)
+        if cell is None:
+            cell = self.cells[key] = {}
+        cell[obj] = position
+        self.keys[obj] = key
+
+    def remove(self, obj: Hashable) -> bool:
+        """Remove an object"""
+
+        key = self.keys.pop(obj, None)
+        if key is None:
+            return False
+
+        cell = self.cells[key]
+        del cell[obj]
+        if not cell:
+            del self.cells[key]
+        return True
+
+    def move(self, obj: Hashable, position: Vec) -> None:
+        """Move an object to a new position (only rehashes, if the cell changed)"""
+
+        old_key = self.keys[obj]
+        key = math.floor(position[0] / self.cell_size), math.floor(position[1] / self.cell_size)
+
+        if key == old_key:
+            self.cells[key][obj] = position
+            return
+
+        cell = self.cells[old_key]
+        del cell[obj]
+        if not cell:
+            del self.cells[old_key]
+
+        cell = self.cells.get(key)
+        if cell is None:
+            cell = self.cells[key] = {}
+        cell[obj] = position
+        self.keys[obj] = key
+
+    def position(self, obj: Hashable) -> Vec:
+        """Get the position of an object"""
+        return self.cells[self.keys[obj]][obj]
+
+    def clear(self) -> None:
+        """Remove all objects"""
+        self.cells.clear()
+        self.keys.clear()
+
+    def query_aabb(self, minimum: Vec, maximum: Vec) -> list[Hashable]:
+        """Get all objects inside an axis aligned bounding box (inclusive)"""
+
+        min_x, min_y, max_x, max_y = minimum[0], minimum[1], maximum[0], maximum[1]
+        key_min_x, key_min_y = self.key(minimum)
+        key_max_x, key_max_y = self.key(maximum)
+        cells = self.cells
+        result = []
+
+        for cx in range(key_min_x, key_max_x + 1):
+            for cy in range(key_min_y, key_max_y + 1):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    continue
+                inner = key_min_x < cx < key_max_x and key_min_y < cy < key_max_y
+                for obj, position in cell.items():
+                    if inner or (min_x <= position[0] <= max_x and min_y <= position[1] <= max_y):
+                        result.append(obj)
+
+        return result
+
+    def query_radius(self, center: Vec, radius: Union[int, float]) -> list[Hashable]:
+        """Get all objects with a distance lower equals radius to a center"""
+
+        x, y = center[0], center[1]
+        radius_squared = radius * radius
+        key_min_x, key_min_y = self.key((x - radius, y - radius))
+        key_max_x, key_max_y = self.key((x + radius, y + radius))
+        cells = self.cells
+        result = []
+
+        for cx in range(key_min_x, key_max_x + 1):
+            for cy in range(key_min_y, key_max_y + 1):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    continue
+                for obj, position in cell.items():
+                    dx, dy = position[0] - x, position[1] - y
+                    if dx * dx + dy * dy <= radius_squared:
+                        result.append(obj)
+
+        return result
+
+    def pairs(self, radius: Union[int, float] = None) -> Iterator[tuple[Hashable, Hashable]]:
+        """Iterate all candidate pairs of objects in the same or adjacent cells (each pair once)
+
+        With a radius only pairs with a distance lower equals radius are yielded (radius must not exceed the cell size)
+        """
+
+        if radius is not None and radius > self.cell_size:
+            raise ValueError("The pair radius must not exceed the cell size of the spatial hash!")
+        radius_squared = None if radius is None else radius * radius
+        cells = self.cells
+
+        for (cx, cy), cell in cells.items():
+            items = list(cell.items())
+
+            # Pairs inside the cell
+            for i, (a, pa) in enumerate(items):
+                for b, pb in items[i + 1:]:
+                    if radius_squared is None:
+                        yield a, b
+                        continue
+                    dx, dy = pa[0] - pb[0], pa[1] - pb[1]
+                    if dx * dx + dy * dy <= radius_squared:
+                        yield a, b
+
+            # Pairs with half of the neighbour cells (every neighbour pair is visited once)
+            for neighbour_key in ((cx + 1, cy), (cx - 1, cy + 1), (cx, cy + 1), (cx + 1, cy + 1)):
+                neighbour = cells.get(neighbour_key)
+                if neighbour is None:
+                    continue
+                for a, pa in items:
+                    for b, pb in neighbour.items():
+                        if radius_squared is None:
+                            yield a, b
+                            continue
+                        dx, dy = pa[0] - pb[0], pa[1] - pb[1]
+                        if dx * dx + dy * dy <= radius_squared:
+                            yield a, b
+
+    # OVERLOADS
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, obj: Hashable) -> bool:
+        return obj in self.keys
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self.keys)
+
+    def __repr__(self) -> str:
+        return f"SpatialHash[id={id(self)}, cell_size={self.cell_size}, objects={len(self.keys)}, cells={len(self.cells)}]"
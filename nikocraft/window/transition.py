@@ -0,0 +1,129 @@
+"""Contains the scene transition effect classes"""
+
+# External modules
+import pygame as pg
+
+# Local modules
+from .rgb import RGBColor, RGB
+
+
+class Transition:
+    """Base class of scene transition effects
+
+    The overlay surface is allocated once per resolution in the display format.
+    Effects get the covered amount from 0 (only the scene visible) to 1 (fully covered)
+    """
+
+    def __init__(self) -> None:
+
+        self.surface: pg.Surface | None = None
+
+    # METHODS
+
+    def prepare(self, screen: pg.Surface, alpha: bool = False) -> pg.Surface:
+        """Get the overlay surface with the size of the screen (only reallocated on resolution changes)"""
+
+        if self.surface is None or self.surface.get_size() != screen.get_size():
+            surface = pg.Surface(screen.get_size(), pg.SRCALPHA if alpha else 0)
+            if pg.display.get_surface() is not None:
+                surface = surface.convert_alpha() if alpha else surface.convert()
+            self.surface = surface
+            self.allocate(self.surface)
+        return self.surface
+
+    # ABSTRACT METHODS
+
+    def allocate(self, surface: pg.Surface) -> None:
+        """Fill a newly allocated overlay surface
+
+        *Called when the overlay surface is (re)allocated*
+        """
+
+        pass
+
+    def switch(self, screen: pg.Surface) -> None:
+        """Switch tasks (the screen still contains the last frame of the old scene)
+
+        *Called right before the scene is switched at full coverage*
+        """
+
+        pass
+
+    def render(self, screen: pg.Surface, amount: float, entering: bool) -> None:
+        """Render the transition over the scene
+
+        *Called every transition frame after the scene is rendered -
+        amount is the covered amount from 0 to 1, entering is true after the scene switch*
+        """
+
+        pass
+
+
+class FadeTransition(Transition):
+    """Fade to a color and back"""
+
+    def __init__(self, color: RGBColor = RGB.BLACK) -> None:
+
+        super(FadeTransition, self).__init__()
+
+        self.color: RGBColor = color
+
+    # METHODS
+
+    def allocate(self, surface: pg.Surface) -> None:
+        surface.fill(self.color)
+
+    def render(self, screen: pg.Surface, amount: float, entering: bool) -> None:
+        surface = self.prepare(screen)
+        surface.set_alpha(int(255 * amount))
+        screen.blit(surface, (0, 0))
+
+
+class WipeTransition(Transition):
+    """Wipe a color over the screen from the left, right, top or bottom and back"""
+
+    def __init__(self, color: RGBColor = RGB.BLACK, direction: str = "left") -> None:
+
+        super(WipeTransition, self).__init__()
+
+        if direction not in ("left", "right", "top", "bottom"):
+            raise ValueError(f"Invalid wipe direction '{direction}'!")
+
+        self.color: RGBColor = color
+        self.direction: str = direction
+
+    # METHODS
+
+    def allocate(self, surface: pg.Surface) -> None:
+        surface.fill(self.color)
+
+    def render(self, screen: pg.Surface, amount: float, entering: bool) -> None:
+
+        surface = self.prepare(screen)
+        width, height = surface.get_size()
+
+        if self.direction in ("left", "right"):
+            size = round(width * amount)
+            x = 0 if (self.direction == "left") != entering else width - size
+            screen.blit(surface, (x, 0), (0, 0, size, height))
+        else:
+            size = round(height * amount)
+            y = 0 if (self.direction == "top") != entering else height - size
+            screen.blit(surface, (0, y), (0, 0, width, size))
+
+
+class CrossfadeTransition(Transition):
+    """Crossfade from a snapshot of the last frame of the old scene to the new scene
+
+    The old scene keeps running while fading out, so this phase can be used to preload the next scene
+    """
+
+    # METHODS
+
+    def switch(self, screen: pg.Surface) -> None:
+        self.prepare(screen).blit(screen, (0, 0))
+
+    def render(self, screen: pg.Surface, amount: float, entering: bool) -> None:
+        if entering and self.surface is not None:
+            self.surface.set_alpha(int(255 * amount))
+            screen.blit(self.surface, (0, 0))
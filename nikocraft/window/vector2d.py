@@ -1,7 +1,9 @@
 """Contains the 2D vector class"""
 
 # Standard modules
-from typing import Union, Self
+from typing import Union, Self, Callable
+import itertools
+import operator
 import math
 
 
@@ -13,29 +15,7 @@ class Vec(tuple):
 
     # PROPERTIES
 
-    @property
-    def x(self) -> Union[int, float]:
-        return self[0]
-
-    @property
-    def y(self) -> Union[int, float]:
-        return self[1]
-
-    @property
-    def xy(self) -> Self:
-        return self
-
-    @property
-    def yx(self) -> Self:
-        return Vec(self[1], self[0])
-
-    @property
-    def xx(self) -> Self:
-        return Vec(self[0], self[0])
-
-    @property
-    def yy(self) -> Self:
-        return Vec(self[1], self[1])
+    # Component and swizzle properties (x, y, xy, yx, xx, yy) are generated below the class
 
     @property
     def rounded(self) -> bool:
@@ -47,11 +27,11 @@ class Vec(tuple):
 
     @property
     def length(self) -> float:
-        return math.sqrt(self[0] ** 2 + self[1] ** 2)
+        return math.hypot(self[0], self[1])
 
     @property
     def length_squared(self) -> float:
-        return self[0] ** 2 + self[1] ** 2
+        return self[0] * self[0] + self[1] * self[1]
 
     # METHODS
 
@@ -65,17 +45,53 @@ class Vec(tuple):
 
     def distance(self, other: Self) -> float:
         """Calculate the distance to another vector"""
-        return math.sqrt(pow(self[0] - other[0], 2) + pow(self[1] - other[1], 2))
+        return math.hypot(self[0] - other[0], self[1] - other[1])
 
     def distance_squared(self, other: Self) -> float:
         """Calculate the squared distance to another vector"""
-        return abs(self[0] - other[0]) + abs(self[1] - other[1])
+        dx, dy = self[0] - other[0], self[1] - other[1]
+        return dx * dx + dy * dy
 
     def normalize(self) -> Self:
         """Normalize the vector to a length of 1"""
-        if self.length == 0:
+        length = math.hypot(self[0], self[1])
+        if length == 0:
             return Vec(0, 0)
-        return self.__truediv__(self.length)
+        return Vec(self[0] / length, self[1] / length)
+
+    def dot(self, other: Self) -> float:
+        """Calculate the dot product with another vector"""
+        return self[0] * other[0] + self[1] * other[1]
+
+    def cross(self, other: Self) -> float:
+        """Calculate the cross product with another vector (z-component of the 3D cross product)"""
+        return self[0] * other[1] - self[1] * other[0]
+
+    def lerp(self, other: Self, t: float) -> Self:
+        """Linear interpolation to another vector (t = 0 is this vector, t = 1 the other one)"""
+        return Vec(self[0] + (other[0] - self[0]) * t, self[1] + (other[1] - self[1]) * t)
+
+    def clamp_length(self, max_length: float) -> Self:
+        """Limit the length of the vector to a maximum"""
+        length_squared = self[0] * self[0] + self[1] * self[1]
+        if length_squared <= max_length * max_length:
+            return self
+        factor = max_length / math.sqrt(length_squared)
+        return Vec(self[0] * factor, self[1] * factor)
+
+    def move_towards(self, target: Self, max_distance: float) -> Self:
+        """Move the vector towards a target by a maximum distance without overshooting"""
+        dx, dy = target[0] - self[0], target[1] - self[1]
+        distance_squared = dx * dx + dy * dy
+        if distance_squared <= max_distance * max_distance:
+            return Vec(target[0], target[1])
+        factor = max_distance / math.sqrt(distance_squared)
+        return Vec(self[0] + dx * factor, self[1] + dy * factor)
+
+    def reflect(self, normal: Self) -> Self:
+        """Reflect the vector on a surface with a specific (unit) normal"""
+        factor = 2 * (self[0] * normal[0] + self[1] * normal[1])
+        return Vec(self[0] - normal[0] * factor, self[1] - normal[1] * factor)
 
     def round(self, n: int = None) -> Self:
         """Round the vector to a vector with integer values"""
@@ -138,3 +154,37 @@ class Vec(tuple):
 
     def __str__(self) -> str:
         return f"({self[0]}, {self[1]})"
+
+
+def _add_swizzles(cls: type, components: str, result_types: dict[int, type]) -> None:
+    """Generate the component and swizzle properties of a vector class
+
+    cls: the vector class to add the properties to
+    components: the component names in index order (for example "xyz")
+    result_types: the vector class returned by the swizzles of a specific length
+    """
+
+    for index, name in enumerate(components):
+        setattr(cls, name, property(operator.itemgetter(index), doc=f"The {name} component"))
+
+    for length, result_type in result_types.items():
+        for names in itertools.product(range(len(components)), repeat=length):
+            name = "".join(components[i] for i in names)
+            if result_type is cls and names == tuple(range(len(components))):
+                setattr(cls, name, property(lambda self: self, doc="The vector itself"))
+            else:
+                setattr(cls, name, property(_swizzle(result_type, operator.itemgetter(*names)), doc=f"The {name} swizzle"))
+
+
+def _swizzle(result_type: type, getter: operator.itemgetter) -> Callable[[tuple], tuple]:
+    """Create the getter of a swizzle property (builds the tuple in C and skips the Python-level __new__)"""
+
+    new = tuple.__new__
+
+    def swizzle(self: tuple) -> tuple:
+        return new(result_type, getter(self))
+
+    return swizzle
+
+
+_add_swizzles(Vec, "xy", {2: Vec})
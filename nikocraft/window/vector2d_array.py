@@ -0,0 +1,310 @@
+"""Contains the 2D vector array class for batched vector math
+
+Uses NumPy as backend when it is installed, otherwise a flat array of doubles
+"""
+
+# Standard modules
+from typing import Union, Self, Iterable, Iterator, Callable, Any
+from array import array
+from itertools import cycle, repeat
+import operator
+import math
+
+# External modules
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Local modules
+from .vector2d import Vec
+
+
+def _floats(values: Iterable[Union[int, float]]) -> Any:
+    """Convert values to a float64 NumPy array (sequences and buffers without a copy, iterators element by element)"""
+    if hasattr(values, "__len__"):
+        return np.asarray(values, dtype=np.float64)
+    return np.fromiter(values, dtype=np.float64)
+
+
+class VecArray:
+    """2D vector array class
+
+    Stores the vectors in a contiguous float64 buffer and applies all operators to the whole batch at once.
+    With NumPy the buffer is an array of the shape (n, 2), otherwise an interleaved array('d') [x0, y0, x1, y1, ...]
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, vectors: Iterable[tuple[Union[int, float], Union[int, float]]] = ()) -> None:
+
+        if np is not None:
+            self.data = np.array([(v[0], v[1]) for v in vectors], dtype=np.float64).reshape(-1, 2)
+        else:
+            self.data = array("d")
+            for v in vectors:
+                self.data.append(v[0])
+                self.data.append(v[1])
+
+    # CLASS METHODS
+
+    @classmethod
+    def from_buffer(cls, data: Any) -> Self:
+        """Wrap an existing buffer without copying it (NumPy array of shape (n, 2) or interleaved array('d'))"""
+        instance = cls.__new__(cls)
+        if np is not None:
+            instance.data = np.asarray(data, dtype=np.float64).reshape(-1, 2)
+        else:
+            instance.data = data if isinstance(data, array) and data.typecode == "d" else array("d", data)
+        return instance
+
+    @classmethod
+    def from_xy(cls, xs: Iterable[Union[int, float]], ys: Iterable[Union[int, float]]) -> Self:
+        """Create an array from separate sequences of x and y values"""
+        if np is not None:
+            return cls.from_buffer(np.column_stack((_floats(xs), _floats(ys))))
+        data = array("d")
+        for x, y in zip(xs, ys):
+            data.append(x)
+            data.append(y)
+        return cls.from_buffer(data)
+
+    @classmethod
+    def zeros(cls, size: int) -> Self:
+        """Create an array with a specific amount of null vectors"""
+        if np is not None:
+            return cls.from_buffer(np.zeros((size, 2), dtype=np.float64))
+        return cls.from_buffer(array("d", bytes(16 * size)))
+
+    @classmethod
+    def full(cls, size: int, vector: tuple[Union[int, float], Union[int, float]]) -> Self:
+        """Create an array with a specific amount of copies of a vector"""
+        if np is not None:
+            return cls.from_buffer(np.tile(np.asarray(vector[:2], dtype=np.float64), (size, 1)))
+        return cls.from_buffer(array("d", (vector[0], vector[1])) * size)
+
+    # PROPERTIES
+
+    @property
+    def x(self) -> Any:
+        if np is not None:
+            return self.data[:, 0]
+        return self.data[0::2]
+
+    @property
+    def y(self) -> Any:
+        if np is not None:
+            return self.data[:, 1]
+        return self.data[1::2]
+
+    @property
+    def length(self) -> Any:
+        if np is not None:
+            return np.sqrt(np.einsum("ij,ij->i", self.data, self.data))
+        return array("d", map(math.hypot, self.data[0::2], self.data[1::2]))
+
+    @property
+    def length_squared(self) -> Any:
+        if np is not None:
+            return np.einsum("ij,ij->i", self.data, self.data)
+        xs, ys = self.data[0::2], self.data[1::2]
+        return array("d", map(operator.add, map(operator.mul, xs, xs), map(operator.mul, ys, ys)))
+
+    # METHODS
+
+    def list(self) -> list[Vec]:
+        """Create a list with the vectors as elements"""
+        return list(self)
+
+    def copy(self) -> Self:
+        """Create a copy of the array with its own buffer"""
+        return VecArray.from_buffer(self.data.copy() if np is not None else array("d", self.data))
+
+    def distance(self, other: Union[Self, tuple[Union[int, float], Union[int, float]]]) -> Any:
+        """Calculate the distances to other vectors (element by element) or to a single vector"""
+        return self.__sub__(other).length
+
+    def distance_squared(self, other: Union[Self, tuple[Union[int, float], Union[int, float]]]) -> Any:
+        """Calculate the squared distances to other vectors (element by element) or to a single vector"""
+        return self.__sub__(other).length_squared
+
+    def normalize(self) -> Self:
+        """Normalize all vectors to a length of 1 (null vectors stay null vectors)"""
+
+        if np is not None:
+            length = np.sqrt(np.einsum("ij,ij->i", self.data, self.data))[:, None]
+            return VecArray.from_buffer(np.divide(self.data, length, out=np.zeros_like(self.data), where=length != 0))
+
+        data = array("d", bytes(8 * len(self.data)))
+        for i in range(0, len(self.data), 2):
+            x, y = self.data[i], self.data[i + 1]
+            length = math.hypot(x, y)
+            if length != 0:
+                data[i] = x / length
+                data[i + 1] = y / length
+        return VecArray.from_buffer(data)
+
+    def scale(self, factors: Iterable[Union[int, float]]) -> Self:
+        """Multiply each vector by its own factor"""
+
+        if np is not None:
+            return VecArray.from_buffer(self.data * _floats(factors)[:, None])
+        factors = array("d", factors)
+        return VecArray.from_buffer(array("d", map(operator.mul, self.data, (f for f in factors for _ in (0, 1)))))
+
+    def swizzle(self, components: str) -> Self:
+        """Rearrange the components of all vectors (for example "yx")"""
+
+        if len(components) != 2:
+            raise ValueError(f"Cannot swizzle 2D vectors to {len(components)} components!")
+        indices = ["xy".index(name) for name in components]
+        if np is not None:
+            return VecArray.from_buffer(self.data[:, indices])
+        return VecArray.from_xy(self.data[indices[0]::2], self.data[indices[1]::2])
+
+    def round(self, n: int = None) -> Self:
+        """Round the vectors (values stay floats)"""
+        return self.__round__(n)
+
+    def floor(self) -> Self:
+        """Floor the vectors (values stay floats)"""
+        return self.__floor__()
+
+    def ceil(self) -> Self:
+        """Ceil the vectors (values stay floats)"""
+        return self.__ceil__()
+
+    def _operand(self, other: Any) -> Any:
+        """Get the other operand of an operator in a form matching the buffer"""
+
+        if isinstance(other, VecArray):
+            if len(other) != len(self):
+                raise ValueError(f"Cannot operate on vector arrays of different sizes ({len(self)} and {len(other)})!")
+            return other.data
+        if np is not None:
+            return np.asarray(other, dtype=np.float64)
+        if isinstance(other, (int, float)):
+            return repeat(other)
+        return cycle((other[0], other[1]))
+
+    def _apply(self, func: Callable[[Any, Any], Any], other: Any) -> Self:
+        """Apply a binary operator to all vectors and return a new array"""
+        if np is not None:
+            return VecArray.from_buffer(func(self.data, self._operand(other)))
+        return VecArray.from_buffer(array("d", map(func, self.data, self._operand(other))))
+
+    def _apply_inplace(self, func: Callable[[Any, Any], Any], other: Any) -> Self:
+        """Apply a binary operator to all vectors in place"""
+        if np is not None:
+            func(self.data, self._operand(other))
+        else:
+            self.data[:] = array("d", map(func, self.data, self._operand(other)))
+        return self
+
+    def _apply_unary(self, func: Callable[[Any], Any]) -> Self:
+        """Apply an unary function to all values and return a new array"""
+        return VecArray.from_buffer(array("d", map(func, self.data)))
+
+    # OVERLOADS
+
+    def __len__(self) -> int:
+        return len(self.data) if np is not None else len(self.data) // 2
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Vec, Self]:
+        if isinstance(index, slice):
+            if np is not None:
+                return VecArray.from_buffer(self.data[index])
+            start, stop, step = index.indices(len(self))
+            data = array("d")
+            for i in range(start, stop, step):
+                data.append(self.data[2 * i])
+                data.append(self.data[2 * i + 1])
+            return VecArray.from_buffer(data)
+        if np is not None:
+            x, y = self.data[index].tolist()
+            return Vec(x, y)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Vector array index out of range!")
+        return Vec(self.data[2 * index], self.data[2 * index + 1])
+
+    def __setitem__(self, index: int, vector: tuple[Union[int, float], Union[int, float]]) -> None:
+        if np is not None:
+            self.data[index] = vector[0], vector[1]
+            return
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Vector array index out of range!")
+        self.data[2 * index] = vector[0]
+        self.data[2 * index + 1] = vector[1]
+
+    def __iter__(self) -> Iterator[Vec]:
+        if np is not None:
+            return (Vec(x, y) for x, y in self.data.tolist())
+        return map(Vec, self.data[0::2], self.data[1::2])
+
+    def __add__(self, other: Union[Self, tuple[Union[int, float], Union[int, float]]]) -> Self:
+        return self._apply(operator.add, other)
+
+    def __sub__(self, other: Union[Self, tuple[Union[int, float], Union[int, float]]]) -> Self:
+        return self._apply(operator.sub, other)
+
+    def __mul__(self, factor: Union[int, float, Self, tuple[Union[int, float], Union[int, float]]]) -> Self:
+        return self._apply(operator.mul, factor)
+
+    def __truediv__(self, divisor: Union[int, float, Self, tuple[Union[int, float], Union[int, float]]]) -> Self:
+        return self._apply(operator.truediv, divisor)
+
+    def __floordiv__(self, divisor: Union[int, float, Self, tuple[Union[int, float], Union[int, float]]]) -> Self:
+        return self._apply(operator.floordiv, divisor)
+
+    def __iadd__(self, other: Union[Self, tuple[Union[int, float], Union[int, float]]]) -> Self:
+        return self._apply_inplace(operator.iadd, other)
+
+    def __isub__(self, other: Union[Self, tuple[Union[int, float], Union[int, float]]]) -> Self:
+        return self._apply_inplace(operator.isub, other)
+
+    def __imul__(self, factor: Union[int, float, Self, tuple[Union[int, float], Union[int, float]]]) -> Self:
+        return self._apply_inplace(operator.imul, factor)
+
+    def __itruediv__(self, divisor: Union[int, float, Self, tuple[Union[int, float], Union[int, float]]]) -> Self:
+        return self._apply_inplace(operator.itruediv, divisor)
+
+    def __ifloordiv__(self, divisor: Union[int, float, Self, tuple[Union[int, float], Union[int, float]]]) -> Self:
+        return self._apply_inplace(operator.ifloordiv, divisor)
+
+    def __round__(self, n: int = None) -> Self:
+        if np is not None:
+            return VecArray.from_buffer(np.round(self.data, n or 0))
+        return self._apply_unary(lambda value: round(value, n or 0))
+
+    def __floor__(self) -> Self:
+        if np is not None:
+            return VecArray.from_buffer(np.floor(self.data))
+        return self._apply_unary(math.floor)
+
+    def __ceil__(self) -> Self:
+        if np is not None:
+            return VecArray.from_buffer(np.ceil(self.data))
+        return self._apply_unary(math.ceil)
+
+    def __abs__(self) -> Self:
+        if np is not None:
+            return VecArray.from_buffer(np.abs(self.data))
+        return self._apply_unary(abs)
+
+    def __pos__(self) -> Self:
+        return self
+
+    def __neg__(self) -> Self:
+        if np is not None:
+            return VecArray.from_buffer(-self.data)
+        return self._apply_unary(operator.neg)
+
+    def __repr__(self) -> str:
+        return f"VecArray[id={id(self)}, size={len(self)}, backend={'numpy' if np is not None else 'array'}]"
+
+    def __str__(self) -> str:
+        return f"[{', '.join(str(vector) for vector in self)}]"
@@ -0,0 +1,213 @@
+"""Contains the mutable 2D vector class"""
+
+# Standard modules
+from typing import Union, Self, Iterator
+import math
+
+# Local modules
+from .vector2d import Vec
+
+
+class MVec:
+    """Mutable 2D vector class
+
+    Counterpart of Vec with in-place operators for hot update loops (pos += vel * dt).
+    Behaves like a sequence of two numbers, so it can be used anywhere pygame takes a coordinate
+    """
+
+    __slots__ = ("x", "y")
+
+    __hash__ = None
+
+    def __init__(self, x: Union[int, float] = 0, y: Union[int, float] = 0) -> None:
+
+        self.x: Union[int, float] = x
+        self.y: Union[int, float] = y
+
+    # CLASS METHODS
+
+    @classmethod
+    def of(cls, vector: tuple[Union[int, float], Union[int, float]]) -> Self:
+        """Create a mutable vector from a vector or any sequence of two numbers"""
+        return cls(vector[0], vector[1])
+
+    # PROPERTIES
+
+    @property
+    def length(self) -> float:
+        return math.hypot(self.x, self.y)
+
+    @property
+    def length_squared(self) -> float:
+        return self.x * self.x + self.y * self.y
+
+    # METHODS
+
+    def vec(self) -> Vec:
+        """Create an immutable vector with the current values"""
+        return Vec(self.x, self.y)
+
+    def copy(self) -> Self:
+        """Create a copy of the vector"""
+        return MVec(self.x, self.y)
+
+    def set(self, x: Union[int, float], y: Union[int, float]) -> Self:
+        """Set the x and y values"""
+        self.x = x
+        self.y = y
+        return self
+
+    def update(self, vector: tuple[Union[int, float], Union[int, float]]) -> Self:
+        """Set the values to the values of another vector"""
+        self.x = vector[0]
+        self.y = vector[1]
+        return self
+
+    def add_scaled(self, vector: tuple[Union[int, float], Union[int, float]], factor: Union[int, float]) -> Self:
+        """Add another vector multiplied by a factor in place (pos.add_scaled(vel, dt))"""
+        self.x += vector[0] * factor
+        self.y += vector[1] * factor
+        return self
+
+    def normalize_ip(self) -> Self:
+        """Normalize the vector to a length of 1 in place"""
+        length = math.hypot(self.x, self.y)
+        if length != 0:
+            self.x /= length
+            self.y /= length
+        return self
+
+    def clamp_length_ip(self, max_length: float) -> Self:
+        """Limit the length of the vector to a maximum in place"""
+        length_squared = self.x * self.x + self.y * self.y
+        if length_squared > max_length * max_length:
+            factor = max_length / math.sqrt(length_squared)
+            self.x *= factor
+            self.y *= factor
+        return self
+
+    def distance(self, other: tuple[Union[int, float], Union[int, float]]) -> float:
+        """Calculate the distance to another vector"""
+        return math.hypot(self.x - other[0], self.y - other[1])
+
+    def distance_squared(self, other: tuple[Union[int, float], Union[int, float]]) -> float:
+        """Calculate the squared distance to another vector"""
+        dx, dy = self.x - other[0], self.y - other[1]
+        return dx * dx + dy * dy
+
+    def dot(self, other: tuple[Union[int, float], Union[int, float]]) -> float:
+        """Calculate the dot product with another vector"""
+        return self.x * other[0] + self.y * other[1]
+
+    # OVERLOADS
+
+    def __len__(self) -> int:
+        return 2
+
+    def __getitem__(self, index: int) -> Union[int, float]:
+        if index == 0 or index == -2:
+            return self.x
+        if index == 1 or index == -1:
+            return self.y
+        if isinstance(index, slice):
+            return (self.x, self.y)[index]
+        raise IndexError("Vector index out of range!")
+
+    def __setitem__(self, index: int, value: Union[int, float]) -> None:
+        if index == 0 or index == -2:
+            self.x = value
+        elif index == 1 or index == -1:
+            self.y = value
+        else:
+            raise IndexError("Vector index out of range!")
+
+    def __iter__(self) -> Iterator[Union[int, float]]:
+        yield self.x
+        yield self.y
+
+    def __eq__(self, other: tuple[Union[int, float], Union[int, float]]) -> bool:
+        try:
+            return len(other) == 2 and self.x == other[0] and self.y == other[1]
+        except TypeError:
+            return NotImplemented
+
+    def __ne__(self, other: tuple[Union[int, float], Union[int, float]]) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __iadd__(self, other: tuple[Union[int, float], Union[int, float]]) -> Self:
+        self.x += other[0]
+        self.y += other[1]
+        return self
+
+    def __isub__(self, other: tuple[Union[int, float], Union[int, float]]) -> Self:
+        self.x -= other[0]
+        self.y -= other[1]
+        return self
+
+    def __imul__(self, factor: Union[int, float, tuple[Union[int, float], Union[int, float]]]) -> Self:
+        if isinstance(factor, (int, float)):
+            self.x *= factor
+            self.y *= factor
+        else:
+            self.x *= factor[0]
+            self.y *= factor[1]
+        return self
+
+    def __itruediv__(self, divisor: Union[int, float]) -> Self:
+        self.x /= divisor
+        self.y /= divisor
+        return self
+
+    def __ifloordiv__(self, divisor: Union[int, float]) -> Self:
+        self.x //= divisor
+        self.y //= divisor
+        return self
+
+    def __add__(self, other: tuple[Union[int, float], Union[int, float]]) -> Self:
+        return MVec(self.x + other[0], self.y + other[1])
+
+    def __radd__(self, other: tuple[Union[int, float], Union[int, float]]) -> Self:
+        return MVec(other[0] + self.x, other[1] + self.y)
+
+    def __sub__(self, other: tuple[Union[int, float], Union[int, float]]) -> Self:
+        return MVec(self.x - other[0], self.y - other[1])
+
+    def __rsub__(self, other: tuple[Union[int, float], Union[int, float]]) -> Self:
+        return MVec(other[0] - self.x, other[1] - self.y)
+
+    def __mul__(self, factor: Union[int, float]) -> Self:
+        return MVec(self.x * factor, self.y * factor)
+
+    def __rmul__(self, factor: Union[int, float]) -> Self:
+        return MVec(self.x * factor, self.y * factor)
+
+    def __truediv__(self, divisor: Union[int, float]) -> Self:
+        return MVec(self.x / divisor, self.y / divisor)
+
+    def __floordiv__(self, divisor: Union[int, float]) -> Self:
+        return MVec(self.x // divisor, self.y // divisor)
+
+    def __round__(self, n: int = None) -> Self:
+        return MVec(round(self.x, n), round(self.y, n))
+
+    def __floor__(self) -> Self:
+        return MVec(math.floor(self.x), math.floor(self.y))
+
+    def __ceil__(self) -> Self:
+        return MVec(math.ceil(self.x), math.ceil(self.y))
+
+    def __abs__(self) -> Self:
+        return MVec(abs(self.x), abs(self.y))
+
+    def __pos__(self) -> Self:
+        return MVec(self.x, self.y)
+
+    def __neg__(self) -> Self:
+        return MVec(-self.x, -self.y)
+
+    def __repr__(self) -> str:
+        return f"MVec[id={id(self)}, x={self.x}, y={self.y}]"
+
+    def __str__(self) -> str:
+        return f"({self.x}, {self.y})"
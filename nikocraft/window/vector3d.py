@@ -5,7 +5,7 @@ from typing import Union, Self
 import math
 
 # Local modules
-from .vector2d import Vec
+from .vector2d import Vec, _add_swizzles
 
 
 class Vec3(tuple):
@@ -16,161 +16,7 @@ class Vec3(tuple):
 
     # PROPERTIES
 
-    @property
-    def x(self) -> Union[int, float]:
-        return self[0]
-
-    @property
-    def y(self) -> Union[int, float]:
-        return self[1]
-
-    @property
-    def z(self) -> Union[int, float]:
-        return self[2]
-
-    @property
-    def xx(self) -> Vec:
-        return Vec(self[0], self[0])
-
-    @property
-    def yy(self) -> Vec:
-        return Vec(self[1], self[1])
-
-    @property
-    def zz(self) -> Vec:
-        return Vec(self[2], self[2])
-
-    @property
-    def xy(self) -> Vec:
-        return Vec(self[0], self[1])
-
-    @property
-    def xz(self) -> Vec:
-        return Vec(self[0], self[2])
-
-    @property
-    def yx(self) -> Vec:
-        return Vec(self[1], self[0])
-
-    @property
-    def yz(self) -> Vec:
-        return Vec(self[1], self[2])
-
-    @property
-    def zx(self) -> Vec:
-        return Vec(self[2], self[0])
-
-    @property
-    def zy(self) -> Vec:
-        return Vec(self[2], self[1])
-
-    @property
-    def xxx(self) -> Self:
-        return Vec3(self[0], self[0], self[0])
-
-    @property
-    def xyy(self) -> Self:
-        return Vec3(self[0], self[1], self[1])
-
-    @property
-    def xzz(self) -> Self:
-        return Vec3(self[0], self[2], self[2])
-
-    @property
-    def xxy(self) -> Self:
-        return Vec3(self[0], self[0], self[1])
-
-    @property
-    def xxz(self) -> Self:
-        return Vec3(self[0], self[0], self[2])
-
-    @property
-    def xyx(self) -> Self:
-        return Vec3(self[0], self[1], self[0])
-
-    @property
-    def xyz(self) -> Self:
-        return self
-
-    @property
-    def xzx(self) -> Self:
-        return Vec3(self[0], self[2], self[0])
-
-    @property
-    def xzy(self) -> Self:
-        return Vec3(self[0], self[2], self[1])
-
-    @property
-    def yxx(self) -> Self:
-        return Vec3(self[1], self[0], self[0])
-
-    @property
-    def yyy(self) -> Self:
-        return Vec3(self[1], self[1], self[1])
-
-    @property
-    def yzz(self) -> Self:
-        return Vec3(self[1], self[2], self[2])
-
-    @property
-    def yxy(self) -> Self:
-        return Vec3(self[1], self[0], self[1])
-
-    @property
-    def yxz(self) -> Self:
-        return Vec3(self[1], self[0], self[2])
-
-    @property
-    def yyx(self) -> Self:
-        return Vec3(self[1], self[1], self[0])
-
-    @property
-    def yyz(self) -> Self:
-        return Vec3(self[1], self[1], self[2])
-
-    @property
-    def yzx(self) -> Self:
-        return Vec3(self[1], self[2], self[0])
-
-    @property
-    def yzy(self) -> Self:
-        return Vec3(self[1], self[2], self[1])
-
-    @property
-    def zxx(self) -> Self:
-        return Vec3(self[2], self[0], self[0])
-
-    @property
-    def zyy(self) -> Self:
-        return Vec3(self[2], self[1], self[1])
-
-    @property
-    def zzz(self) -> Self:
-        return Vec3(self[2], self[2], self[2])
-
-    @property
-    def zxy(self) -> Self:
-        return Vec3(self[2], self[0], self[1])
-
-    @property
-    def zxz(self) -> Self:
-        return Vec3(self[2], self[0], self[2])
-
-    @property
-    def zyx(self) -> Self:
-        return Vec3(self[2], self[1], self[0])
-
-    @property
-    def zyz(self) -> Self:
-        return Vec3(self[2], self[1], self[2])
-
-    @property
-    def zzx(self) -> Self:
-        return Vec3(self[2], self[2], self[0])
-
-    @property
-    def zzy(self) -> Self:
-        return Vec3(self[2], self[2], self[1])
+    # Component and swizzle properties (x, y, z, xy, zx, ..., xzy, zzz, ...) are generated below the class
 
     @property
     def rounded(self) -> bool:
@@ -182,11 +28,11 @@ class Vec3(tuple):
 
     @property
     def length(self) -> float:
-        return math.sqrt(self[0] ** 2 + self[1] ** 2 + self[2] ** 2)
+        return math.sqrt(self[0] * self[0] + self[1] * self[1] + self[2] * self[2])
 
     @property
     def length_squared(self) -> float:
-        return self[0] ** 2 + self[1] ** 2 + self[2] ** 2
+        return self[0] * self[0] + self[1] * self[1] + self[2] * self[2]
 
     # METHODS
 
@@ -200,17 +46,56 @@ class Vec3(tuple):
 
     def distance(self, other: Self) -> float:
         """Calculate the distance to another vector"""
-        return math.sqrt(pow(self[0] - other[0], 2) + pow(self[1] - other[1], 2) + pow(self[2] - other[2], 2))
+        dx, dy, dz = self[0] - other[0], self[1] - other[1], self[2] - other[2]
+        return math.sqrt(dx * dx + dy * dy + dz * dz)
 
     def distance_squared(self, other: Self) -> float:
         """Calculate the squared distance to another vector"""
-        return abs(self[0] - other[0]) + abs(self[1] - other[1]) + abs(self[2] - other[2])
+        dx, dy, dz = self[0] - other[0], self[1] - other[1], self[2] - other[2]
+        return dx * dx + dy * dy + dz * dz
 
     def normalize(self) -> Self:
         """Normalize the vector to a length of 1"""
-        if self.length == 0:
+        length = math.sqrt(self[0] * self[0] + self[1] * self[1] + self[2] * self[2])
+        if length == 0:
             return Vec3(0, 0, 0)
-        return self.__truediv__(self.length)
+        return Vec3(self[0] / length, self[1] / length, self[2] / length)
+
+    def dot(self, other: Self) -> float:
+        """Calculate the dot product with another vector"""
+        return self[0] * other[0] + self[1] * other[1] + self[2] * other[2]
+
+    def cross(self, other: Self) -> Self:
+        """Calculate the cross product with another vector"""
+        return Vec3(self[1] * other[2] - self[2] * other[1],
+                    self[2] * other[0] - self[0] * other[2],
+                    self[0] * other[1] - self[1] * other[0])
+
+    def lerp(self, other: Self, t: float) -> Self:
+        """Linear interpolation to another vector (t = 0 is this vector, t = 1 the other one)"""
+        return Vec3(self[0] + (other[0] - self[0]) * t, self[1] + (other[1] - self[1]) * t, self[2] + (other[2] - self[2]) * t)
+
+    def clamp_length(self, max_length: float) -> Self:
+        """Limit the length of the vector to a maximum"""
+        length_squared = self[0] * self[0] + self[1] * self[1] + self[2] * self[2]
+        if length_squared <= max_length * max_length:
+            return self
+        factor = max_length / math.sqrt(length_squared)
+        return Vec3(self[0] * factor, self[1] * factor, self[2] * factor)
+
+    def move_towards(self, target: Self, max_distance: float) -> Self:
+        """Move the vector towards a target by a maximum distance without overshooting"""
+        dx, dy, dz = target[0] - self[0], target[1] - self[1], target[2] - self[2]
+        distance_squared = dx * dx + dy * dy + dz * dz
+        if distance_squared <= max_distance * max_distance:
+            return Vec3(target[0], target[1], target[2])
+        factor = max_distance / math.sqrt(distance_squared)
+        return Vec3(self[0] + dx * factor, self[1] + dy * factor, self[2] + dz * factor)
+
+    def reflect(self, normal: Self) -> Self:
+        """Reflect the vector on a surface with a specific (unit) normal"""
+        factor = 2 * (self[0] * normal[0] + self[1] * normal[1] + self[2] * normal[2])
+        return Vec3(self[0] - normal[0] * factor, self[1] - normal[1] * factor, self[2] - normal[2] * factor)
 
     def round(self, n: int = None) -> Self:
         """Round the vector to a vector with integer values"""
@@ -273,3 +158,6 @@ class Vec3(tuple):
 
     def __str__(self) -> str:
         return f"({self[0]}, {self[1]}, {self[2]})"
+
+
+_add_swizzles(Vec3, "xyz", {2: Vec, 3: Vec3})
@@ -0,0 +1,384 @@
+"""Contains the 3D vector array class for batched vector math and transforms
+
+Uses NumPy as backend when it is installed, otherwise a flat array of doubles
+"""
+
+# Standard modules
+from typing import Union, Self, Iterable, Iterator, Callable, Any
+from array import array
+from itertools import cycle, repeat
+import operator
+import math
+
+# External modules
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Local modules
+from .vector2d_array import VecArray, _floats
+from .vector3d import Vec3
+
+
+class Vec3Array:
+    """3D vector array class
+
+    Stores the vectors in a contiguous float64 buffer and applies all operators and transforms to the whole batch at once.
+    With NumPy the buffer is an array of the shape (n, 3), otherwise an interleaved array('d') [x0, y0, z0, x1, ...]
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, vectors: Iterable[tuple[Union[int, float], Union[int, float], Union[int, float]]] = ()) -> None:
+
+        if np is not None:
+            self.data = np.array([(v[0], v[1], v[2]) for v in vectors], dtype=np.float64).reshape(-1, 3)
+        else:
+            self.data = array("d")
+            for v in vectors:
+                self.data.append(v[0])
+                self.data.append(v[1])
+                self.data.append(v[2])
+
+    # CLASS METHODS
+
+    @classmethod
+    def from_buffer(cls, data: Any) -> Self:
+        """Wrap an existing buffer without copying it (NumPy array of shape (n, 3) or interleaved array('d'))"""
+        instance = cls.__new__(cls)
+        if np is not None:
+            instance.data = np.asarray(data, dtype=np.float64).reshape(-1, 3)
+        else:
+            instance.data = data if isinstance(data, array) and data.typecode == "d" else array("d", data)
+        return instance
+
+    @classmethod
+    def from_xyz(cls, xs: Iterable[Union[int, float]], ys: Iterable[Union[int, float]], zs: Iterable[Union[int, float]]) -> Self:
+        """Create an array from separate sequences of x, y and z values"""
+        if np is not None:
+            return cls.from_buffer(np.column_stack((_floats(xs), _floats(ys), _floats(zs))))
+        data = array("d")
+        for x, y, z in zip(xs, ys, zs):
+            data.append(x)
+            data.append(y)
+            data.append(z)
+        return cls.from_buffer(data)
+
+    @classmethod
+    def zeros(cls, size: int) -> Self:
+        """Create an array with a specific amount of null vectors"""
+        if np is not None:
+            return cls.from_buffer(np.zeros((size, 3), dtype=np.float64))
+        return cls.from_buffer(array("d", bytes(24 * size)))
+
+    @classmethod
+    def full(cls, size: int, vector: tuple[Union[int, float], Union[int, float], Union[int, float]]) -> Self:
+        """Create an array with a specific amount of copies of a vector"""
+        if np is not None:
+            return cls.from_buffer(np.tile(np.asarray(vector[:3], dtype=np.float64), (size, 1)))
+        return cls.from_buffer(array("d", (vector[0], vector[1], vector[2])) * size)
+
+    # PROPERTIES
+
+    @property
+    def x(self) -> Any:
+        if np is not None:
+            return self.data[:, 0]
+        return self.data[0::3]
+
+    @property
+    def y(self) -> Any:
+        if np is not None:
+            return self.data[:, 1]
+        return self.data[1::3]
+
+    @property
+    def z(self) -> Any:
+        if np is not None:
+            return self.data[:, 2]
+        return self.data[2::3]
+
+    @property
+    def xy(self) -> VecArray:
+        if np is not None:
+            return VecArray.from_buffer(self.data[:, :2])
+        return VecArray.from_xy(self.data[0::3], self.data[1::3])
+
+    @property
+    def length(self) -> Any:
+        if np is not None:
+            return np.sqrt(np.einsum("ij,ij->i", self.data, self.data))
+        return array("d", map(math.sqrt, self.length_squared))
+
+    @property
+    def length_squared(self) -> Any:
+        if np is not None:
+            return np.einsum("ij,ij->i", self.data, self.data)
+        xs, ys, zs = self.data[0::3], self.data[1::3], self.data[2::3]
+        return array("d", (x * x + y * y + z * z for x, y, z in zip(xs, ys, zs)))
+
+    # METHODS
+
+    def list(self) -> list[Vec3]:
+        """Create a list with the vectors as elements"""
+        return list(self)
+
+    def copy(self) -> Self:
+        """Create a copy of the array with its own buffer"""
+        return Vec3Array.from_buffer(self.data.copy() if np is not None else array("d", self.data))
+
+    def distance(self, other: Union[Self, tuple[Union[int, float], Union[int, float], Union[int, float]]]) -> Any:
+        """Calculate the distances to other vectors (element by element) or to a single vector"""
+        return self.__sub__(other).length
+
+    def distance_squared(self, other: Union[Self, tuple[Union[int, float], Union[int, float], Union[int, float]]]) -> Any:
+        """Calculate the squared distances to other vectors (element by element) or to a single vector"""
+        return self.__sub__(other).length_squared
+
+    def normalize(self) -> Self:
+        """Normalize all vectors to a length of 1 (null vectors stay null vectors)"""
+
+        if np is not None:
+            length = np.sqrt(np.einsum("ij,ij->i", self.data, self.data))[:, None]
+            return Vec3Array.from_buffer(np.divide(self.data, length, out=np.zeros_like(self.data), where=length != 0))
+
+        data = array("d", bytes(8 * len(self.data)))
+        for i in range(0, len(self.data), 3):
+            x, y, z = self.data[i], self.data[i + 1], self.data[i + 2]
+            length = math.sqrt(x * x + y * y + z * z)
+            if length != 0:
+                data[i] = x / length
+                data[i + 1] = y / length
+                data[i + 2] = z / length
+        return Vec3Array.from_buffer(data)
+
+    def scale(self, factors: Iterable[Union[int, float]]) -> Self:
+        """Multiply each vector by its own factor"""
+
+        if np is not None:
+            return Vec3Array.from_buffer(self.data * _floats(factors)[:, None])
+        factors = array("d", factors)
+        return Vec3Array.from_buffer(array("d", map(operator.mul, self.data, (f for f in factors for _ in (0, 1, 2)))))
+
+    def transform(self, matrix: tuple[float, ...]) -> Self:
+        """Transform all vectors with a 3x3 matrix or an affine 4x4 matrix (w = 1, no perspective division)"""
+
+        if len(matrix) == 9:
+            m00, m01, m02, m10, m11, m12, m20, m21, m22 = matrix
+            t0 = t1 = t2 = 0
+        elif len(matrix) == 16:
+            m00, m01, m02, t0, m10, m11, m12, t1, m20, m21, m22, t2 = matrix[:12]
+        else:
+            raise ValueError(f"Cannot transform vectors with a matrix of {len(matrix)} values!")
+
+        if np is not None:
+            linear = np.array(((m00, m01, m02), (m10, m11, m12), (m20, m21, m22)), dtype=np.float64)
+            data = self.data @ linear.T
+            if t0 or t1 or t2:
+                data += (t0, t1, t2)
+            return Vec3Array.from_buffer(data)
+
+        data = array("d", bytes(8 * len(self.data)))
+        source = self.data
+        for i in range(0, len(source), 3):
+            x, y, z = source[i], source[i + 1], source[i + 2]
+            data[i] = m00 * x + m01 * y + m02 * z + t0
+            data[i + 1] = m10 * x + m11 * y + m12 * z + t1
+            data[i + 2] = m20 * x + m21 * y + m22 * z + t2
+        return Vec3Array.from_buffer(data)
+
+    def project(self, matrix: tuple[float, ...], dimension: tuple[int, int]) -> VecArray:
+        """Project all vectors with a 4x4 (view) projection matrix to screen coordinates of a specific dimension
+
+        Vectors with w = 0 after the projection (on the camera plane) are mapped to the screen center
+        """
+
+        if len(matrix) != 16:
+            raise ValueError(f"Cannot project vectors with a matrix of {len(matrix)} values!")
+        width, height = dimension[0], dimension[1]
+
+        if np is not None:
+            clip = self.data @ np.array(matrix, dtype=np.float64).reshape(4, 4)[:, :3].T + matrix[3::4]
+            w = clip[:, 3:4]
+            ndc = np.divide(clip[:, :2], w, out=np.zeros((len(clip), 2)), where=w != 0)
+            ndc[:, 0] += 1
+            ndc[:, 0] *= width / 2
+            ndc[:, 1] *= -1
+            ndc[:, 1] += 1
+            ndc[:, 1] *= height / 2
+            return VecArray.from_buffer(ndc)
+
+        m00, m01, m02, m03, m10, m11, m12, m13, _, _, _, _, m30, m31, m32, m33 = matrix
+        half_width, half_height = width / 2, height / 2
+        data = array("d", bytes(len(self.data) // 3 * 16))
+        source = self.data
+        for i in range(0, len(source) // 3):
+            x, y, z = source[3 * i], source[3 * i + 1], source[3 * i + 2]
+            w = m30 * x + m31 * y + m32 * z + m33
+            if w == 0:
+                data[2 * i], data[2 * i + 1] = half_width, half_height
+                continue
+            data[2 * i] = ((m00 * x + m01 * y + m02 * z + m03) / w + 1) * half_width
+            data[2 * i + 1] = (1 - (m10 * x + m11 * y + m12 * z + m13) / w) * half_height
+        return VecArray.from_buffer(data)
+
+    def swizzle(self, components: str) -> Union[VecArray, Self]:
+        """Rearrange the components of all vectors to 2D or 3D vectors (for example "xz" or "zyx")"""
+
+        if len(components) not in (2, 3):
+            raise ValueError(f"Cannot swizzle 3D vectors to {len(components)} components!")
+        indices = ["xyz".index(name) for name in components]
+        if np is not None:
+            data = self.data[:, indices]
+            return VecArray.from_buffer(data) if len(indices) == 2 else Vec3Array.from_buffer(data)
+        if len(indices) == 2:
+            return VecArray.from_xy(self.data[indices[0]::3], self.data[indices[1]::3])
+        return Vec3Array.from_xyz(self.data[indices[0]::3], self.data[indices[1]::3], self.data[indices[2]::3])
+
+    def round(self, n: int = None) -> Self:
+        """Round the vectors (values stay floats)"""
+        return self.__round__(n)
+
+    def floor(self) -> Self:
+        """Floor the vectors (values stay floats)"""
+        return self.__floor__()
+
+    def ceil(self) -> Self:
+        """Ceil the vectors (values stay floats)"""
+        return self.__ceil__()
+
+    def _operand(self, other: Any) -> Any:
+        """Get the other operand of an operator in a form matching the buffer"""
+
+        if isinstance(other, Vec3Array):
+            if len(other) != len(self):
+                raise ValueError(f"Cannot operate on vector arrays of different sizes ({len(self)} and {len(other)})!")
+            return other.data
+        if np is not None:
+            return np.asarray(other, dtype=np.float64)
+        if isinstance(other, (int, float)):
+            return repeat(other)
+        return cycle((other[0], other[1], other[2]))
+
+    def _apply(self, func: Callable[[Any, Any], Any], other: Any) -> Self:
+        """Apply a binary operator to all vectors and return a new array"""
+        if np is not None:
+            return Vec3Array.from_buffer(func(self.data, self._operand(other)))
+        return Vec3Array.from_buffer(array("d", map(func, self.data, self._operand(other))))
+
+    def _apply_inplace(self, func: Callable[[Any, Any], Any], other: Any) -> Self:
+        """Apply a binary operator to all vectors in place"""
+        if np is not None:
+            func(self.data, self._operand(other))
+        else:
+            self.data[:] = array("d", map(func, self.data, self._operand(other)))
+        return self
+
+    def _apply_unary(self, func: Callable[[Any], Any]) -> Self:
+        """Apply an unary function to all values and return a new array"""
+        return Vec3Array.from_buffer(array("d", map(func, self.data)))
+
+    # OVERLOADS
+
+    def __len__(self) -> int:
+        return len(self.data) if np is not None else len(self.data) // 3
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Vec3, Self]:
+        if isinstance(index, slice):
+            if np is not None:
+                return Vec3Array.from_buffer(self.data[index])
+            start, stop, step = index.indices(len(self))
+            data = array("d")
+            for i in range(start, stop, step):
+                data.extend(self.data[3 * i:3 * i + 3])
+            return Vec3Array.from_buffer(data)
+        if np is not None:
+            x, y, z = self.data[index].tolist()
+            return Vec3(x, y, z)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Vector array index out of range!")
+        return Vec3(self.data[3 * index], self.data[3 * index + 1], self.data[3 * index + 2])
+
+    def __setitem__(self, index: int, vector: tuple[Union[int, float], Union[int, float], Union[int, float]]) -> None:
+        if np is not None:
+            self.data[index] = vector[0], vector[1], vector[2]
+            return
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Vector array index out of range!")
+        self.data[3 * index] = vector[0]
+        self.data[3 * index + 1] = vector[1]
+        self.data[3 * index + 2] = vector[2]
+
+    def __iter__(self) -> Iterator[Vec3]:
+        if np is not None:
+            return (Vec3(x, y, z) for x, y, z in self.data.tolist())
+        return map(Vec3, self.data[0::3], self.data[1::3], self.data[2::3])
+
+    def __add__(self, other: Union[Self, tuple[Union[int, float], Union[int, float], Union[int, float]]]) -> Self:
+        return self._apply(operator.add, other)
+
+    def __sub__(self, other: Union[Self, tuple[Union[int, float], Union[int, float], Union[int, float]]]) -> Self:
+        return self._apply(operator.sub, other)
+
+    def __mul__(self, factor: Union[int, float, Self, tuple[Union[int, float], Union[int, float], Union[int, float]]]) -> Self:
+        return self._apply(operator.mul, factor)
+
+    def __truediv__(self, divisor: Union[int, float, Self, tuple[Union[int, float], Union[int, float], Union[int, float]]]) -> Self:
+        return self._apply(operator.truediv, divisor)
+
+    def __floordiv__(self, divisor: Union[int, float, Self, tuple[Union[int, float], Union[int, float], Union[int, float]]]) -> Self:
+        return self._apply(operator.floordiv, divisor)
+
+    def __iadd__(self, other: Union[Self, tuple[Union[int, float], Union[int, float], Union[int, float]]]) -> Self:
+        return self._apply_inplace(operator.iadd, other)
+
+    def __isub__(self, other: Union[Self, tuple[Union[int, float], Union[int, float], Union[int, float]]]) -> Self:
+        return self._apply_inplace(operator.isub, other)
+
+    def __imul__(self, factor: Union[int, float, Self, tuple[Union[int, float], Union[int, float], Union[int, float]]]) -> Self:
+        return self._apply_inplace(operator.imul, factor)
+
+    def __itruediv__(self, divisor: Union[int, float, Self, tuple[Union[int, float], Union[int, float], Union[int, float]]]) -> Self:
+        return self._apply_inplace(operator.itruediv, divisor)
+
+    def __ifloordiv__(self, divisor: Union[int, float, Self, tuple[Union[int, float], Union[int, float], Union[int, float]]]) -> Self:
+        return self._apply_inplace(operator.ifloordiv, divisor)
+
+    def __round__(self, n: int = None) -> Self:
+        if np is not None:
+            return Vec3Array.from_buffer(np.round(self.data, n or 0))
+        return self._apply_unary(lambda value: round(value, n or 0))
+
+    def __floor__(self) -> Self:
+        if np is not None:
+            return Vec3Array.from_buffer(np.floor(self.data))
+        return self._apply_unary(math.floor)
+
+    def __ceil__(self) -> Self:
+        if np is not None:
+            return Vec3Array.from_buffer(np.ceil(self.data))
+        return self._apply_unary(math.ceil)
+
+    def __abs__(self) -> Self:
+        if np is not None:
+            return Vec3Array.from_buffer(np.abs(self.data))
+        return self._apply_unary(abs)
+
+    def __pos__(self) -> Self:
+        return self
+
+    def __neg__(self) -> Self:
+        if np is not None:
+            return Vec3Array.from_buffer(-self.data)
+        return self._apply_unary(operator.neg)
+
+    def __repr__(self) -> str:
+        return f"Vec3Array[id={id(self)}, size={len(self)}, backend={'numpy' if np is not None else 'array'}]"
+
+    def __str__(self) -> str:
+        return f"[{', '.join(str(vector) for vector in self)}]"
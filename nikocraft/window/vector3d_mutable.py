@@ -0,0 +1,230 @@
+"""Contains the mutable 3D vector class"""
+
+# Standard modules
+from typing import Union, Self, Iterator
+import math
+
+# Local modules
+from .vector3d import Vec3
+
+
+class MVec3:
+    """Mutable 3D vector class
+
+    Counterpart of Vec3 with in-place operators for hot update loops (pos += vel * dt)
+    """
+
+    __slots__ = ("x", "y", "z")
+
+    __hash__ = None
+
+    def __init__(self, x: Union[int, float] = 0, y: Union[int, float] = 0, z: Union[int, float] = 0) -> None:
+
+        self.x: Union[int, float] = x
+        self.y: Union[int, float] = y
+        self.z: Union[int, float] = z
+
+    # CLASS METHODS
+
+    @classmethod
+    def of(cls, vector: tuple[Union[int, float], Union[int, float], Union[int, float]]) -> Self:
+        """Create a mutable vector from a vector or any sequence of three numbers"""
+        return cls(vector[0], vector[1], vector[2])
+
+    # PROPERTIES
+
+    @property
+    def length(self) -> float:
+        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+    @property
+    def length_squared(self) -> float:
+        return self.x * self.x + self.y * self.y + self.z * self.z
+
+    # METHODS
+
+    def vec3(self) -> Vec3:
+        """Create an immutable vector with the current values"""
+        return Vec3(self.x, self.y, self.z)
+
+    def copy(self) -> Self:
+        """Create a copy of the vector"""
+        return MVec3(self.x, self.y, self.z)
+
+    def set(self, x: Union[int, float], y: Union[int, float], z: Union[int, float]) -> Self:
+        """Set the x, y and z values"""
+        self.x = x
+        self.y = y
+        self.z = z
+        return self
+
+    def update(self, vector: tuple[Union[int, float], Union[int, float], Union[int, float]]) -> Self:
+        """Set the values to the values of another vector"""
+        self.x = vector[0]
+        self.y = vector[1]
+        self.z = vector[2]
+        return self
+
+    def add_scaled(self, vector: tuple[Union[int, float], Union[int, float], Union[int, float]], factor: Union[int, float]) -> Self:
+        """Add another vector multiplied by a factor in place (pos.add_scaled(vel, dt))"""
+        self.x += vector[0] * factor
+        self.y += vector[1] * factor
+        self.z += vector[2] * factor
+        return self
+
+    def normalize_ip(self) -> Self:
+        """Normalize the vector to a length of 1 in place"""
+        length = math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+        if length != 0:
+            self.x /= length
+            self.y /= length
+            self.z /= length
+        return self
+
+    def clamp_length_ip(self, max_length: float) -> Self:
+        """Limit the length of the vector to a maximum in place"""
+        length_squared = self.x * self.x + self.y * self.y + self.z * self.z
+        if length_squared > max_length * max_length:
+            factor = max_length / math.sqrt(length_squared)
+            self.x *= factor
+            self.y *= factor
+            self.z *= factor
+        return self
+
+    def distance(self, other: tuple[Union[int, float], Union[int, float], Union[int, float]]) -> float:
+        """Calculate the distance to another vector"""
+        dx, dy, dz = self.x - other[0], self.y - other[1], self.z - other[2]
+        return math.sqrt(dx * dx + dy * dy + dz * dz)
+
+    def distance_squared(self, other: tuple[Union[int, float], Union[int, float], Union[int, float]]) -> float:
+        """Calculate the squared distance to another vector"""
+        dx, dy, dz = self.x - other[0], self.y - other[1], self.z - other[2]
+        return dx * dx + dy * dy + dz * dz
+
+    def dot(self, other: tuple[Union[int, float], Union[int, float], Union[int, float]]) -> float:
+        """Calculate the dot product with another vector"""
+        return self.x * other[0] + self.y * other[1] + self.z * other[2]
+
+    # OVERLOADS
+
+    def __len__(self) -> int:
+        return 3
+
+    def __getitem__(self, index: int) -> Union[int, float]:
+        if index == 0 or index == -3:
+            return self.x
+        if index == 1 or index == -2:
+            return self.y
+        if index == 2 or index == -1:
+            return self.z
+        if isinstance(index, slice):
+            return (self.x, self.y, self.z)[index]
+        raise IndexError("Vector index out of range!")
+
+    def __setitem__(self, index: int, value: Union[int, float]) -> None:
+        if index == 0 or index == -3:
+            self.x = value
+        elif index == 1 or index == -2:
+            self.y = value
+        elif index == 2 or index == -1:
+            self.z = value
+        else:
+            raise IndexError("Vector index out of range!")
+
+    def __iter__(self) -> Iterator[Union[int, float]]:
+        yield self.x
+        yield self.y
+        yield self.z
+
+    def __eq__(self, other: tuple[Union[int, float], Union[int, float], Union[int, float]]) -> bool:
+        try:
+            return len(other) == 3 and self.x == other[0] and self.y == other[1] and self.z == other[2]
+        except TypeError:
+            return NotImplemented
+
+    def __ne__(self, other: tuple[Union[int, float], Union[int, float], Union[int, float]]) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __iadd__(self, other: tuple[Union[int, float], Union[int, float], Union[int, float]]) -> Self:
+        self.x += other[0]
+        self.y += other[1]
+        self.z += other[2]
+        return self
+
+    def __isub__(self, other: tuple[Union[int, float], Union[int, float], Union[int, float]]) -> Self:
+        self.x -= other[0]
+        self.y -= other[1]
+        self.z -= other[2]
+        return self
+
+    def __imul__(self, factor: Union[int, float, tuple[Union[int, float], Union[int, float], Union[int, float]]]) -> Self:
+        if isinstance(factor, (int, float)):
+            self.x *= factor
+            self.y *= factor
+            self.z *= factor
+        else:
+            self.x *= factor[0]
+            self.y *= factor[1]
+            self.z *= factor[2]
+        return self
+
+    def __itruediv__(self, divisor: Union[int, float]) -> Self:
+        self.x /= divisor
+        self.y /= divisor
+        self.z /= divisor
+        return self
+
+    def __ifloordiv__(self, divisor: Union[int, float]) -> Self:
+        self.x //= divisor
+        self.y //= divisor
+        self.z //= divisor
+        return self
+
+    def __add__(self, other: tuple[Union[int, float], Union[int, float], Union[int, float]]) -> Self:
+        return MVec3(self.x + other[0], self.y + other[1], self.z + other[2])
+
+    def __radd__(self, other: tuple[Union[int, float], Union[int, float], Union[int, float]]) -> Self:
+        return MVec3(other[0] + self.x, other[1] + self.y, other[2] + self.z)
+
+    def __sub__(self, other: tuple[Union[int, float], Union[int, float], Union[int, float]]) -> Self:
+        return MVec3(self.x - other[0], self.y - other[1], self.z - other[2])
+
+    def __rsub__(self, other: tuple[Union[int, float], Union[int, float], Union[int, float]]) -> Self:
+        return MVec3(other[0] - self.x, other[1] - self.y, other[2] - self.z)
+
+    def __mul__(self, factor: Union[int, float]) -> Self:
+        return MVec3(self.x * factor, self.y * factor, self.z * factor)
+
+    def __rmul__(self, factor: Union[int, float]) -> Self:
+        return MVec3(self.x * factor, self.y * factor, self.z * factor)
+
+    def __truediv__(self, divisor: Union[int, float]) -> Self:
+        return MVec3(self.x / divisor, self.y / divisor, self.z / divisor)
+
+    def __floordiv__(self, divisor: Union[int, float]) -> Self:
+        return MVec3(self.x // divisor, self.y // divisor, self.z // divisor)
+
+    def __round__(self, n: int = None) -> Self:
+        return MVec3(round(self.x, n), round(self.y, n), round(self.z, n))
+
+    def __floor__(self) -> Self:
+        return MVec3(math.floor(self.x), math.floor(self.y), math.floor(self.z))
+
+    def __ceil__(self) -> Self:
+        return MVec3(math.ceil(self.x), math.ceil(self.y), math.ceil(self.z))
+
+    def __abs__(self) -> Self:
+        return MVec3(abs(self.x), abs(self.y), abs(self.z))
+
+    def __pos__(self) -> Self:
+        return MVec3(self.x, self.y, self.z)
+
+    def __neg__(self) -> Self:
+        return MVec3(-self.x, -self.y, -self.z)
+
+    def __repr__(self) -> str:
+        return f"MVec3[id={id(self)}, x={self.x}, y={self.y}, z={self.z}]"
+
+    def __str__(self) -> str:
+        return f"({self.x}, {self.y}, {self.z})"
@@ -2,6 +2,10 @@
 
 # Standard modules
 from typing import Callable, Self
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future
+import asyncio
+import threading
 import os
 import ctypes
 import logging
@@ -14,13 +18,24 @@ import pygame as pg
 from ..constants import *
 from ..app import App
 from ..utils import time
+from ..utils.profiler import Profiler
 from .vector2d import Vec
-from .rgb import RGB
 from .clock import Clock
 from .font import FontManager
-from .event_hook import EventHook
+from .event_hook import EventHook, EventHookList
 from .scene import Scene
+from .transition import Transition, FadeTransition
+from .frame_controller import FrameController
+from .gc_manager import GCManager
 from .surface_interface import SurfaceInterface
+from .window_options import PacingOptions, RenderOptions, UpdateOptions, SceneOptions, FontOptions, RuntimeOptions
+
+
+# Event types of which only the last one of a frame is kept when coalescing
+COALESCE_LAST_EVENTS: frozenset[int] = frozenset((pg.VIDEORESIZE, pg.WINDOWRESIZED, pg.WINDOWSIZECHANGED, pg.WINDOWMOVED))
+
+# Event types with a mouse position, which are mapped to the render resolution below a render scale of 1
+MOUSE_POSITION_EVENTS: frozenset[int] = frozenset((pg.MOUSEMOTION, pg.MOUSEBUTTONDOWN, pg.MOUSEBUTTONUP))
 
 
 class Window(SurfaceInterface):
@@ -31,55 +46,124 @@ class Window(SurfaceInterface):
     def __init__(self, app: App, *, fps: int = DEFAULT_FPS,
                  width: int = DEFAULT_WIDTH, height: int = DEFAULT_HEIGHT,
                  flags: int = 0, auto_update_screen: bool = True, auto_quit: bool = True,
-                 scene_mode: bool = False, start_scene: str = "", start_scene_args: dict = None) -> None:
+                 scene_mode: bool = False, start_scene: str = "", start_scene_args: dict = None,
+                 pacing: PacingOptions = None, rendering: RenderOptions = None, updating: UpdateOptions = None,
+                 scenes: SceneOptions = None, fonts: FontOptions = None, runtime: RuntimeOptions = None) -> None:
 
         super(Window, self).__init__("screen")
 
         # App
         self.app = app
 
+        # Options
+        pacing = PacingOptions() if pacing is None else pacing
+        rendering = RenderOptions() if rendering is None else rendering
+        updating = UpdateOptions() if updating is None else updating
+        scenes = SceneOptions() if scenes is None else scenes
+        fonts = FontOptions() if fonts is None else fonts
+        runtime = RuntimeOptions() if runtime is None else runtime
+
         # Initialize
         self.logger.info("Initialize window ...")
 
         # General information
         self.target_dimension: Vec = Vec(width, height)
         self.screen: pg.Surface = pg.Surface(self.target_dimension)
+        self.display: pg.Surface = self.screen
         self.running: bool = False
-        self.clock: Clock = Clock(fps)
+        self.clock: Clock = Clock(fps, pacing.history, pacing.precise, pacing.spin_budget)
         self.flags: int = flags
         self.auto_update_screen: bool = auto_update_screen
         self.auto_quit: bool = auto_quit
 
+        # Dirty rectangles
+        self.dirty_rects_mode: bool = rendering.dirty_rects
+        self.dirty_threshold: float = rendering.dirty_threshold
+        self.dirty_rects: list[pg.Rect] = []
+        self.full_update: bool = True
+
+        # Render scale (the screen is an offscreen surface scaled to the display below 1)
+        self.render_scale: float = 1
+        self.smooth_scale: bool = False
+        self.frame_controller: FrameController | None = rendering.frame_controller
+
+        # Fixed timestep
+        self.fixed_timestep: float = updating.fixed_timestep
+        self.max_fixed_steps: int = updating.max_fixed_steps
+        self.fixed_accumulator: float = 0
+        self.interpolation: float = 0
+
+        # Update thread
+        self.threaded_update: bool = updating.threaded
+        self.update_executor: ThreadPoolExecutor | None = None
+
+        # Asyncio
+        self.event_loop: asyncio.AbstractEventLoop | None = None
+        self.event_loop_thread: int = 0
+
+        # Profiler (disabled by default, receives the spans of time.span and time.profiled)
+        self.profiler: Profiler = Profiler() if runtime.profiler is None else runtime.profiler
+        if self.profiler.logger is None:
+            self.profiler.logger = self.logger
+        time.set_profiler(self.profiler)
+
+        # Garbage collector control
+        self.gc_manager: GCManager | None = runtime.gc_manager
+
         # Statistics
+        self.stat_main_thread_time: float = 0
+        self.stat_update_thread_time: float = 0
+        self.stat_update_wait_time: float = 0
+        self.stat_fixed_update_time: float = 0
+        self.stat_fixed_steps: int = 0
         self.stat_event_time: float = 0
         self.stat_render_time: float = 0
         self.stat_e_update_time: float = 0
         self.stat_update_time: float = 0
         self.stat_l_update_time: float = 0
         self.stat_other_time: float = 0
+        self.stat_dirty_area: float = 100
+        self.stat_scene_load_time: float = 0
 
         # Scene management
         self.scene_mode: bool = scene_mode
         self.start_scene: str = start_scene
         self.start_scene_args: dict = {} if start_scene_args is None else start_scene_args
         self.scene: Scene | None = None
+        self.scene_name: str = ""
         self.next_scene_name: str = ""
         self.next_scene_args: dict = {}
+        self.next_scene: Scene | None = None
+        self.next_scene_future: Future | None = None
+        self.preload_executor: ThreadPoolExecutor | None = None
         self.transition_duration: int = 0
         self.transition_pause: int = 0
         self.transition_tick: float = -1
-        self.transition_surface: pg.Surface = pg.Surface((0, 0))
+        self.default_transition: Transition = FadeTransition()
+        self.transition: Transition = self.default_transition
         self.scene_index: dict[str, type] = {}
 
+        # Scene retention (suspended scenes by name in least recently used order)
+        self.max_retained_scenes: int = scenes.retain
+        self.retained_scenes: OrderedDict[str, Scene] = OrderedDict()
+
         # Initialize pygame
         pg.init()
 
         # Initialize font manager
-        self.font: FontManager = FontManager()
+        self.font: FontManager = FontManager(max_fonts=fonts.max_fonts, sysfont_cache_path=fonts.sysfont_cache_path,
+                                             logger=self.logger)
 
         # Event hooks
         self._event_hook_id = 0
-        self.event_hooks: list[EventHook] = []
+        self._event_hook_lock: threading.Lock = threading.Lock()
+        self.event_hooks: EventHookList[EventHook] = EventHookList()
+
+        # Event hook lookup by id and by event type (rebuilt when the event hook list is changed directly)
+        self.event_hook_index: dict[int, EventHook] = {}
+        self.event_dispatch: dict[int, tuple[EventHook, ...]] = {}
+        self._event_hooks_version: int = -1
+        self.coalesce_events: bool = updating.coalesce_events
 
         # Set initialized flag
         self._initialized = True
@@ -94,6 +178,18 @@ class Window(SurfaceInterface):
     def dt(self) -> float:
         return self.clock.delta_time
 
+    @property
+    def fixed_dt(self) -> float:
+        return self.fixed_timestep
+
+    @property
+    def scene_load_progress(self) -> float:
+        if self.next_scene_name == "" or self.next_scene_future is None:
+            return 1
+        if self.next_scene is None:
+            return 0
+        return self.next_scene.load_progress
+
     # METHODS
 
     def open(self) -> None:
@@ -102,143 +198,597 @@ class Window(SurfaceInterface):
         *Returns nothing*
         """
 
+        self._start()
+        while self.running:
+            self._frame()
+        self._stop()
+
+    async def run_async(self) -> None:
+        """Open the window inside a running asyncio event loop (await window.run_async())
+
+        *Returns nothing -
+        The event loop runs other tasks in the time left until the next frame, instead of sleeping in the clock -
+        The garbage collector manager only gets the slack left after the ready tasks ran*
+        """
+
+        self.event_loop = asyncio.get_running_loop()
+        self.event_loop_thread = threading.get_ident()
+
+        self._start()
+        try:
+            while self.running:
+                await asyncio.sleep(self.clock.remaining_time())
+                self._frame()
+                if self.gc_manager is not None:
+                    await asyncio.sleep(0)
+                    self.gc_manager.end_frame(self.clock.remaining_time())
+        finally:
+            self._stop()
+            self.event_loop = None
+
+    def _start(self) -> None:
+        """Open the window and load the start scene"""
+
         # Check for initialization
         assert self._initialized, "Window was not initialized!"
         self.running = True
 
         # Open window
         self.logger.info("Open window ...")
-        self.screen: pg.Surface = pg.display.set_mode(self.target_dimension, self.flags)
+        self.display: pg.Surface = pg.display.set_mode(self.target_dimension, self.flags)
+        self.screen: pg.Surface = self.display
+        if self.gc_manager is not None:
+            self.gc_manager.install()
         self.init()
 
+        # Start update thread
+        if self.threaded_update:
+            self.update_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="Update")
+
         # Load start scene
         if self.scene_mode:
+            self.preload_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="Preload")
             if self.start_scene == "":
                 if not self.scene_index:
                     raise ValueError("Empty scene index! Register scenes to use the scene mode ...")
-                self.scene: Scene | None = tuple(self.scene_index.values())[0](self, self.start_scene_args)
+                self.scene_name = tuple(self.scene_index.keys())[0]
             else:
                 if self.start_scene not in self.scene_index:
                     raise KeyError("Missing scene in index! Register scenes to use the scene mode ...")
-                self.scene: Scene | None = self.scene_index[self.start_scene](self, self.start_scene_args)
+                self.scene_name = self.start_scene
+            scene, load_time = self._preload_scene(self.scene_index[self.scene_name], self.start_scene_args)
+            self.scene: Scene | None = scene
+            self._init_scene(load_time)
+
+    def _frame(self) -> None:
+        """Run a single frame of the window loop"""
+
+        # Clock tick
+        self.clock.tick()
+        frame_benchmark = time.benchmark()
+        frame_start = time.bench_time_ns()
+        if self.frame_controller is not None:
+            self.frame_controller.update(self)
+
+        # Early update
+        benchmark = time.benchmark()
+        self.early_update()
+        if self.scene_mode:
+            self.scene.early_update()
+        self.stat_e_update_time = benchmark()
+        self.profiler.phase("Early Update", self.stat_e_update_time)
+
+        # Event handling
+        benchmark = time.benchmark()
+        events = pg.event.get()
+        if self.coalesce_events:
+            events = self.coalesce(events)
+        if self.screen is not self.display:
+            events = self.scale_events(events)
+        for event in events:
+
+            # Window event handler
+            self.event(event)
+
+            # Scene event handler
+            if self.scene_mode:
+                self.scene.event(event)
+
+            # Event hooks
+            self.index_event_hooks()
+            hooks = self.event_dispatch.get(event.type)
+            if hooks:
+                for hook in hooks:
+                    for handler in hook.handlers:
+                        handler(event, self, hook.data)
+
+            # Default event handlers
+            if event.type == pg.QUIT and self.auto_quit:
+                self.running = False
+        self.stat_event_time = benchmark()
+        self.profiler.phase("Event", self.stat_event_time)
+
+        # Update (on the update thread while rendering the last snapshot in threaded update mode)
+        update_future = None
+        if self.threaded_update:
+            update_future = self.update_executor.submit(self._update)
+        else:
+            self._update()
+            if self.scene_mode:
+                self.scene.swap_render_state()
+
+        # Screen rendering
+        benchmark = time.benchmark()
+        self.render()
+        if self.auto_update_screen:
+            self.update_screen()
+        self.stat_render_time = benchmark()
+        self.profiler.phase("Render", self.stat_render_time)
+
+        # Wait for the update thread
+        if update_future is not None:
+            benchmark = time.benchmark()
+            update_future.result()
+            self.stat_update_wait_time = benchmark()
+            self.profiler.phase("Update Wait", self.stat_update_wait_time)
+            if self.scene_mode:
+                self.scene.swap_render_state()
+
+        # Late update
+        benchmark = time.benchmark()
+        self.late_update()
+        if self.scene_mode:
+            self.scene.late_update()
+        self.stat_l_update_time = benchmark()
+        self.profiler.phase("Late Update", self.stat_l_update_time)
+
+        # Transition updating
+        if self.transition_tick != -1:
+            self.transition_tick += self.dt
+        if self.next_scene_name != "" and self.transition_tick >= self.transition_duration:
+            if self.next_scene_future is not None and not self.next_scene_future.done():
+                # Hold at full black until the preload finished
+                self.transition_tick = self.transition_duration
+            else:
+                self.transition.switch(self.screen)
+                self._switch_scene()
+        if self.transition_tick != -1 \
+           and self.transition_tick >= self.transition_duration * 2 + self.transition_pause:
+            self.transition_duration = 0
+            self.transition_pause = 0
+            self.transition_tick = -1
+            self.full_update = True
+
+        # Main thread time (without waiting for the update thread)
+        self.stat_main_thread_time = frame_benchmark()
+        if self.threaded_update:
+            self.stat_main_thread_time -= self.stat_update_wait_time
+
+        # Garbage collection in the slack time (after the asyncio tasks in run_async)
+        if self.gc_manager is not None and self.event_loop is None:
+            self.gc_manager.end_frame(self.clock.remaining_time())
+
+        # Profiler
+        self.profiler.end_frame(frame_start)
+
+    def _switch_scene(self) -> None:
+        """Replace the current scene with the preloaded or a retained next scene"""
+
+        # Leave current scene
+        self.scene.deactivate_event_hooks()
+        self.scene.cancel_tasks()
+        if self.max_retained_scenes > 0 and self.scene_name != self.next_scene_name:
+            self.scene.suspend()
+            self.retained_scenes[self.scene_name] = self.scene
+            self.retained_scenes.move_to_end(self.scene_name)
+        else:
+            self.scene.quit()
+
+        # Enter next scene
+        scene = self.retained_scenes.pop(self.next_scene_name, None)
+        if scene is None:
+            scene, load_time = self.next_scene_future.result()
+            self.scene: Scene | None = scene
+            self.scene_name = self.next_scene_name
+            self._init_scene(load_time)
+        else:
+            benchmark = time.benchmark()
+            self.scene: Scene | None = scene
+            self.scene_name = self.next_scene_name
+            self.scene.args = self.next_scene_args
             self.scene.activate_event_hooks()
-            self.scene.init()
+            self.scene.resume()
+            self.scene.render_state = self.scene.snapshot()
+            if self.gc_manager is not None:
+                self.gc_manager.scene_loaded()
+            self.stat_scene_load_time = benchmark()
+            self.logger.debug(f"Scene resumed in {self.stat_scene_load_time * 1000:.2f} ms")
+        self.next_scene_name = ""
+        self.next_scene_args = {}
+        self.next_scene = None
+        self.next_scene_future = None
+
+        # Evict least recently used scenes
+        while len(self.retained_scenes) > self.max_retained_scenes:
+            name, evicted = self.retained_scenes.popitem(last=False)
+            self.logger.debug(f"Evict retained scene '{name}' ...")
+            evicted.quit()
+
+    def _preload_scene(self, scene_class: type, args: dict) -> tuple[Scene, float]:
+        """Create a scene and run its preload
+
+        *Runs on the preload thread for scene changes -
+        Returns the scene and the load time in seconds*
+        """
 
-        # Window loop
-        while self.running:
+        benchmark = time.benchmark()
+        scene = scene_class(self, args)
+        if args is self.next_scene_args:
+            self.next_scene = scene
+        scene.preload()
+        scene.load_progress = 1
+        return scene, benchmark()
 
-            # Clock tick
-            self.clock.tick()
+    def _discard_preload(self, future: Future) -> None:
+        """Cancel the tasks and quit the scene of a replaced preload (the preload is cancelled, if it did not start yet)"""
 
-            # Early update
-            benchmark = time.benchmark()
-            self.early_update()
-            if self.scene_mode:
-                self.scene.early_update()
-            self.stat_e_update_time = benchmark()
+        if future.cancel():
+            return
 
-            # Event handling
-            benchmark = time.benchmark()
-            for event in pg.event.get():
+        def done(future: Future) -> None:
+            if future.exception() is None:
+                scene, _ = future.result()
+                self.logger.debug(f"Quit replaced preload of scene '{self.get_scene_name(scene)}' ...")
+                scene.cancel_tasks()
+                scene.quit()
 
-                # Window event handler
-                self.event(event)
+        future.add_done_callback(done)
 
-                # Scene event handler
-                if self.scene_mode:
-                    self.scene.event(event)
+    def _init_scene(self, load_time: float) -> None:
+        """Activate and initialize the current scene after loading
 
-                # Event hooks
-                for hook in self.event_hooks:
-                    if event.type in hook.events:
-                        for handler in hook.handlers:
-                            handler(event, self, hook.data)
+        *Adds the initialization time to the load time in the statistics*
+        """
 
-                # Default event handlers
-                if event.type == pg.QUIT and self.auto_quit:
-                    self.running = False
-            self.stat_event_time = benchmark()
+        benchmark = time.benchmark()
+        self.scene.activate_event_hooks()
+        self.scene.init()
+        self.scene.render_state = self.scene.snapshot()
+        if self.gc_manager is not None:
+            self.gc_manager.scene_loaded()
+        self.stat_scene_load_time = load_time + benchmark()
+        self.profiler.phase("Scene Load", self.stat_scene_load_time)
+        self.logger.debug(f"Scene loaded in {self.stat_scene_load_time * 1000:.2f} ms")
 
-            # Update
-            benchmark = time.benchmark()
-            self.update()
-            if self.scene_mode:
-                self.scene.update()
-            self.stat_update_time = benchmark()
+    def _update(self) -> None:
+        """Run the fixed updates and the update and create the render snapshot of the scene
 
-            # Screen rendering
-            benchmark = time.benchmark()
-            self.render()
-            if self.auto_update_screen:
-                pg.display.flip()
-            self.stat_render_time = benchmark()
+        *Runs on the update thread in threaded update mode*
+        """
 
-            # Late update
+        # Fixed update
+        if self.fixed_timestep > 0:
             benchmark = time.benchmark()
-            self.late_update()
-            if self.scene_mode:
-                self.scene.late_update()
-            self.stat_l_update_time = benchmark()
-
-            # Transition updating
-            if self.transition_tick != -1:
-                self.transition_tick += self.dt
-            if self.next_scene_name != "" and self.transition_tick >= self.transition_duration:
-                self.scene.quit()
-                self.scene.deactivate_event_hooks()
-                self.scene: Scene | None = self.scene_index[self.next_scene_name](self, self.next_scene_args)
-                self.next_scene_name = ""
-                self.next_scene_args = {}
-                self.scene.activate_event_hooks()
-                self.scene.init()
-            if self.transition_tick != -1 \
-               and self.transition_tick >= self.transition_duration * 2 + self.transition_pause:
-                self.transition_duration = 0
-                self.transition_pause = 0
-                self.transition_tick = -1
+            self.run_fixed_updates()
+            self.stat_fixed_update_time = benchmark()
+            self.profiler.phase("Fixed Update", self.stat_fixed_update_time)
+
+        # Update
+        benchmark = time.benchmark()
+        self.update()
+        if self.scene_mode:
+            self.scene.update()
+            self.scene.next_render_state = self.scene.snapshot()
+        self.stat_update_time = benchmark()
+        self.profiler.phase("Update", self.stat_update_time)
+
+        if self.fixed_timestep > 0:
+            self.stat_update_thread_time = self.stat_update_time + self.stat_fixed_update_time
+        else:
+            self.stat_update_thread_time = self.stat_update_time
+
+    def _stop(self) -> None:
+        """Quit the scene and close the window"""
 
         # Shutdown
         self.logger.info("Close window ...")
         if self.scene_mode:
             self.scene.quit()
             self.scene.deactivate_event_hooks()
+            self.scene.cancel_tasks()
+            for scene in self.retained_scenes.values():
+                scene.quit()
+            self.retained_scenes.clear()
+            if self.next_scene_future is not None:
+                self._discard_preload(self.next_scene_future)
+                self.next_scene_future = None
+        if self.update_executor is not None:
+            self.update_executor.shutdown()
+            self.update_executor = None
+        if self.preload_executor is not None:
+            self.preload_executor.shutdown(cancel_futures=True)
+            self.preload_executor = None
+        if self.font.executor is not None:
+            self.font.executor.shutdown(cancel_futures=True)
+            self.font.executor = None
+        self.font.save_sysfont_paths()
         self.quit()
+        if self.gc_manager is not None:
+            self.gc_manager.uninstall()
         pg.quit()
 
+    def run_fixed_updates(self) -> None:
+        """Run the fixed updates for the time elapsed since the last frame
+
+        The elapsed time is collected in an accumulator and consumed in steps of the fixed timestep.
+        At most max_fixed_steps are run per frame, the remaining time is dropped to avoid a spiral of death
+        """
+
+        self.fixed_accumulator += self.clock.delta_time_raw * self.clock.speed_factor
+
+        steps = 0
+        while self.fixed_accumulator >= self.fixed_timestep:
+            if steps >= self.max_fixed_steps:
+                self.fixed_accumulator %= self.fixed_timestep
+                break
+            self.fixed_update()
+            if self.scene_mode:
+                self.scene.fixed_update()
+            self.fixed_accumulator -= self.fixed_timestep
+            steps += 1
+
+        self.stat_fixed_steps = steps
+        self.interpolation = self.fixed_accumulator / self.fixed_timestep
+
+    def update_screen(self) -> None:
+        """Push the rendered frame to the display
+
+        In dirty rectangle mode only the registered rectangles are updated,
+        unless they cover more than the dirty threshold of the screen or a full update was requested
+        """
+
+        if self.screen is not self.display:
+            size = self.display.get_size()
+            if self.smooth_scale:
+                pg.transform.smoothscale(self.screen, size, self.display)
+            else:
+                pg.transform.scale(self.screen, size, self.display)
+            pg.display.flip()
+            self.dirty_rects.clear()
+            self.stat_dirty_area = 100
+            if self.screen.get_size() != self.scaled_size(self.render_scale):
+                self.set_render_scale(self.render_scale, self.smooth_scale)
+            return
+
+        if not self.dirty_rects_mode:
+            pg.display.flip()
+            self.stat_dirty_area = 100
+            return
+
+        rects = self.merge_dirty_rects()
+        self.dirty_rects.clear()
+        screen_area = self.width * self.height
+        dirty_area = sum(rect.w * rect.h for rect in rects)
+
+        if self.full_update or self.transition_tick != -1 or dirty_area > screen_area * self.dirty_threshold:
+            pg.display.flip()
+            self.full_update = False
+            self.stat_dirty_area = 100
+        else:
+            if rects:
+                pg.display.update(rects)
+            self.stat_dirty_area = dirty_area / screen_area * 100 if screen_area else 0
+
+    def add_dirty_rect(self, rect: pg.Rect | tuple[int, int, int, int]) -> None:
+        """Register a changed area of the screen for the next screen update (dirty rectangle mode)"""
+
+        if self.dirty_rects_mode:
+            self.dirty_rects.append(pg.Rect(rect))
+
+    def scaled_size(self, scale: float) -> tuple[int, int]:
+        """Get the size of the display multiplied by a render scale"""
+
+        width, height = self.display.get_size()
+        return max(1, round(width * scale)), max(1, round(height * scale))
+
+    def set_render_scale(self, scale: float, smooth: bool = False) -> None:
+        """Render to an offscreen surface with a fraction of the display resolution, scaled up to the display
+
+        *A scale of 1 renders to the display directly -
+        The screen dimension (width, height) follows the render resolution, so lay out relative to it -
+        Mouse positions of events are mapped to the render resolution, use mouse_pos instead of pg.mouse.get_pos*
+        """
+
+        self.render_scale = scale
+        self.smooth_scale = smooth
+        if scale >= 1:
+            self.screen = self.display
+        else:
+            self.screen = pg.Surface(self.scaled_size(scale))
+            if pg.display.get_surface() is not None:
+                self.screen = self.screen.convert()
+        self.full_update = True
+
+    def mouse_pos(self) -> tuple[int, int]:
+        """Get the mouse position in the render resolution"""
+
+        x, y = pg.mouse.get_pos()
+        if self.screen is self.display:
+            return x, y
+        return self.to_render_space(x, y)
+
+    def to_render_space(self, x: float, y: float) -> tuple[int, int]:
+        """Map a position on the display to the render resolution"""
+
+        width, height = self.display.get_size()
+        return int(x * self.screen.get_width() / width), int(y * self.screen.get_height() / height)
+
+    def scale_events(self, events: list[pg.event.Event]) -> list[pg.event.Event]:
+        """Map the mouse positions of events from the display to the render resolution"""
+
+        result = []
+        for event in events:
+            if event.type in MOUSE_POSITION_EVENTS:
+                attributes = dict(event.dict)
+                attributes["pos"] = self.to_render_space(*event.pos)
+                if "rel" in attributes:
+                    x, y = self.to_render_space(*event.rel)
+                    attributes["rel"] = (x, y)
+                event = pg.event.Event(event.type, attributes)
+            result.append(event)
+        return result
+
+    def invalidate(self) -> None:
+        """Request a full screen update for the next frame (dirty rectangle mode)"""
+
+        self.full_update = True
+
+    def merge_dirty_rects(self) -> list[pg.Rect]:
+        """Clip the registered dirty rectangles to the screen and merge overlapping ones"""
+
+        screen_rect = self.screen.get_rect()
+        merged: list[pg.Rect] = []
+
+        for rect in self.dirty_rects:
+            rect = rect.clip(screen_rect)
+            if rect.w == 0 or rect.h == 0:
+                continue
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+
+        return merged
+
     def add_event_hook(self, event: int | tuple[int, ...], handler: tuple[Callable[[pg.event.Event, Self, dict], None], ...] |
                        Callable[[pg.event.Event, Self, dict], None], data: dict = None) -> EventHook:
         """Add a new event hook"""
 
-        hook = EventHook(self._event_hook_id, event if isinstance(event, tuple) else (event,),
+        hook = self.create_event_hook(event, handler, data)
+        self.activate_event_hook(hook)
+        return hook
+
+    def create_event_hook(self, event: int | tuple[int, ...], handler: tuple[Callable[[pg.event.Event, Self, dict], None], ...] |
+                          Callable[[pg.event.Event, Self, dict], None], data: dict = None) -> EventHook:
+        """Create a new event hook without activating it (thread safe)"""
+
+        with self._event_hook_lock:
+            hook_id = self._event_hook_id
+            self._event_hook_id += 1
+
+        return EventHook(hook_id, event if isinstance(event, tuple) else (event,),
                          handler if isinstance(handler, tuple) else (handler,), data if data is not None else {})
-        self._event_hook_id += 1
+
+    def activate_event_hook(self, hook: EventHook) -> bool:
+        """Activate an existing event hook (Returns False, if it is already active)"""
+
+        self.index_event_hooks()
+        if hook.id in self.event_hook_index:
+            return False
+
         self.event_hooks.append(hook)
-        return hook
+        self.event_hook_index[hook.id] = hook
+        for event_type in hook.events:
+            self.event_dispatch[event_type] = self.event_dispatch.get(event_type, ()) + (hook,)
+        self._event_hooks_version = self.event_hooks.version
+        return True
 
     def remove_event_hook(self, hook_id: int) -> bool:
         """Remove a event hook"""
 
+        self.index_event_hooks()
+        hook = self.event_hook_index.pop(hook_id, None)
+        if hook is None:
+            return False
+
+        self.event_hooks.remove(hook)
+        for event_type in hook.events:
+            hooks = tuple(h for h in self.event_dispatch[event_type] if h is not hook)
+            if hooks:
+                self.event_dispatch[event_type] = hooks
+            else:
+                del self.event_dispatch[event_type]
+        self._event_hooks_version = self.event_hooks.version
+        return True
+
+    def index_event_hooks(self) -> None:
+        """Rebuild the event hook lookup by id and by event type, if the event hook list was changed directly"""
+
+        if not isinstance(self.event_hooks, EventHookList):
+            self.event_hooks = EventHookList(self.event_hooks)
+        elif self._event_hooks_version == self.event_hooks.version:
+            return
+
+        self.event_hook_index = {hook.id: hook for hook in self.event_hooks}
+        dispatch: dict[int, list[EventHook]] = {}
         for hook in self.event_hooks:
-            if hook.id == hook_id:
-                self.event_hooks.remove(hook)
-                return True
-        return False
+            for event_type in hook.events:
+                dispatch.setdefault(event_type, []).append(hook)
+        self.event_dispatch = {event_type: tuple(hooks) for event_type, hooks in dispatch.items()}
+        self._event_hooks_version = self.event_hooks.version
+
+    def coalesce(self, events: list[pg.event.Event]) -> list[pg.event.Event]:
+        """Collapse repeated events of a frame
+
+        Consecutive mouse motions are merged into one (last position, summed relative motion),
+        of resize and move events only the last one is kept
+        """
+
+        result: list[pg.event.Event | None] = []
+        last_index: dict[int, int] = {}
+        motion_start = -1
+
+        for event in events:
+
+            if event.type == pg.MOUSEMOTION:
+                if motion_start == len(result) - 1 and motion_start != -1:
+                    previous = result[-1]
+                    result[-1] = pg.event.Event(pg.MOUSEMOTION, {**event.dict, "rel": (previous.rel[0] + event.rel[0],
+                                                                                       previous.rel[1] + event.rel[1])})
+                else:
+                    motion_start = len(result)
+                    result.append(event)
+                continue
+
+            if event.type in COALESCE_LAST_EVENTS:
+                if event.type in last_index:
+                    result[last_index[event.type]] = None
+                last_index[event.type] = len(result)
+
+            result.append(event)
+
+        return [event for event in result if event is not None]
 
     def change_scene(self, name: str, args: dict = None,
-                     transition_duration: int = 10, transition_pause: int = 5) -> None:
-        """Change the scene"""
+                     transition_duration: int = 10, transition_pause: int = 5, transition: Transition = None) -> None:
+        """Change the scene (with the default transition if no transition effect is given)"""
 
         if self.next_scene_name == name:
             return
 
+        if not self.scene_mode:
+            raise ValueError("Scene mode disabled! Enable the scene mode to change scenes ...")
+
         if name not in self.scene_index:
             raise KeyError(f"Missing scene '{name}' in index! Register scene to use it ...")
 
         self.logger.info(f"Switch scene to '{name}' with duration of {transition_duration} ...")
         self.logger.debug(f"Scene arguments: {args}")
 
+        if self.next_scene_future is not None:
+            self._discard_preload(self.next_scene_future)
+
         self.next_scene_name = name
         self.next_scene_args = {} if args is None else args
+        self.next_scene = None
+        if name in self.retained_scenes and name != self.scene_name:
+            self.next_scene_future = None
+        else:
+            if self.preload_executor is None:
+                self.preload_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="Preload")
+            self.next_scene_future = self.preload_executor.submit(self._preload_scene, self.scene_index[name], self.next_scene_args)
+        self.transition = self.default_transition if transition is None else transition
         self.transition_duration = transition_duration
         self.transition_pause = transition_pause
         self.transition_tick = 0
@@ -262,18 +812,14 @@ class Window(SurfaceInterface):
 
         if self.transition_tick != -1 and self.transition_duration != 0:
 
-            if self.transition_surface.get_width() != self.width or self.transition_surface.get_height() != self.width:
-                self.transition_surface: pg.Surface = pg.Surface(self.dimension)
-                self.transition_surface.fill(RGB.BLACK)
-
             if self.transition_tick < self.transition_duration:
-                self.transition_surface.set_alpha(int(255 * (self.transition_tick / self.transition_duration)))
+                amount = self.transition_tick / self.transition_duration
             elif self.transition_tick < self.transition_duration + self.transition_pause:
-                self.transition_surface.set_alpha(255)
+                amount = 1
             else:
-                self.transition_surface.set_alpha(int(255 - 255 * ((self.transition_tick - self.transition_duration - self.transition_pause) / self.transition_duration)))
+                amount = 1 - (self.transition_tick - self.transition_duration - self.transition_pause) / self.transition_duration
 
-            self.screen.blit(self.transition_surface, (0, 0))
+            self.transition.render(self.screen, min(max(amount, 0), 1), self.next_scene_name == "")
 
     # ABSTRACT METHODS
 
@@ -310,6 +856,15 @@ class Window(SurfaceInterface):
 
         pass
 
+    def fixed_update(self) -> None:
+        """Fixed timestep update tasks
+
+        *Called zero or more times per frame with a constant time step of fixed_dt seconds (fixed timestep mode) -
+        Interpolate rendering with the interpolation factor*
+        """
+
+        pass
+
     def update(self) -> None:
         """Normal update tasks
 
@@ -0,0 +1,87 @@
+"""Contains the option classes of the window"""
+
+# Standard modules
+from dataclasses import dataclass
+
+# Local modules
+from ..utils.profiler import Profiler
+from .frame_controller import FrameController
+from .gc_manager import GCManager
+
+
+@dataclass(frozen=True)
+class PacingOptions:
+    """Frame pacing options dataclass
+
+    history: frame durations kept for percentiles and graphs
+    precise: sleep and spin to the next frame instead of the pygame limiter
+    spin_budget: time in seconds spun before the next frame in precise mode
+    """
+
+    history: int = 90
+    precise: bool = False
+    spin_budget: float = 0.002
+
+
+@dataclass(frozen=True)
+class RenderOptions:
+    """Rendering options dataclass
+
+    dirty_rects: update only the registered dirty rectangles of the screen
+    dirty_threshold: fraction of the screen above which the whole screen is updated
+    frame_controller: adaptive render scale and frame rate controller (None for a fixed render scale)
+    """
+
+    dirty_rects: bool = False
+    dirty_threshold: float = 0.5
+    frame_controller: FrameController | None = None
+
+
+@dataclass(frozen=True)
+class UpdateOptions:
+    """Update options dataclass
+
+    fixed_timestep: time step in seconds of the fixed update (0 to disable)
+    max_fixed_steps: maximum fixed updates per frame
+    threaded: update on a worker thread while the last snapshot is rendered
+    coalesce_events: merge repeated mouse motion, resize and move events of a frame
+    """
+
+    fixed_timestep: float = 0
+    max_fixed_steps: int = 5
+    threaded: bool = False
+    coalesce_events: bool = False
+
+
+@dataclass(frozen=True)
+class SceneOptions:
+    """Scene options dataclass
+
+    retain: number of left scenes kept suspended for a fast return (0 to quit them)
+    """
+
+    retain: int = 0
+
+
+@dataclass(frozen=True)
+class FontOptions:
+    """Font options dataclass
+
+    max_fonts: maximum loaded fonts in the cache
+    sysfont_cache_path: json file to remember system font paths across starts (None to disable)
+    """
+
+    max_fonts: int = 32
+    sysfont_cache_path: str | None = None
+
+
+@dataclass(frozen=True)
+class RuntimeOptions:
+    """Runtime options dataclass
+
+    profiler: frame profiler (a disabled profiler if None)
+    gc_manager: garbage collector manager (None for the automatic collection)
+    """
+
+    profiler: Profiler | None = None
+    gc_manager: GCManager | None = None
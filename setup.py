@@ -42,6 +42,8 @@ setup(
     install_requires=["pygame"],
     extras_require={
         "cv": ["opencv-python"],
+        "numpy": ["numpy"],
+        "psutil": ["psutil"],
     },
     # package_data={
     #     "sample": ["package_data.dat"],
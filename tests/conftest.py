@@ -0,0 +1,39 @@
+"""Shared fixtures of the tests"""
+
+# Standard modules
+import os
+import sys
+
+# External modules
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+import pygame as pg
+import pytest
+
+# Local modules
+import nikocraft as nc
+
+
+@pytest.fixture
+def app(tmp_path) -> nc.App:
+    return nc.App(["test"], log_path=str(tmp_path / "logs"))
+
+
+@pytest.fixture
+def window(app: nc.App) -> nc.Window:
+    window = nc.Window(app, fps=1000)
+    yield window
+    pg.quit()
+
+
+@pytest.fixture(params=["numpy", "array"])
+def backend(request, monkeypatch) -> str:
+    """Run a test with the NumPy backend and with the array fallback (NumPy hidden from all modules)"""
+
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        for name, module in list(sys.modules.items()):
+            if name.startswith("nikocraft.") and hasattr(module, "np"):
+                monkeypatch.setattr(module, "np", None)
+    return request.param
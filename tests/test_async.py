@@ -0,0 +1,153 @@
+# Standard modules
+import asyncio
+import threading
+
+# External modules
+import pytest
+
+# Local modules
+import nikocraft as nc
+
+
+class RecordingGCManager(nc.GCManager):
+
+    def __init__(self, order: list) -> None:
+        super(RecordingGCManager, self).__init__()
+        self.order = order
+
+    def end_frame(self, slack: float) -> None:
+        self.order.append("gc")
+        super(RecordingGCManager, self).end_frame(slack)
+
+
+class TaskScene(nc.Scene):
+
+    def preload(self) -> None:
+        self.task = self.create_task(asyncio.sleep(10))
+
+
+class TaskSceneA(TaskScene):
+    pass
+
+
+class TaskSceneB(TaskScene):
+    pass
+
+
+class TaskSceneC(TaskScene):
+    pass
+
+
+class AsyncWindow(nc.Window):
+
+    def init(self) -> None:
+        self.frames = 0
+
+    def update(self) -> None:
+        self.order.append("frame")
+        self.frames += 1
+        if self.frames >= 5:
+            self.running = False
+
+
+def test_gc_runs_after_ready_tasks(app: nc.App) -> None:
+
+    order = []
+    window = AsyncWindow(app, fps=1000, runtime=nc.RuntimeOptions(gc_manager=RecordingGCManager(order)))
+    window.order = order
+
+    async def task() -> None:
+        while True:
+            order.append("task")
+            await asyncio.sleep(0)
+
+    async def main() -> None:
+        background = asyncio.get_running_loop().create_task(task())
+        await window.run_async()
+        background.cancel()
+
+    asyncio.run(main())
+
+    frames = " ".join(order).split("frame")[1:]
+    assert all("gc" in frame and frame.index("task") < frame.index("gc") for frame in frames[:-1])
+
+
+def test_scene_task_without_event_loop(window: nc.Window) -> None:
+
+    scene = nc.Scene(window)
+
+    async def coroutine() -> None:
+        pass
+
+    with pytest.raises(RuntimeError):
+        scene.create_task(coroutine())
+
+
+@pytest.fixture
+def task_window(app: nc.App) -> nc.Window:
+    window = nc.Window(app, fps=1000, scene_mode=True, start_scene="a")
+    window.register_scene("a", TaskSceneA)
+    window.register_scene("b", TaskSceneB)
+    window.register_scene("c", TaskSceneC)
+    yield window
+    window._stop()
+
+
+def run_with_loop(window: nc.Window, coroutine_function) -> None:
+
+    async def main() -> None:
+        window.event_loop = asyncio.get_running_loop()
+        window.event_loop_thread = threading.get_ident()
+        window._start()
+        await coroutine_function()
+        window.event_loop = None
+
+    asyncio.run(main())
+
+
+def test_scene_tasks_are_cancelled_on_change_scene(task_window: nc.Window) -> None:
+
+    async def run() -> None:
+        first = task_window.scene
+        task_window.change_scene("b", transition_duration=0, transition_pause=0)
+        task_window.next_scene_future.result()
+        await asyncio.sleep(0)
+        assert not first.task.done()
+
+        task_window._frame()
+        await asyncio.sleep(0)
+        assert first.task.cancelled()
+        assert not task_window.scene.task.done()
+
+    run_with_loop(task_window, run)
+
+
+def test_scene_tasks_of_a_replaced_preload_are_cancelled(task_window: nc.Window) -> None:
+
+    async def run() -> None:
+        task_window.change_scene("b", transition_duration=0, transition_pause=0)
+        replaced, _ = task_window.next_scene_future.result()
+        task_window.change_scene("c", transition_duration=0, transition_pause=0)
+        await asyncio.sleep(0)
+        assert replaced.task.cancelled()
+
+    run_with_loop(task_window, run)
+
+
+def test_scene_tasks_are_cancelled_on_close(app: nc.App) -> None:
+
+    class ClosingWindow(nc.Window):
+
+        def update(self) -> None:
+            self.running = False
+
+    window = ClosingWindow(app, fps=1000, scene_mode=True, start_scene="a")
+    window.register_scene("a", TaskSceneA)
+
+    async def main() -> None:
+        await window.run_async()
+        await asyncio.sleep(0)
+
+    asyncio.run(main())
+
+    assert window.scene.task.cancelled()
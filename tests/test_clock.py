@@ -0,0 +1,73 @@
+# Standard modules
+from array import array
+import math
+import random
+
+# External modules
+import pytest
+
+# Local modules
+import nikocraft as nc
+from nikocraft.utils import time
+
+
+def test_long_sleep_is_clamped_in_overshoot_estimate(monkeypatch) -> None:
+
+    wait = time.wait
+    monkeypatch.setattr(time, "wait", lambda seconds: wait(seconds + 0.02))
+    clock = nc.Clock(100, precise=True, spin_budget=0.002)
+
+    clock.tick()
+    clock.tick()
+
+    assert 0 < clock.sleep_overshoot <= clock.spin_budget * 0.1 + 1e-9
+
+
+def nearest_rank(durations: list[float], percent: float) -> float:
+    ordered = sorted(durations)
+    return ordered[min(len(ordered) - 1, max(0, math.floor(percent / 100 * len(ordered) + 0.5) - 1))]
+
+
+def test_ring_buffer_percentiles_match_sorted_window(backend: str) -> None:
+
+    clock = nc.Clock(60, history=50)
+    rng = random.Random(6)
+    durations = [rng.uniform(0.001, 0.05) for _ in range(137)]
+    assert isinstance(clock.frame_durations, array) == (backend == "array")
+
+    for count, duration in enumerate(durations, 1):
+        clock.record(duration)
+        window = durations[max(0, count - 50):count]
+        assert clock.frame_samples == len(window)
+        assert clock.ordered_durations() == window
+        assert clock.last_frame_duration == duration
+        assert clock.mean_frame_duration == pytest.approx(sum(window) / len(window))
+        for percent in (1, 50, 95, 99, 100):
+            assert clock.percentile(percent) == nearest_rank(window, percent)
+
+
+def test_low_is_mean_of_slowest_frames(backend: str) -> None:
+
+    clock = nc.Clock(60, history=200)
+    for duration in range(1, 201):
+        clock.record(duration / 1000)
+
+    assert clock.low(1) == pytest.approx((0.199 + 0.2) / 2)
+    assert clock.low(10) == pytest.approx(sum(range(181, 201)) / 20 / 1000)
+    assert clock.low(0.1) == 0.2
+
+
+def test_empty_history_and_snapshot(backend: str) -> None:
+
+    clock = nc.Clock(60, history=10)
+
+    assert clock.percentile(99) == 0 and clock.low(1) == 0
+    assert clock.ordered_durations() == []
+    for duration in (0.01, 0.02, 0.03):
+        clock.record(duration)
+    snapshot = clock.snapshot()
+    assert snapshot["samples"] == 3
+    assert snapshot["p50"] == 0.02 and snapshot["p99"] == 0.03
+    assert snapshot["mean"] == pytest.approx(0.02)
+    with pytest.raises(ValueError):
+        nc.Clock(60, history=0)
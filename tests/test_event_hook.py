@@ -0,0 +1,77 @@
+# External modules
+import pygame as pg
+
+# Local modules
+import nikocraft as nc
+
+
+def record(calls: list):
+    return lambda event, window, data: calls.append(event.type)
+
+
+def test_event_hooks_are_a_list(window: nc.Window) -> None:
+
+    first = window.add_event_hook(pg.KEYDOWN, record([]))
+    second = window.add_event_hook((pg.KEYDOWN, pg.KEYUP), record([]))
+
+    assert isinstance(window.event_hooks, list)
+    assert list(window.event_hooks) == [first, second]
+    assert window.event_dispatch[pg.KEYDOWN] == (first, second)
+    assert window.event_dispatch[pg.KEYUP] == (second,)
+
+
+def test_remove_event_hook(window: nc.Window) -> None:
+
+    first = window.add_event_hook(pg.KEYDOWN, record([]))
+    second = window.add_event_hook(pg.KEYDOWN, record([]))
+
+    assert window.remove_event_hook(first.id)
+    assert not window.remove_event_hook(first.id)
+    assert list(window.event_hooks) == [second]
+    assert window.event_dispatch[pg.KEYDOWN] == (second,)
+
+    window.remove_event_hook(second.id)
+    assert pg.KEYDOWN not in window.event_dispatch
+
+
+def test_direct_list_changes_are_indexed(window: nc.Window) -> None:
+
+    hook = nc.EventHook(100, (pg.KEYUP,), (record([]),), {})
+    window.event_hooks.append(hook)
+    window.index_event_hooks()
+    assert window.event_dispatch[pg.KEYUP] == (hook,)
+
+    window.event_hooks.clear()
+    window.index_event_hooks()
+    assert window.event_dispatch == {}
+
+    window.event_hooks = [hook]
+    window.index_event_hooks()
+    assert isinstance(window.event_hooks, nc.EventHookList)
+    assert window.event_hook_index == {100: hook}
+
+
+def test_dispatch_in_frame(window: nc.Window) -> None:
+
+    calls = []
+    window.add_event_hook(pg.USEREVENT, record(calls))
+    window._start()
+    pg.event.post(pg.event.Event(pg.USEREVENT))
+    pg.event.post(pg.event.Event(pg.USEREVENT + 1))
+    window._frame()
+    window._stop()
+
+    assert calls == [pg.USEREVENT]
+
+
+def test_coalesce_mouse_motion(window: nc.Window) -> None:
+
+    events = [pg.event.Event(pg.MOUSEMOTION, pos=(1, 1), rel=(1, 1), buttons=(0, 0, 0)),
+              pg.event.Event(pg.MOUSEMOTION, pos=(3, 2), rel=(2, 1), buttons=(0, 0, 0)),
+              pg.event.Event(pg.KEYDOWN, key=pg.K_a)]
+
+    coalesced = window.coalesce(events)
+
+    assert [event.type for event in coalesced] == [pg.MOUSEMOTION, pg.KEYDOWN]
+    assert coalesced[0].pos == (3, 2)
+    assert coalesced[0].rel == (3, 2)
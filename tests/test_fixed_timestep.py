@@ -0,0 +1,83 @@
+# External modules
+import pytest
+
+# Local modules
+import nikocraft as nc
+
+
+class FixedWindow(nc.Window):
+
+    def init(self) -> None:
+        self.order = []
+
+    def fixed_update(self) -> None:
+        self.order.append("fixed")
+
+    def update(self) -> None:
+        self.order.append("update")
+
+
+@pytest.fixture
+def fixed_window(app: nc.App, monkeypatch) -> FixedWindow:
+
+    window = FixedWindow(app, fps=1000, updating=nc.UpdateOptions(fixed_timestep=0.25, max_fixed_steps=5))
+    window.delta_times = []
+
+    def tick() -> None:
+        window.clock.delta_time_raw = window.delta_times.pop(0)
+
+    monkeypatch.setattr(window.clock, "tick", tick)
+    window._start()
+    yield window
+    window._stop()
+
+
+def run_frame(window: FixedWindow, delta_time: float) -> list[str]:
+    window.order.clear()
+    window.delta_times.append(delta_time)
+    window._frame()
+    return window.order
+
+
+def test_steps_and_interpolation_follow_the_accumulator(fixed_window: FixedWindow) -> None:
+
+    assert run_frame(fixed_window, 0.625) == ["fixed", "fixed", "update"]
+    assert fixed_window.stat_fixed_steps == 2
+    assert fixed_window.interpolation == 0.5
+
+    assert run_frame(fixed_window, 0.625) == ["fixed", "fixed", "fixed", "update"]
+    assert fixed_window.interpolation == 0
+
+    assert run_frame(fixed_window, 0.125) == ["update"]
+    assert fixed_window.stat_fixed_steps == 0
+    assert fixed_window.interpolation == 0.5
+
+
+def test_steps_are_capped_and_the_backlog_dropped(fixed_window: FixedWindow) -> None:
+
+    assert run_frame(fixed_window, 2.125) == ["fixed"] * 5 + ["update"]
+    assert fixed_window.fixed_accumulator == 0.125
+    assert fixed_window.interpolation == 0.5
+
+    assert run_frame(fixed_window, 0.125) == ["fixed", "update"]
+
+
+def test_speed_factor_scales_the_fixed_time(fixed_window: FixedWindow) -> None:
+
+    fixed_window.clock.speed_factor = 2
+
+    assert run_frame(fixed_window, 0.25) == ["fixed", "fixed", "update"]
+    assert fixed_window.fixed_dt == 0.25
+
+
+def test_disabled_fixed_timestep_runs_no_fixed_updates(app: nc.App) -> None:
+
+    window = FixedWindow(app, fps=1000)
+    window._start()
+    try:
+        window.order.clear()
+        window._frame()
+        assert window.order == ["update"]
+        assert window.interpolation == 0
+    finally:
+        window._stop()
@@ -0,0 +1,173 @@
+# External modules
+import pygame as pg
+import pytest
+
+# Local modules
+import nikocraft as nc
+from nikocraft.window.font import TextCache, FontManager
+
+
+def surface(width: int = 10, height: int = 10) -> pg.Surface:
+    return pg.Surface((width, height), depth=32)
+
+
+def test_text_cache_least_recently_used_eviction() -> None:
+
+    cache = TextCache(budget=3 * 10 * 40)
+    for key in ("a", "b", "c"):
+        cache.put((key,), surface())
+    assert cache.get(("a",)) is not None
+
+    cache.put(("d",), surface())
+
+    assert list(cache.surfaces) == [("c",), ("a",), ("d",)]
+    assert cache.evictions == 1
+    assert cache.memory == 3 * 10 * 40
+
+
+def test_text_cache_max_entries() -> None:
+
+    cache = TextCache(max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.put((key,), surface())
+
+    assert list(cache.surfaces) == [("b",), ("c",)]
+
+
+def test_text_cache_statistics() -> None:
+
+    cache = TextCache()
+    cache.put(("a",), surface())
+    cache.get(("a",))
+    cache.get(("b",))
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.hit_rate == 0.5
+    cache.clear()
+    assert len(cache) == 0 and cache.memory == 0
+
+
+def test_text_cache_admits_on_second_sight() -> None:
+
+    cache = TextCache(max_entries=1)
+    assert not cache.admit(("a",))
+    assert cache.admit(("a",))
+    assert not cache.admit(("a",))
+
+    for key in "bcde":
+        cache.admit((key,))
+    assert len(cache.seen) <= 4
+
+
+@pytest.fixture
+def fonts() -> FontManager:
+    pg.font.init()
+    fonts = FontManager()
+    fonts.define("default", None)
+    yield fonts
+    pg.font.quit()
+
+
+def test_render_caches_reused_text(fonts: FontManager) -> None:
+
+    first = fonts.render("text", "default", 20, nc.RGB.WHITE)
+    assert len(fonts.text_cache) == 0
+
+    second = fonts.render("text", "default", 20, nc.RGB.WHITE)
+    third = fonts.render("text", "default", 20, nc.RGB.WHITE)
+
+    assert len(fonts.text_cache) == 1
+    assert third is second
+    assert first.get_size() == third.get_size()
+
+
+def test_font_cache_is_bounded(fonts: FontManager) -> None:
+
+    fonts.max_fonts = 2
+    for size in (10, 11, 12):
+        fonts.get("default", size)
+
+    assert list(fonts.loaded) == [("default", 11), ("default", 12)]
+
+
+def test_font_cache_is_nested_by_name_and_size(fonts: FontManager) -> None:
+
+    font = fonts.get("default", 10)
+    fonts.get("default", 12)
+
+    assert fonts.cache["default"][10] is font
+    assert sorted(fonts.cache["default"]) == [10, 12]
+
+
+def test_sysfont_paths_are_saved_once(tmp_path, monkeypatch) -> None:
+
+    pg.font.init()
+    path = str(tmp_path / "fonts.json")
+    fonts = FontManager(sysfont_cache_path=path)
+    monkeypatch.setattr(pg.font, "match_font", lambda name: None)
+
+    fonts.get("missing", 12, True)
+    assert not (tmp_path / "fonts.json").exists()
+
+    fonts.save_sysfont_paths()
+    assert nc.file.load_json(path, create=False) == {"missing": None}
+    assert not fonts.sysfont_changed
+
+
+def test_remembered_sysfont_skips_sysfont(tmp_path, monkeypatch) -> None:
+
+    pg.font.init()
+    path = str(tmp_path / "fonts.json")
+    nc.file.save_json(path, {"missing": None})
+    fonts = FontManager(sysfont_cache_path=path)
+
+    def sysfont(*args, **kwargs):
+        raise AssertionError("SysFont called for a remembered font")
+
+    monkeypatch.setattr(pg.font, "SysFont", sysfont)
+    assert isinstance(fonts.get("missing", 12, True), pg.font.Font)
+
+
+def test_glyph_atlas_rasterizes_each_glyph_once(fonts: FontManager) -> None:
+
+    atlas = fonts.atlas("default", 20, nc.RGB.WHITE)
+    target = pg.Surface((200, 40), pg.SRCALPHA)
+    rect = atlas.render(target, "10.01", (5, 5))
+
+    assert sorted(atlas.glyphs) == [".", "0", "1"]
+    assert rect.topleft == (5, 5)
+    assert rect.size == atlas.size("10.01")
+    assert fonts.atlas("default", 20, nc.RGB.WHITE) is atlas
+
+
+def test_glyph_atlas_grows_and_keeps_glyphs(fonts: FontManager) -> None:
+
+    atlas = nc.window.glyph_atlas.GlyphAtlas(fonts.get("default", 20), nc.RGB.WHITE, nc.RGB.BLACK, width=32)
+    first = atlas.surface
+    target = pg.Surface((400, 40))
+    rect = atlas.render(target, "0123456789", (0, 0))
+
+    glyph = fonts.get("default", 20).render("0", True, nc.RGB.WHITE, nc.RGB.BLACK)
+    copied = atlas.surface.subsurface(atlas.glyphs["0"])
+    assert atlas.surface is not first
+    assert rect.width == sum(atlas.glyphs[character].w for character in "0123456789")
+    assert all(copied.get_at((x, y)) == glyph.get_at((x, y)) for x in range(glyph.get_width()) for y in range(glyph.get_height()))
+
+
+def test_glyph_atlas_keeps_antialiased_edges_bright(fonts: FontManager) -> None:
+
+    atlas = fonts.atlas("default", 20, nc.RGB.WHITE)
+    atlas.prepare("O")
+
+    colors = {tuple(atlas.surface.get_at((x, y)))[:3] for x in range(atlas.surface.get_width())
+              for y in range(atlas.surface.get_height()) if atlas.surface.get_at((x, y)).a > 0}
+    assert colors == {(255, 255, 255)}
+
+
+def test_glyph_atlases_are_bounded(fonts: FontManager) -> None:
+
+    fonts.max_fonts = 2
+    for size in (10, 11, 12):
+        fonts.atlas("default", size, nc.RGB.WHITE)
+
+    assert [key[1] for key in fonts.atlases] == [11, 12]
@@ -0,0 +1,106 @@
+# External modules
+import pygame as pg
+import pytest
+
+# Local modules
+import nikocraft as nc
+
+
+def test_inplace_operators_mutate_the_same_object() -> None:
+
+    position = nc.MVec(1, 2)
+    same = position
+
+    position += nc.Vec(3, 4)
+    position -= (1, 1)
+    position *= 2
+    position /= 4
+    position.add_scaled(nc.Vec(2, -2), 0.5)
+
+    assert same is position
+    assert position == (2.5, 1.5)
+    position //= 1
+    assert position == nc.Vec(2, 1)
+
+
+def test_binary_operators_and_copies_do_not_alias() -> None:
+
+    position = nc.MVec(1, 2)
+    moved = position + (1, 1)
+    copy = position.copy()
+    frozen = position.vec()
+
+    position += (10, 10)
+
+    assert moved == (2, 3) and copy == (1, 2) and frozen == nc.Vec(1, 2)
+    assert isinstance(moved, nc.MVec) and isinstance(frozen, nc.Vec)
+    assert (1, 1) + nc.MVec(1, 2) == (2, 3) and 2 * nc.MVec(1, 2) == (2, 4)
+
+
+def test_aliased_references_see_mutation() -> None:
+
+    velocity = nc.MVec(3, 4)
+    entities = {"a": velocity, "b": velocity}
+
+    entities["a"].normalize_ip()
+
+    assert entities["b"] == pytest.approx((0.6, 0.8))
+    assert velocity.clamp_length_ip(0.5).length == pytest.approx(0.5)
+    with pytest.raises(TypeError):
+        hash(velocity)
+
+
+def test_sequence_protocol() -> None:
+
+    vector = nc.MVec3(1, 2, 3)
+    vector[2] = 5
+    vector[-3] = 0
+
+    assert list(vector) == [0, 2, 5] and len(vector) == 3
+    assert vector[0:2] == (0, 2)
+    assert vector == nc.Vec3(0, 2, 5) and vector != (0, 2)
+    with pytest.raises(IndexError):
+        vector[3]
+
+
+def test_mvec3_inplace_operators() -> None:
+
+    position = nc.MVec3(1, 2, 3)
+    same = position
+
+    position += (1, 1, 1)
+    position *= (1, 2, 3)
+    position -= nc.Vec3(1, 1, 1)
+    position /= 2
+
+    assert same is position
+    assert position == (0.5, 2.5, 5.5)
+    assert position.vec3() == nc.Vec3(0.5, 2.5, 5.5)
+    assert position.distance_squared((0.5, 2.5, 3.5)) == 4
+
+
+def test_pygame_interop() -> None:
+
+    pg.init()
+    try:
+        position = nc.MVec(10, 20)
+        rect = pg.Rect(position, (5, 5))
+        assert rect.topleft == (10, 20)
+
+        rect.center = position
+        assert rect.center == (10, 20)
+        assert rect.collidepoint(position)
+
+        assert pg.Vector2(position) == pg.Vector2(10, 20)
+        assert nc.MVec.of(pg.Vector2(1.5, 2.5)) == (1.5, 2.5)
+        position += pg.Vector2(1, 1)
+        assert position == (11, 21)
+
+        target = pg.Surface((40, 40))
+        source = pg.Surface((2, 2))
+        source.fill((255, 0, 0))
+        area = target.blit(source, nc.MVec(30, 5))
+        assert area.topleft == (30, 5)
+        assert target.get_at((30, 5))[:3] == (255, 0, 0)
+    finally:
+        pg.quit()
@@ -0,0 +1,96 @@
+# Standard modules
+import json
+import os
+import threading
+
+# External modules
+import pygame as pg
+
+# Local modules
+import nikocraft as nc
+from nikocraft.utils import time
+
+
+def test_disabled_profiler_records_nothing() -> None:
+
+    profiler = nc.Profiler()
+    profiler.record("Span", 0, 10)
+    profiler.phase("Render", 0.001)
+    profiler.end_frame(time.bench_time_ns())
+
+    assert len(profiler.spans) == 0
+
+
+def test_ring_buffer_keeps_newest_spans() -> None:
+
+    profiler = nc.Profiler(enabled=True, capacity=5)
+    for index in range(12):
+        profiler.record(f"Span {index}", index * 1000, 500)
+
+    assert [span[0] for span in profiler.spans] == [f"Span {index}" for index in range(7, 12)]
+    profiler.clear()
+    assert len(profiler.spans) == 0
+
+
+def test_trace_format() -> None:
+
+    profiler = nc.Profiler(enabled=True)
+    profiler.record("Main", 2000, 3000, "test")
+    worker = threading.Thread(target=profiler.record, args=("Worker", 4000, 1000), name="Worker Thread")
+    worker.start()
+    worker.join()
+
+    events = profiler.trace()["traceEvents"]
+    spans = {event["name"]: event for event in events if event["ph"] == "X"}
+    names = {event["args"]["name"] for event in events if event["ph"] == "M"}
+
+    assert spans["Main"] == {"name": "Main", "cat": "test", "ph": "X", "pid": os.getpid(),
+                             "tid": threading.get_ident(), "ts": 2, "dur": 3}
+    assert spans["Worker"]["cat"] == "user" and spans["Worker"]["tid"] != spans["Main"]["tid"]
+    assert threading.current_thread().name in names
+    assert len([event for event in events if event["ph"] == "M"]) == 2
+
+
+def test_dump_writes_trace_json(tmp_path) -> None:
+
+    profiler = nc.Profiler(enabled=True, path=str(tmp_path))
+    time.set_profiler(profiler)
+    try:
+        with time.span("Block"):
+            pass
+    finally:
+        time.set_profiler(None)
+
+    path = profiler.dump(str(tmp_path / "trace.json"))
+    with open(path, encoding="utf-8") as f:
+        trace = json.load(f)
+    assert [event["name"] for event in trace["traceEvents"] if event["ph"] == "X"] == ["Block"]
+
+    default_path = profiler.dump()
+    assert os.path.dirname(default_path) == str(tmp_path) and os.path.isfile(default_path)
+
+
+def test_slow_frame_dumps_once_per_cooldown(tmp_path) -> None:
+
+    profiler = nc.Profiler(enabled=True, threshold=0, path=str(tmp_path), cooldown=60)
+    profiler.end_frame(time.bench_time_ns() - 1000)
+    profiler.end_frame(time.bench_time_ns() - 1000)
+
+    assert profiler.dumps == 1
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_window_records_phases(app: nc.App) -> None:
+
+    window = nc.Window(app, fps=1000, runtime=nc.RuntimeOptions(profiler=nc.Profiler(enabled=True)))
+    try:
+        window._start()
+        window._frame()
+        window._stop()
+    finally:
+        time.set_profiler(None)
+        pg.quit()
+
+    names = [span[0] for span in window.profiler.spans]
+    assert {"Event", "Render", "Frame"} <= set(names)
+    assert names[-1] == "Frame"
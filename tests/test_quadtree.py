@@ -0,0 +1,113 @@
+# Standard modules
+import random
+
+# External modules
+import pytest
+
+# Local modules
+import nikocraft as nc
+from test_spatial_hash import random_positions, brute_radius, brute_aabb
+
+
+MINIMUM, MAXIMUM = nc.Vec(-300, -300), nc.Vec(300, 300)
+
+
+def brute_nearest(positions: dict[int, nc.Vec], center: tuple, k: int) -> list[float]:
+    return sorted((p[0] - center[0]) ** 2 + (p[1] - center[1]) ** 2 for p in positions.values())[:k]
+
+
+def distances(positions: dict[int, nc.Vec], center: tuple, objects: list[int]) -> list[float]:
+    return [(positions[obj][0] - center[0]) ** 2 + (positions[obj][1] - center[1]) ** 2 for obj in objects]
+
+
+def queries(count: int = 40) -> list[tuple[tuple[float, float], float]]:
+    rng = random.Random(4)
+    return [((rng.uniform(-320, 320), rng.uniform(-320, 320)), rng.uniform(0, 120)) for _ in range(count)]
+
+
+def test_quadtree_matches_brute_force() -> None:
+
+    positions = random_positions(600)
+    tree = nc.QuadTree(MINIMUM, MAXIMUM, capacity=8)
+    for obj, position in positions.items():
+        tree.insert(obj, position)
+
+    for center, radius in queries():
+        minimum, maximum = (center[0] - radius, center[1] - radius), (center[0] + radius, center[1] + radius / 3)
+        assert sorted(tree.query_radius(center, radius)) == sorted(brute_radius(positions, center, radius))
+        assert sorted(tree.query_aabb(minimum, maximum)) == sorted(brute_aabb(positions, minimum, maximum))
+        assert distances(positions, center, tree.nearest(center, 5)) == brute_nearest(positions, center, 5)
+
+
+def test_quadtree_move_and_remove_merge_nodes() -> None:
+
+    positions = random_positions(300)
+    tree = nc.QuadTree(MINIMUM, MAXIMUM, capacity=4)
+    for obj, position in positions.items():
+        tree.insert(obj, position)
+
+    rng = random.Random(5)
+    for obj in range(0, 300, 2):
+        positions[obj] = nc.Vec(rng.uniform(-300, 300), rng.uniform(-300, 300))
+        tree.move(obj, positions[obj])
+    for obj in range(0, 300, 3):
+        assert tree.remove(obj)
+        del positions[obj]
+
+    assert len(tree) == len(positions)
+    for center, radius in queries(10):
+        assert sorted(tree.query_radius(center, radius)) == sorted(brute_radius(positions, center, radius))
+
+    for obj in list(positions):
+        tree.remove(obj)
+    assert len(tree) == 0
+    assert tree.root.children is None
+
+
+def test_static_quadtree_matches_brute_force(backend: str) -> None:
+
+    positions = random_positions(600)
+    tree = nc.StaticQuadTree(MINIMUM, MAXIMUM, capacity=8)
+    tree.rebuild(nc.VecArray(positions[i] for i in range(len(positions))))
+
+    assert len(tree) == len(positions)
+    for center, radius in queries():
+        minimum, maximum = (center[0] - radius / 2, center[1] - radius), (center[0] + radius, center[1] + radius)
+        assert sorted(tree.query_radius(center, radius)) == sorted(brute_radius(positions, center, radius))
+        assert sorted(tree.query_aabb(minimum, maximum)) == sorted(brute_aabb(positions, minimum, maximum))
+        assert distances(positions, center, tree.nearest(center, 5)) == brute_nearest(positions, center, 5)
+
+
+def test_quadtree_move_out_of_bounds_keeps_object() -> None:
+
+    tree = nc.QuadTree(MINIMUM, MAXIMUM)
+    tree.insert("a", nc.Vec(10, 10))
+
+    with pytest.raises(ValueError):
+        tree.move("a", nc.Vec(500, 10))
+
+    assert "a" in tree and len(tree) == 1
+    assert tree.position("a") == nc.Vec(10, 10)
+    assert tree.query_radius((10, 10), 1) == ["a"]
+
+
+def test_static_quadtree_rebuilds_with_changing_sizes(backend: str) -> None:
+
+    tree = nc.StaticQuadTree(MINIMUM, MAXIMUM, capacity=4)
+    for count in (600, 600, 20, 0, 300):
+        positions = random_positions(count, seed=count)
+        tree.rebuild(nc.VecArray(positions[i] for i in range(count)))
+        assert len(tree) == count
+        assert 4 ** tree.depth * tree.capacity >= count or tree.depth == tree.max_depth
+        for center, radius in queries(5):
+            assert sorted(tree.query_radius(center, radius)) == sorted(brute_radius(positions, center, radius))
+
+
+def test_static_quadtree_finds_clamped_points(backend: str) -> None:
+
+    tree = nc.StaticQuadTree(MINIMUM, MAXIMUM)
+    tree.rebuild(nc.VecArray([(-400, 0), (0, 0), (350, 350)]))
+
+    assert sorted(tree.query_aabb((-500, -10), (10, 10))) == [0, 1]
+    assert tree.query_radius((360, 360), 20) == [2]
+    assert tree.query_aabb((10, 10), (0, 0)) == []
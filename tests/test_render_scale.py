@@ -0,0 +1,33 @@
+# External modules
+import pygame as pg
+
+# Local modules
+import nikocraft as nc
+
+
+def test_render_scale_maps_mouse_events(window: nc.Window) -> None:
+
+    positions = []
+    window.add_event_hook(pg.MOUSEBUTTONDOWN, lambda event, window, data: positions.append(event.pos))
+    window._start()
+    window.set_render_scale(0.5)
+
+    assert window.screen.get_size() == window.scaled_size(0.5)
+    pg.event.post(pg.event.Event(pg.MOUSEBUTTONDOWN, pos=(100, 50), button=1))
+    window._frame()
+    window._stop()
+
+    assert positions == [(50, 25)]
+
+
+def test_full_render_scale_keeps_events(window: nc.Window) -> None:
+
+    window._start()
+    window.set_render_scale(1)
+    event = pg.event.Event(pg.MOUSEMOTION, pos=(100, 50), rel=(4, 2), buttons=(0, 0, 0))
+
+    assert window.screen is window.display
+    assert window.scale_events([event])[0].pos == (100, 50)
+    window.set_render_scale(0.5)
+    assert window.scale_events([event])[0].rel == (2, 1)
+    window._stop()
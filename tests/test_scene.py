@@ -0,0 +1,103 @@
+# Standard modules
+import threading
+
+# External modules
+import pygame as pg
+import pytest
+
+# Local modules
+import nikocraft as nc
+
+
+class HookedScene(nc.Scene):
+
+    def __init__(self, window: nc.Window, args: dict = None) -> None:
+        super(HookedScene, self).__init__(window, args)
+        self.calls = []
+        self.quit_event = threading.Event()
+        self.hook = self.add_event_hook(pg.USEREVENT, lambda event, window, data: self.calls.append(event.type))
+
+    def quit(self) -> None:
+        self.quit_event.set()
+
+
+class SceneA(HookedScene):
+    pass
+
+
+class SceneB(HookedScene):
+    pass
+
+
+class SceneC(HookedScene):
+    pass
+
+
+@pytest.fixture
+def scene_window(app: nc.App) -> nc.Window:
+    window = nc.Window(app, fps=1000, scene_mode=True)
+    window.register_scene("a", SceneA)
+    window.register_scene("b", SceneB)
+    window.register_scene("c", SceneC)
+    window._start()
+    yield window
+    window._stop()
+
+
+def test_preloaded_hooks_are_inactive_until_switch(scene_window: nc.Window) -> None:
+
+    old = scene_window.scene
+    scene_window.change_scene("b", transition_duration=0, transition_pause=0)
+    new, _ = scene_window.next_scene_future.result()
+
+    assert new.hook.id not in scene_window.event_hook_index
+    pg.event.post(pg.event.Event(pg.USEREVENT))
+    scene_window._frame()
+    assert old.calls == [pg.USEREVENT]
+    assert new.calls == []
+
+    assert scene_window.scene is new
+    assert new.hook.id in scene_window.event_hook_index
+    assert old.hook.id not in scene_window.event_hook_index
+    pg.event.post(pg.event.Event(pg.USEREVENT))
+    scene_window._frame()
+    assert old.calls == [pg.USEREVENT]
+    assert new.calls == [pg.USEREVENT]
+
+
+def test_replaced_preload_is_quit(scene_window: nc.Window) -> None:
+
+    scene_window.change_scene("b")
+    replaced = scene_window.next_scene_future
+    scene_window.change_scene("c")
+
+    if not replaced.cancelled():
+        scene, _ = replaced.result()
+        assert scene.quit_event.wait(1)
+    scene, _ = scene_window.next_scene_future.result()
+    assert isinstance(scene, SceneC)
+    assert not scene.quit_event.is_set()
+
+
+def test_change_scene_without_scene_mode(window: nc.Window) -> None:
+
+    window.register_scene("a", SceneA)
+    with pytest.raises(ValueError):
+        window.change_scene("a")
+
+
+def test_hook_ids_are_unique_across_threads(window: nc.Window) -> None:
+
+    ids = []
+
+    def create() -> None:
+        for _ in range(500):
+            ids.append(window.create_event_hook(pg.USEREVENT, lambda event, window, data: None).id)
+
+    threads = [threading.Thread(target=create) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(ids)) == 2000
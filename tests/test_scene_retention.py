@@ -0,0 +1,96 @@
+# External modules
+import pytest
+
+# Local modules
+import nikocraft as nc
+
+
+class RecordingScene(nc.Scene):
+
+    def __init__(self, window: nc.Window, args: dict = None) -> None:
+        super(RecordingScene, self).__init__(window, args)
+        self.name = type(self).__name__[-1].lower()
+
+    def init(self) -> None:
+        self.window.calls.append(f"{self.name}.init")
+
+    def suspend(self) -> None:
+        self.window.calls.append(f"{self.name}.suspend")
+
+    def resume(self) -> None:
+        self.window.calls.append(f"{self.name}.resume")
+
+    def quit(self) -> None:
+        self.window.calls.append(f"{self.name}.quit")
+
+
+class SceneA(RecordingScene):
+    pass
+
+
+class SceneB(RecordingScene):
+    pass
+
+
+class SceneC(RecordingScene):
+    pass
+
+
+@pytest.fixture
+def retaining_window(app: nc.App) -> nc.Window:
+    window = nc.Window(app, fps=1000, scene_mode=True, start_scene="a", scenes=nc.SceneOptions(retain=1))
+    window.calls = []
+    window.register_scene("a", SceneA)
+    window.register_scene("b", SceneB)
+    window.register_scene("c", SceneC)
+    window._start()
+    yield window
+    window._stop()
+
+
+def switch(window: nc.Window, name: str) -> None:
+    window.change_scene(name, transition_duration=0, transition_pause=0)
+    if window.next_scene_future is not None:
+        window.next_scene_future.result()
+    window._frame()
+    assert window.scene_name == name
+
+
+def test_left_scene_is_suspended_and_resumed(retaining_window: nc.Window) -> None:
+
+    first = retaining_window.scene
+    switch(retaining_window, "b")
+
+    retaining_window.change_scene("a", transition_duration=0, transition_pause=0)
+    assert retaining_window.next_scene_future is None
+    retaining_window._frame()
+
+    assert retaining_window.scene is first
+    assert retaining_window.calls == ["a.init", "a.suspend", "b.init", "b.suspend", "a.resume"]
+    assert list(retaining_window.retained_scenes) == ["b"]
+
+
+def test_least_recently_used_scene_is_evicted(retaining_window: nc.Window) -> None:
+
+    switch(retaining_window, "b")
+    switch(retaining_window, "a")
+    retaining_window.calls.clear()
+
+    switch(retaining_window, "c")
+
+    assert retaining_window.calls == ["a.suspend", "c.init", "b.quit"]
+    assert list(retaining_window.retained_scenes) == ["a"]
+
+
+def test_retained_scenes_are_quit_on_close(app: nc.App) -> None:
+
+    window = nc.Window(app, fps=1000, scene_mode=True, start_scene="a", scenes=nc.SceneOptions(retain=2))
+    window.calls = []
+    window.register_scene("a", SceneA)
+    window.register_scene("b", SceneB)
+    window._start()
+    switch(window, "b")
+    window._stop()
+
+    assert window.calls[-2:] == ["b.quit", "a.quit"]
+    assert not window.retained_scenes
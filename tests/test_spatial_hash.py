@@ -0,0 +1,78 @@
+# Standard modules
+import random
+
+# External modules
+import pytest
+
+# Local modules
+import nikocraft as nc
+
+
+def random_positions(count: int, seed: int = 1) -> dict[int, nc.Vec]:
+    rng = random.Random(seed)
+    return {i: nc.Vec(rng.uniform(-300, 300), rng.uniform(-300, 300)) for i in range(count)}
+
+
+def brute_radius(positions: dict[int, nc.Vec], center: tuple, radius: float) -> set[int]:
+    return {obj for obj, p in positions.items() if (p[0] - center[0]) ** 2 + (p[1] - center[1]) ** 2 <= radius * radius}
+
+
+def brute_aabb(positions: dict[int, nc.Vec], minimum: tuple, maximum: tuple) -> set[int]:
+    return {obj for obj, p in positions.items() if minimum[0] <= p[0] <= maximum[0] and minimum[1] <= p[1] <= maximum[1]}
+
+
+def test_queries_match_brute_force() -> None:
+
+    positions = random_positions(500)
+    grid = nc.SpatialHash(40)
+    for obj, position in positions.items():
+        grid.insert(obj, position)
+
+    rng = random.Random(2)
+    for _ in range(50):
+        center = (rng.uniform(-350, 350), rng.uniform(-350, 350))
+        radius = rng.uniform(0, 150)
+        minimum = (center[0] - radius, center[1] - radius / 2)
+        maximum = (center[0] + radius / 2, center[1] + radius)
+        assert sorted(grid.query_radius(center, radius)) == sorted(brute_radius(positions, center, radius))
+        assert sorted(grid.query_aabb(minimum, maximum)) == sorted(brute_aabb(positions, minimum, maximum))
+
+
+def test_pairs_match_brute_force() -> None:
+
+    positions = random_positions(200)
+    grid = nc.SpatialHash(50)
+    for obj, position in positions.items():
+        grid.insert(obj, position)
+
+    pairs = [tuple(sorted(pair)) for pair in grid.pairs(30)]
+    expected = {(a, b) for a in positions for b in positions
+                if a < b and positions[a].distance_squared(positions[b]) <= 30 * 30}
+
+    assert len(pairs) == len(set(pairs))
+    assert set(pairs) == expected
+    with pytest.raises(ValueError):
+        next(grid.pairs(60))
+
+
+def test_move_and_remove() -> None:
+
+    positions = random_positions(100)
+    grid = nc.SpatialHash(32)
+    for obj, position in positions.items():
+        grid.insert(obj, position)
+
+    rng = random.Random(3)
+    for obj in range(0, 100, 2):
+        positions[obj] = nc.Vec(rng.uniform(-300, 300), rng.uniform(-300, 300))
+        grid.move(obj, positions[obj])
+    for obj in range(0, 100, 3):
+        assert grid.remove(obj)
+        del positions[obj]
+
+    assert not grid.remove(0)
+    assert len(grid) == len(positions)
+    assert 1 in grid and 3 not in grid
+    assert grid.position(1) == positions[1]
+    assert sorted(grid.query_radius((0, 0), 200)) == sorted(brute_radius(positions, (0, 0), 200))
+    assert all(grid.cells.values())
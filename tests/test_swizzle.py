@@ -0,0 +1,50 @@
+# External modules
+import pytest
+
+# Local modules
+import nikocraft as nc
+
+
+VEC_SWIZZLES = {
+    "xx": (0, 0), "xy": (0, 1), "yx": (1, 0), "yy": (1, 1),
+}
+
+VEC3_SWIZZLES = {
+    "xx": (0, 0), "yy": (1, 1), "zz": (2, 2), "xy": (0, 1), "xz": (0, 2), "yx": (1, 0), "yz": (1, 2), "zx": (2, 0), "zy": (2, 1),
+    "xxx": (0, 0, 0), "xyy": (0, 1, 1), "xzz": (0, 2, 2), "xxy": (0, 0, 1), "xxz": (0, 0, 2), "xyx": (0, 1, 0),
+    "xyz": (0, 1, 2), "xzx": (0, 2, 0), "xzy": (0, 2, 1), "yxx": (1, 0, 0), "yyy": (1, 1, 1), "yzz": (1, 2, 2),
+    "yxy": (1, 0, 1), "yxz": (1, 0, 2), "yyx": (1, 1, 0), "yyz": (1, 1, 2), "yzx": (1, 2, 0), "yzy": (1, 2, 1),
+    "zxx": (2, 0, 0), "zyy": (2, 1, 1), "zzz": (2, 2, 2), "zxy": (2, 0, 1), "zxz": (2, 0, 2), "zyx": (2, 1, 0),
+    "zyz": (2, 1, 2), "zzx": (2, 2, 0), "zzy": (2, 2, 1),
+}
+
+
+def swizzle_names(cls: type, components: str) -> set[str]:
+    return {name for name in dir(cls) if 1 < len(name) <= len(components) + 1 and set(name) <= set(components)
+            and isinstance(getattr(cls, name), property)}
+
+
+@pytest.mark.parametrize("cls, components, swizzles, values", [
+    (nc.Vec, "xy", VEC_SWIZZLES, (3, -5)),
+    (nc.Vec3, "xyz", VEC3_SWIZZLES, (3, -5, 7.5)),
+])
+def test_generated_swizzles_match_indices(cls: type, components: str, swizzles: dict, values: tuple) -> None:
+
+    vector = cls(*values)
+
+    assert swizzle_names(cls, components) == set(swizzles)
+    for index, name in enumerate(components):
+        assert getattr(vector, name) == values[index]
+    for name, indices in swizzles.items():
+        result = getattr(vector, name)
+        assert tuple(result) == tuple(values[i] for i in indices), name
+        assert type(result) is (nc.Vec if len(indices) == 2 else nc.Vec3), name
+
+
+def test_identity_swizzles_return_the_vector() -> None:
+
+    vector, vector3 = nc.Vec(1, 2), nc.Vec3(1, 2, 3)
+
+    assert vector.xy is vector
+    assert vector3.xyz is vector3
+    assert vector3.xy == nc.Vec(1, 2) and vector3.xy is not vector3
@@ -0,0 +1,70 @@
+# Standard modules
+import threading
+
+# External modules
+import pytest
+
+# Local modules
+import nikocraft as nc
+
+
+class CountingScene(nc.Scene):
+
+    def init(self) -> None:
+        self.frame = 0
+        self.rendered = threading.Event()
+        self.waited = []
+        self.seen = []
+        self.update_threads = set()
+
+    def update(self) -> None:
+        # Blocks until the render of the same frame ran, which requires both to run concurrently
+        self.waited.append(self.rendered.wait(1))
+        self.rendered.clear()
+        self.update_threads.add(threading.get_ident())
+        self.frame += 1
+
+    def snapshot(self) -> int:
+        return self.frame
+
+    def render(self) -> None:
+        self.seen.append(self.render_state)
+        self.rendered.set()
+
+
+class SceneWindow(nc.Window):
+
+    def render(self) -> None:
+        self.render_scene()
+
+
+@pytest.fixture
+def threaded_window(app: nc.App) -> SceneWindow:
+    window = SceneWindow(app, fps=1000, scene_mode=True, updating=nc.UpdateOptions(threaded=True))
+    window.register_scene("counting", CountingScene)
+    window._start()
+    yield window
+    window._stop()
+
+
+def test_update_runs_concurrently_on_a_worker_thread(threaded_window: SceneWindow) -> None:
+
+    for _ in range(3):
+        threaded_window._frame()
+    scene = threaded_window.scene
+
+    assert scene.waited == [True, True, True]
+    assert threading.get_ident() not in scene.update_threads
+
+
+def test_render_state_is_swapped_after_the_update(threaded_window: SceneWindow) -> None:
+
+    scene = threaded_window.scene
+    assert scene.render_state == 0
+
+    for frame in range(1, 4):
+        threaded_window._frame()
+        assert scene.render_state == frame
+
+    # Every render saw the snapshot of the previous frame, not the one being updated
+    assert scene.seen == [0, 1, 2]
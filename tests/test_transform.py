@@ -0,0 +1,98 @@
+# Standard modules
+import math
+
+# External modules
+import pytest
+
+# Local modules
+import nikocraft as nc
+
+
+VECTORS = [(1, 0, 0), (0, 2, 0), (1, 2, 3), (-4, 0.5, 2)]
+
+
+def flat(vectors) -> list[float]:
+    return [value for vector in vectors for value in vector]
+
+
+def test_vec3_array_operators(backend: str) -> None:
+
+    vectors = nc.Vec3Array(VECTORS)
+
+    assert len(vectors) == len(VECTORS)
+    assert [tuple(v) for v in vectors + (1, 1, 1)] == [(x + 1, y + 1, z + 1) for x, y, z in VECTORS]
+    assert [tuple(v) for v in vectors * 2] == [(2 * x, 2 * y, 2 * z) for x, y, z in VECTORS]
+    assert list(vectors.length) == pytest.approx([math.sqrt(x * x + y * y + z * z) for x, y, z in VECTORS])
+    assert [tuple(v) for v in vectors.swizzle("zx")] == [(z, x) for x, y, z in VECTORS]
+    assert [tuple(v) for v in vectors.xy] == [(x, y) for x, y, z in VECTORS]
+
+
+def test_batch_transform_matches_single(backend: str) -> None:
+
+    matrix = nc.Mat4.translation(nc.Vec3(1, 2, 3)) @ nc.Mat3.rotation(nc.Vec3(1, 1, 0), 0.7).mat4()
+    vectors = nc.Vec3Array(VECTORS)
+
+    assert flat(matrix @ vectors) == pytest.approx(flat(matrix @ nc.Vec3(*v) for v in VECTORS))
+    assert flat(matrix.mat3 @ vectors) == pytest.approx(flat(matrix.mat3 @ nc.Vec3(*v) for v in VECTORS))
+
+
+def test_batch_project_matches_single(backend: str) -> None:
+
+    matrix = nc.Mat4.perspective(math.pi / 3, 4 / 3, 0.1, 100) @ nc.Mat4.look_at(nc.Vec3(0, 0, 10), nc.Vec3(0, 0, 0))
+    vectors = nc.Vec3Array(VECTORS + [(0, 0, 10)])
+
+    assert flat(matrix.project(vectors, nc.Vec(640, 480))) == pytest.approx(
+        flat(matrix.project(vector, nc.Vec(640, 480)) for vector in vectors))
+    assert tuple(matrix.project(nc.Vec3(0, 0, 0), nc.Vec(640, 480))) == pytest.approx((320, 240))
+
+
+def test_mat3_inverse_and_transpose() -> None:
+
+    matrix = nc.Mat3.rotation_x(0.3) @ nc.Mat3.scale((2, 3, 4))
+
+    assert list(matrix @ matrix.inverse()) == pytest.approx(list(nc.Mat3.identity()))
+    assert matrix.determinant == pytest.approx(24)
+    assert list(nc.Mat3.rotation_z(0.5).transpose()) == pytest.approx(list(nc.Mat3.rotation_z(-0.5)))
+    with pytest.raises(ValueError):
+        nc.Mat3.scale(0).inverse()
+    with pytest.raises(ValueError):
+        nc.Mat3((1, 2, 3))
+
+
+def test_quat_matches_matrix_rotation() -> None:
+
+    axis = nc.Vec3(0, 1, 0)
+    quat = nc.Quat.from_axis_angle(axis, math.pi / 2)
+
+    assert tuple(quat.rotate(nc.Vec3(1, 0, 0))) == pytest.approx((0, 0, -1))
+    assert list(quat.mat3()) == pytest.approx(list(nc.Mat3.rotation(axis, math.pi / 2)))
+    assert tuple(quat * quat.conjugate()) == pytest.approx((1, 0, 0, 0))
+    assert list((quat * quat).mat3()) == pytest.approx(list(nc.Mat3.rotation_y(math.pi)))
+    assert list(nc.Quat.from_euler(0, 0.4, 0).mat3()) == pytest.approx(list(nc.Mat3.rotation_y(0.4)))
+
+
+def test_quat_slerp() -> None:
+
+    start = nc.Quat.identity()
+    end = nc.Quat.from_axis_angle(nc.Vec3(0, 0, 1), math.pi / 2)
+
+    assert tuple(start.slerp(end, 0)) == pytest.approx(tuple(start))
+    assert tuple(start.slerp(end, 1)) == pytest.approx(tuple(end))
+    assert tuple(start.slerp(end, 0.5)) == pytest.approx(tuple(nc.Quat.from_axis_angle(nc.Vec3(0, 0, 1), math.pi / 4)))
+    assert start.slerp(end, 0.3).length == pytest.approx(1)
+
+
+def test_quat_rotates_arrays(backend: str) -> None:
+
+    quat = nc.Quat.from_euler(0.2, 0.5, -0.3)
+
+    assert flat(quat.rotate(nc.Vec3Array(VECTORS))) == pytest.approx(flat(quat.rotate(nc.Vec3(*v)) for v in VECTORS))
+
+
+def test_vec3_array_accepts_generators(backend: str) -> None:
+
+    vectors = nc.Vec3Array.from_xyz((v[0] for v in VECTORS), (v[1] for v in VECTORS), (v[2] for v in VECTORS))
+
+    assert flat(vectors) == flat(VECTORS)
+    assert flat(vectors.scale(i for i in range(len(VECTORS)))) == flat(
+        (x * i, y * i, z * i) for i, (x, y, z) in enumerate(VECTORS))
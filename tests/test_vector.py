@@ -0,0 +1,56 @@
+# Standard modules
+import math
+import random
+
+# External modules
+import pytest
+
+# Local modules
+import nikocraft as nc
+
+
+def random_vectors(cls: type, count: int = 50, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    dimension = 2 if cls is nc.Vec else 3
+    return [cls(*(rng.uniform(-10, 10) for _ in range(dimension))) for _ in range(count)]
+
+
+def approx(vector) -> list:
+    return pytest.approx(list(vector))
+
+
+@pytest.mark.parametrize("cls", [nc.Vec, nc.Vec3])
+def test_distance_squared_is_squared_distance(cls: type) -> None:
+
+    vectors = random_vectors(cls)
+    for a, b in zip(vectors, vectors[1:]):
+        assert a.distance_squared(b) == pytest.approx(a.distance(b) ** 2)
+        assert a.distance_squared(b) == pytest.approx((a - b).length_squared)
+    assert cls(*([3, 4] + [0] * (len(vectors[0]) - 2))).distance_squared(cls(*[0] * len(vectors[0]))) == 25
+
+
+@pytest.mark.parametrize("cls", [nc.Vec, nc.Vec3])
+def test_fused_helpers_match_unfused(cls: type) -> None:
+
+    vectors = random_vectors(cls)
+    for a, b in zip(vectors, vectors[1:]):
+        n = b.normalize()
+        assert a.length == pytest.approx(math.sqrt(sum(value * value for value in a)))
+        assert list(n) == approx(b / b.length)
+        assert a.dot(b) == pytest.approx(sum(p * q for p, q in zip(a, b)))
+        assert list(a.lerp(b, 0.3)) == approx(a + (b - a) * 0.3)
+        assert list(a.clamp_length(2)) == approx(a if a.length <= 2 else a / a.length * 2)
+        assert list(a.move_towards(b, 1.5)) == approx(b if a.distance(b) <= 1.5 else a + (b - a) / a.distance(b) * 1.5)
+        assert list(a.reflect(n)) == approx(a - n * (2 * a.dot(n)))
+    assert list(cls(*[0] * len(vectors[0])).normalize()) == [0] * len(vectors[0])
+
+
+def test_cross_products() -> None:
+
+    for a, b in zip(random_vectors(nc.Vec), random_vectors(nc.Vec, seed=8)):
+        assert a.cross(b) == pytest.approx(a[0] * b[1] - a[1] * b[0])
+        assert a.cross(b) == pytest.approx(nc.Vec3(a[0], a[1], 0).cross(nc.Vec3(b[0], b[1], 0))[2])
+    for a, b in zip(random_vectors(nc.Vec3), random_vectors(nc.Vec3, seed=8)):
+        c = a.cross(b)
+        assert c.dot(a) == pytest.approx(0, abs=1e-9) and c.dot(b) == pytest.approx(0, abs=1e-9)
+        assert c.length == pytest.approx(a.length * b.length * math.sin(math.acos(a.dot(b) / (a.length * b.length))))
@@ -0,0 +1,89 @@
+# Standard modules
+import math
+
+# External modules
+import pytest
+
+# Local modules
+import nikocraft as nc
+
+
+VECTORS = [(1, 2), (-3, 4), (0, 0), (2.5, -1.5)]
+
+
+def as_tuples(vectors: nc.VecArray) -> list[tuple[float, float]]:
+    return [tuple(vector) for vector in vectors]
+
+
+def test_operators_match_vec(backend: str) -> None:
+
+    vectors = nc.VecArray(VECTORS)
+    other = nc.VecArray([(2, 1)] * len(VECTORS))
+
+    assert len(vectors) == len(VECTORS)
+    assert as_tuples(vectors + other) == [tuple(nc.Vec(*v) + nc.Vec(2, 1)) for v in VECTORS]
+    assert as_tuples(vectors - (1, 1)) == [tuple(nc.Vec(*v) - nc.Vec(1, 1)) for v in VECTORS]
+    assert as_tuples(vectors * 2) == [tuple(nc.Vec(*v) * 2) for v in VECTORS]
+    assert as_tuples(vectors / 2) == [tuple(nc.Vec(*v) / 2) for v in VECTORS]
+    assert as_tuples(-vectors) == [(-x, -y) for x, y in VECTORS]
+    assert as_tuples(abs(vectors)) == [(abs(x), abs(y)) for x, y in VECTORS]
+    assert as_tuples(vectors.swizzle("yx")) == [(y, x) for x, y in VECTORS]
+
+
+def test_lengths_and_normalize(backend: str) -> None:
+
+    vectors = nc.VecArray(VECTORS)
+
+    assert list(vectors.length) == pytest.approx([math.hypot(x, y) for x, y in VECTORS])
+    assert list(vectors.length_squared) == pytest.approx([x * x + y * y for x, y in VECTORS])
+    assert list(vectors.distance((1, 2))) == pytest.approx([math.hypot(x - 1, y - 2) for x, y in VECTORS])
+    normalized = vectors.normalize()
+    assert list(normalized.length) == pytest.approx([1, 1, 0, 1])
+    assert tuple(normalized[2]) == (0, 0)
+
+
+def test_inplace_operators_keep_buffer(backend: str) -> None:
+
+    vectors = nc.VecArray(VECTORS)
+    data = vectors.data
+
+    vectors += (1, 1)
+    vectors *= 2
+
+    assert vectors.data is data
+    assert as_tuples(vectors) == [((x + 1) * 2, (y + 1) * 2) for x, y in VECTORS]
+
+
+def test_indexing_and_constructors(backend: str) -> None:
+
+    vectors = nc.VecArray.from_xy([1, 2, 3], [4, 5, 6])
+    vectors[1] = (7, 8)
+
+    assert vectors[-1] == nc.Vec(3, 6)
+    assert as_tuples(vectors[0:2]) == [(1, 4), (7, 8)]
+    assert list(vectors.x) == [1, 7, 3]
+    assert as_tuples(nc.VecArray.zeros(2)) == [(0, 0), (0, 0)]
+    assert as_tuples(nc.VecArray.full(2, (1, 2))) == [(1, 2), (1, 2)]
+    assert as_tuples(vectors.scale([1, 0, 2])) == [(1, 4), (0, 0), (6, 12)]
+    with pytest.raises(IndexError):
+        vectors[3]
+
+
+def test_different_sizes_raise(backend: str) -> None:
+
+    with pytest.raises(ValueError):
+        nc.VecArray(VECTORS) + nc.VecArray([(1, 1)])
+
+
+def test_repr_names_backend(backend: str) -> None:
+
+    assert f"backend={backend}" in repr(nc.VecArray(VECTORS))
+
+
+def test_generators_are_accepted(backend: str) -> None:
+
+    vectors = nc.VecArray.from_xy((x for x, _ in VECTORS), (y for _, y in VECTORS))
+
+    assert as_tuples(vectors) == [(float(x), float(y)) for x, y in VECTORS]
+    assert as_tuples(vectors.scale(i for i in range(len(VECTORS)))) == [(x * i, y * i) for i, (x, y) in enumerate(VECTORS)]
+    assert as_tuples(nc.VecArray(tuple(v) for v in VECTORS)) == as_tuples(vectors)
@@ -0,0 +1,54 @@
+# External modules
+import pygame as pg
+import pytest
+
+# Local modules
+import nikocraft as nc
+
+
+def test_default_options(window: nc.Window) -> None:
+
+    assert window.clock.history == 90
+    assert not window.dirty_rects_mode
+    assert window.fixed_timestep == 0
+    assert window.max_retained_scenes == 0
+    assert window.font.max_fonts == 32
+    assert window.gc_manager is None
+
+
+def test_options_are_applied(app: nc.App, tmp_path) -> None:
+
+    controller = nc.FrameController()
+    profiler = nc.Profiler()
+    gc_manager = nc.GCManager()
+    window = nc.Window(app, fps=1000,
+                       pacing=nc.PacingOptions(history=30, precise=True, spin_budget=0.001),
+                       rendering=nc.RenderOptions(dirty_rects=True, dirty_threshold=0.25, frame_controller=controller),
+                       updating=nc.UpdateOptions(fixed_timestep=0.01, max_fixed_steps=3, threaded=True, coalesce_events=True),
+                       scenes=nc.SceneOptions(retain=2),
+                       fonts=nc.FontOptions(max_fonts=4, sysfont_cache_path=str(tmp_path / "fonts.json")),
+                       runtime=nc.RuntimeOptions(profiler=profiler, gc_manager=gc_manager))
+    try:
+        assert window.clock.history == 30
+        assert window.clock.precise
+        assert window.clock.spin_budget == 0.001
+        assert window.dirty_rects_mode
+        assert window.dirty_threshold == 0.25
+        assert window.frame_controller is controller
+        assert window.fixed_timestep == 0.01
+        assert window.max_fixed_steps == 3
+        assert window.threaded_update
+        assert window.coalesce_events
+        assert window.max_retained_scenes == 2
+        assert window.font.max_fonts == 4
+        assert window.font.sysfont_cache_path.endswith("fonts.json")
+        assert window.profiler is profiler
+        assert window.gc_manager is gc_manager
+    finally:
+        pg.quit()
+
+
+def test_options_are_frozen() -> None:
+
+    with pytest.raises(AttributeError):
+        nc.RenderOptions().dirty_rects = True